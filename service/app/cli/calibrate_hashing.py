@@ -0,0 +1,173 @@
+"""
+Calibrate Argon2 cost parameters for this host.
+
+Usage (from the service directory):
+    python -m app.cli.calibrate_hashing --target-ms 250
+    python -m app.cli.calibrate_hashing --target-ms 100 --dry-run
+
+Memory cost is tried from --max-memory-kib downwards, halving each step.
+For each memory cost the time cost is raised until a verification takes
+longer than the target; the first memory cost that meets the target with
+at least one iteration wins. The chosen parameters are written to the
+env file read by Settings. Existing hashes are upgraded on the next
+successful sign-in.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Dict, Optional
+
+from app.services.password_service import PasswordService
+
+CALIBRATION_PASSWORD = "calibration-password"
+
+
+def measure_verify_seconds(
+    time_cost: int,
+    memory_cost: int,
+    parallelism: int,
+    rounds: int = 3
+) -> float:
+    """
+    Measure the median verification time for a set of parameters.
+    
+    Args:
+        time_cost: Argon2 iterations.
+        memory_cost: Argon2 memory in KiB.
+        parallelism: Argon2 lanes.
+        rounds: Verifications to time.
+        
+    Returns:
+        Median verification time in seconds.
+    """
+    service = PasswordService(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    password_hash = service.hash_password(CALIBRATION_PASSWORD)
+    durations = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        service.verify_password(CALIBRATION_PASSWORD, password_hash)
+        durations.append(time.perf_counter() - started)
+    return statistics.median(durations)
+
+
+def calibrate(
+    target_seconds: float,
+    parallelism: int,
+    max_memory_kib: int = 262144,
+    min_memory_kib: int = 8192,
+    max_time_cost: int = 10,
+    rounds: int = 3
+) -> Dict[str, object]:
+    """
+    Find the strongest parameters whose verification meets the target.
+    
+    Args:
+        target_seconds: Maximum acceptable verification time.
+        parallelism: Argon2 lanes.
+        max_memory_kib: First memory cost tried.
+        min_memory_kib: Lowest memory cost tried.
+        max_time_cost: Highest time cost tried.
+        rounds: Verifications timed per candidate.
+        
+    Returns:
+        Dictionary with time_cost, memory_cost, parallelism, the measured
+        verify_ms and whether the target was met. If nothing meets the
+        target, the cheapest candidate is returned with met_target False.
+    """
+    memory_cost = max_memory_kib
+    while True:
+        best: Optional[Dict[str, object]] = None
+        for time_cost in range(1, max_time_cost + 1):
+            seconds = measure_verify_seconds(time_cost, memory_cost, parallelism, rounds)
+            if seconds > target_seconds:
+                if best is None and memory_cost // 2 < min_memory_kib:
+                    best = {
+                        "time_cost": time_cost,
+                        "memory_cost": memory_cost,
+                        "parallelism": parallelism,
+                        "verify_ms": round(seconds * 1000, 1),
+                        "met_target": False
+                    }
+                break
+            best = {
+                "time_cost": time_cost,
+                "memory_cost": memory_cost,
+                "parallelism": parallelism,
+                "verify_ms": round(seconds * 1000, 1),
+                "met_target": True
+            }
+        if best is not None:
+            return best
+        memory_cost //= 2
+
+
+def write_env_file(path: str, values: Dict[str, object]) -> None:
+    """
+    Set variables in an env file, replacing existing assignments.
+    
+    Variables not yet present are appended. Other lines, including
+    comments, are kept as they are.
+    
+    Args:
+        path: Env file path (created if missing).
+        values: Variable names mapped to values.
+    """
+    lines = []
+    if os.path.exists(path):
+        with open(path, encoding="utf-8-sig") as env_file:
+            lines = env_file.read().splitlines()
+    
+    remaining = dict(values)
+    for index, line in enumerate(lines):
+        name = line.split("=", 1)[0].strip()
+        if "=" in line and not line.lstrip().startswith("#") and name in remaining:
+            lines[index] = f"{name}={remaining.pop(name)}"
+    lines.extend(f"{name}={value}" for name, value in remaining.items())
+    
+    with open(path, "w", encoding="utf-8") as env_file:
+        env_file.write("\n".join(lines) + "\n")
+
+
+def main(arguments: argparse.Namespace) -> int:
+    """
+    Run the calibration and write the result.
+    
+    Args:
+        arguments: Parsed command line arguments.
+        
+    Returns:
+        Process exit code: 0 if the target was met, 1 otherwise.
+    """
+    result = calibrate(
+        target_seconds=arguments.target_ms / 1000,
+        parallelism=arguments.parallelism,
+        max_memory_kib=arguments.max_memory_kib,
+        min_memory_kib=arguments.min_memory_kib,
+        max_time_cost=arguments.max_time_cost,
+        rounds=arguments.rounds
+    )
+    print(json.dumps(result))
+    
+    if not arguments.dry_run:
+        write_env_file(arguments.env_file, {
+            "ARGON2_TIME_COST": result["time_cost"],
+            "ARGON2_MEMORY_COST": result["memory_cost"],
+            "ARGON2_PARALLELISM": result["parallelism"]
+        })
+    return 0 if result["met_target"] else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calibrate Argon2 cost parameters for this host.")
+    parser.add_argument("--target-ms", type=float, default=250.0, help="Target verification latency")
+    parser.add_argument("--parallelism", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-memory-kib", type=int, default=262144)
+    parser.add_argument("--min-memory-kib", type=int, default=8192)
+    parser.add_argument("--max-time-cost", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=3, help="Verifications timed per candidate")
+    parser.add_argument("--env-file", default=".env", help="Env file updated with the result")
+    parser.add_argument("--dry-run", action="store_true", help="Print the result without writing it")
+    sys.exit(main(parser.parse_args()))
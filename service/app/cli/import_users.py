@@ -0,0 +1,68 @@
+"""
+Command line bulk user import.
+
+Usage (from the service directory):
+    python -m app.cli.import_users users.ndjson
+    python -m app.cli.import_users - < users.ndjson
+
+Each input line is {"user_id": ..., "password": ...} or
+{"user_id": ..., "password_hash": "$argon2..."}. Rejected lines are
+printed as NDJSON, followed by a summary line.
+"""
+import argparse
+import asyncio
+import json
+import sys
+from typing import AsyncIterator, BinaryIO
+
+from app.config import settings
+from app.database import AsyncSessionLocal, async_engine
+from app.services.hashing_executor import hashing_executor
+from app.services.user_import_service import UserImportService
+
+
+async def read_lines(stream: BinaryIO) -> AsyncIterator[bytes]:
+    """
+    Yield lines from a binary stream, left undecoded for the import.
+    
+    Args:
+        stream: Open binary file.
+        
+    Yields:
+        Lines without trailing newline.
+    """
+    for line in stream:
+        yield line.rstrip(b"\r\n")
+
+
+async def main(path: str, batch_size: int) -> int:
+    """
+    Import users from an NDJSON file.
+    
+    Args:
+        path: Input file path, or "-" for standard input.
+        batch_size: Users hashed and inserted per batch.
+        
+    Returns:
+        Process exit code: 0 if every line was imported, 1 otherwise.
+    """
+    stream = sys.stdin.buffer if path == "-" else open(path, "rb")
+    try:
+        async with AsyncSessionLocal() as db:
+            service = UserImportService(db, batch_size=batch_size)
+            async for result in service.import_users(read_lines(stream)):
+                print(json.dumps(result), flush=True)
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+        hashing_executor.shutdown()
+        await async_engine.dispose()
+    return 0 if result["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk import users from NDJSON.")
+    parser.add_argument("path", help='NDJSON file, or "-" for standard input')
+    parser.add_argument("--batch-size", type=int, default=settings.user_import_batch_size)
+    arguments = parser.parse_args()
+    sys.exit(asyncio.run(main(arguments.path, arguments.batch_size)))
@@ -1,8 +1,9 @@
 """
 Application configuration settings.
 """
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
-from typing import ClassVar
+from typing import ClassVar, List, Literal
 
 
 class Settings(BaseSettings):
@@ -12,13 +13,149 @@ class Settings(BaseSettings):
     Attributes:
         database_url: Database connection URL.
         debug: Enable debug mode.
+        response_serializer: JSON serializer for responses, "orjson" (if installed) or "json".
         session_max_age_seconds: Maximum session age in seconds (1 hour).
+        session_sliding_enabled: Extend a session's max_time while it is in use.
+        session_absolute_max_age_seconds: Lifetime limit of a sliding session from its start.
+        session_renewal_interval_seconds: Minimum extension written for a sliding session.
+        session_renewal_flush_seconds: Delay between batched writes of queued renewals.
         secret_key: Secret key for session token generation.
+        hashing_workers: Password hashing worker processes (0 = CPU count).
+        hashing_max_pending: Maximum queued and running hashing jobs.
+        hashing_retry_after_seconds: Retry-After value when hashing is saturated.
+        argon2_time_cost: Argon2 iterations per hash.
+        argon2_memory_cost: Argon2 memory per hash in KiB.
+        argon2_parallelism: Argon2 lanes per hash.
+        signin_throttle_enabled: Check sign-in attempts against the limits below.
+        signin_ip_rate_per_second: Sustained sign-in attempts per client IP (0 disables).
+        signin_ip_burst: Sign-in attempts a client IP may make at once.
+        signin_user_rate_per_second: Sustained sign-in attempts per user_id (0 disables).
+        signin_user_burst: Sign-in attempts a user_id may receive at once.
+        signin_max_failures_per_ip: Failed sign-ins per client IP within the window (0 disables).
+        signin_max_failures_per_user: Failed sign-ins per user_id within the window (0 disables);
+            anyone can lock an account for the window with this many bad passwords.
+        signin_failure_window_seconds: Sliding window for failed sign-in counts.
+        signin_throttle_max_keys: Identities tracked per limiter before eviction.
+        trusted_proxies: Comma-separated proxy addresses or networks whose X-Forwarded-For is used
+            as the sign-in client address (empty uses the connecting address).
+        session_cache_max_entries: Sessions kept in the token cache (0 disables it).
+        session_cache_backend: Token cache: "process" (per worker) or "shared" (per host, in shared memory).
+        session_cache_path: Backing file of the shared token cache (keep it on tmpfs).
+        session_cache_stripes: Writer lock stripes of the shared token cache.
+        session_sweep_interval_seconds: Delay between expired session sweeps (0 disables them;
+            with partitioned storage it must be above 0 and below session_partition_seconds).
+        session_sweep_batch_size: Maximum expired sessions deleted per transaction.
+        session_mode: "database" for stored opaque tokens, "stateless" for signed tokens.
+        session_storage: Session store: "table", "partitioned" (per-period tables), "memory" or "redis".
+        session_partition_seconds: Expiry period covered by each partitioned session table.
+        session_store_stripes: Lock stripes of the in-memory session store.
+        redis_url: Redis server URL for the "redis" session store.
+        redis_pool_size: Connections the Redis session store may open.
+        introspect_max_tokens: Tokens accepted per POST /auth/introspect request.
+        introspect_chunk_size: Tokens resolved per store query by the introspection endpoint.
+        user_import_enabled: Expose the bulk user import endpoint.
+        user_import_batch_size: Users hashed and inserted per import batch.
+        user_id_filter_enabled: Build a Bloom filter of user_ids at startup for signup pre-checks.
+        user_id_filter_capacity: Minimum user_ids the filter is sized for.
+        user_id_filter_error_rate: Target false-positive rate of the filter.
+        sqlite_journal_mode: SQLite journal mode applied on connect.
+        sqlite_synchronous: SQLite synchronous level applied on connect.
+        sqlite_busy_timeout_ms: How long SQLite waits on a locked database.
+        sqlite_mmap_size: Bytes of the SQLite file memory-mapped per connection.
+        sqlite_cache_size: SQLite page cache size (negative values are KiB).
+        db_pool_size: Connections kept open per engine (non-SQLite backends).
+        db_max_overflow: Extra connections allowed above db_pool_size.
+        db_pool_recycle: Seconds after which pooled connections are replaced.
+        db_pool_pre_ping: Test pooled connections before handing them out.
+        db_replica_urls: Comma-separated read replica URLs (empty sends reads to the primary).
+        db_replica_health_check_interval_seconds: Delay between read replica health checks.
+        db_replica_health_check_timeout_seconds: Time a replica has to answer a health check.
+        startup_warm_up: Open pooled connections and start hashing workers at startup.
     """
     database_url: str = "sqlite:///./banking_service.db"
     debug: bool = False
+    response_serializer: Literal["orjson", "json"] = "orjson"
     session_max_age_seconds: int = 3600  # 1 hour
+    session_sliding_enabled: bool = False
+    session_absolute_max_age_seconds: int = 86400  # 24 hours
+    session_renewal_interval_seconds: int = 300
+    session_renewal_flush_seconds: float = 5.0
     secret_key: str = "your-secret-key-change-in-production"
+    hashing_workers: int = 0
+    hashing_max_pending: int = 64
+    hashing_retry_after_seconds: int = 1
+    argon2_time_cost: int = 3
+    argon2_memory_cost: int = 65536  # 64 MiB
+    argon2_parallelism: int = 4
+    signin_throttle_enabled: bool = True
+    signin_ip_rate_per_second: float = 10.0
+    signin_ip_burst: int = 50
+    signin_user_rate_per_second: float = 0.2
+    signin_user_burst: int = 5
+    signin_max_failures_per_ip: int = 100
+    signin_max_failures_per_user: int = 5
+    signin_failure_window_seconds: int = 300
+    signin_throttle_max_keys: int = 100000
+    trusted_proxies: str = ""
+    session_cache_max_entries: int = 10000
+    session_cache_backend: Literal["process", "shared"] = "process"
+    session_cache_path: str = "/dev/shm/banking_service_session_cache"
+    session_cache_stripes: int = 64
+    session_sweep_interval_seconds: int = 300
+    session_sweep_batch_size: int = 500
+    session_mode: Literal["database", "stateless"] = "database"
+    session_storage: Literal["table", "partitioned", "memory", "redis"] = "table"
+    session_partition_seconds: int = 3600
+    session_store_stripes: int = 16
+    redis_url: str = "redis://localhost:6379/0"
+    redis_pool_size: int = 10
+    introspect_max_tokens: int = 10000
+    introspect_chunk_size: int = 500
+    user_import_enabled: bool = False
+    user_import_batch_size: int = 1000
+    user_id_filter_enabled: bool = True
+    user_id_filter_capacity: int = 100000
+    user_id_filter_error_rate: float = 0.01
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 268435456  # 256 MiB
+    sqlite_cache_size: int = -65536  # 64 MiB
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_replica_urls: str = ""
+    db_replica_health_check_interval_seconds: int = 10
+    db_replica_health_check_timeout_seconds: float = 2.0
+    startup_warm_up: bool = True
+    
+    @model_validator(mode="after")
+    def check_partition_sweeps(self) -> "Settings":
+        """
+        Require sweeps often enough to create partition tables ahead of use.
+        
+        Raises:
+            ValueError: If partitioned storage is used with sweeps disabled
+                or less frequent than one per partition period.
+        """
+        if (
+            self.session_storage == "partitioned"
+            and self.session_mode == "database"
+            and not 0 < self.session_sweep_interval_seconds < self.session_partition_seconds
+        ):
+            raise ValueError(
+                "Partitioned session storage requires "
+                "0 < session_sweep_interval_seconds < session_partition_seconds"
+            )
+        return self
+    
+    @property
+    def replica_urls(self) -> List[str]:
+        """
+        Read replica URLs parsed from db_replica_urls.
+        """
+        return [url.strip() for url in self.db_replica_urls.split(",") if url.strip()]
     
     class Config:
         env_file = ".env"
@@ -1,21 +1,161 @@
 """
 Database configuration and session management.
 """
-from sqlalchemy import create_engine
+import asyncio
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from app.config import settings
+from app.metrics import instrument_engine
+from app.replicas import ReplicaRouter, RoutingSession
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """
+    Convert a database URL to the equivalent asyncio driver URL.
+    
+    Args:
+        database_url: Database connection URL, e.g. sqlite:///./app.db.
+        
+    Returns:
+        URL using the asyncio driver, e.g. sqlite+aiosqlite:///./app.db.
+        URLs that already name a driver are returned unchanged.
+    """
+    scheme, separator, rest = database_url.partition("://")
+    return ASYNC_DRIVERS.get(scheme, scheme) + separator + rest
+
+
+def get_engine_options(database_url: str) -> dict:
+    """
+    Build engine keyword arguments for the backend of a database URL.
+    
+    SQLite is tuned through connection pragmas (see set_sqlite_pragmas);
+    server backends get a sized, recycled and pre-pinged connection pool.
+    
+    Args:
+        database_url: Database connection URL.
+        
+    Returns:
+        Keyword arguments for create_engine / create_async_engine.
+    """
+    if "sqlite" in database_url:
+        return {"connect_args": {"check_same_thread": False}}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Apply the configured SQLite pragmas to a new connection.
+    
+    Args:
+        dbapi_connection: Raw DBAPI connection.
+        connection_record: Pool connection record (unused).
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+    cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+    cursor.execute(f"PRAGMA cache_size={int(settings.sqlite_cache_size)}")
+    cursor.close()
+
+
+def create_database_engine(database_url: str, **options) -> Engine:
+    """
+    Create a sync engine using the configured engine profile.
+    
+    Args:
+        database_url: Database connection URL.
+        **options: Extra create_engine arguments, overriding the profile.
+        
+    Returns:
+        Engine instance.
+    """
+    database_engine = create_engine(
+        database_url,
+        **{**get_engine_options(database_url), "echo": settings.debug, **options}
+    )
+    if database_engine.dialect.name == "sqlite":
+        event.listen(database_engine, "connect", set_sqlite_pragmas)
+    instrument_engine(database_engine)
+    return database_engine
+
+
+def create_async_database_engine(database_url: str, **options) -> AsyncEngine:
+    """
+    Create an asyncio engine using the configured engine profile.
+    
+    Args:
+        database_url: Database connection URL, converted to its asyncio driver.
+        **options: Extra create_async_engine arguments, overriding the profile.
+        
+    Returns:
+        Async engine instance.
+    """
+    database_engine = create_async_engine(
+        get_async_database_url(database_url),
+        **{**get_engine_options(database_url), "echo": settings.debug, **options}
+    )
+    if database_engine.dialect.name == "sqlite":
+        event.listen(database_engine.sync_engine, "connect", set_sqlite_pragmas)
+    instrument_engine(database_engine.sync_engine)
+    return database_engine
 
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
-    echo=settings.debug
-)
+
+async def warm_up_async_engine(database_engine: AsyncEngine, connections: int) -> None:
+    """
+    Open pooled connections ahead of the first requests.
+    
+    The connections are opened concurrently, each runs a trivial query
+    (which also applies the SQLite pragmas), and all return to the pool.
+    
+    Args:
+        database_engine: Async engine to warm.
+        connections: Number of connections to open.
+    """
+    async def open_connection() -> None:
+        async with database_engine.connect() as connection:
+            await connection.exec_driver_sql("SELECT 1")
+    
+    await asyncio.gather(*(open_connection() for _ in range(connections)))
+
+
+engine = create_database_engine(settings.database_url)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_database_engine(settings.database_url)
+
+replica_router = ReplicaRouter(
+    [create_async_database_engine(url) for url in settings.replica_urls],
+    interval_seconds=settings.db_replica_health_check_interval_seconds,
+    timeout_seconds=settings.db_replica_health_check_timeout_seconds
+)
+
+# Reads go to a healthy replica when replicas are configured (see RoutingSession)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+    sync_session_class=RoutingSession,
+    router=replica_router
+)
+
 Base = declarative_base()
 
 
@@ -32,3 +172,25 @@ def get_db() -> Generator:
     finally:
         db.close()
 
+
+async def get_async_db() -> AsyncGenerator:
+    """
+    Dependency function to get an asyncio database session.
+    
+    Yields:
+        Async database session instance.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """
+    Dependency function to get the asyncio session factory, for routes
+    that open their own sessions (e.g. while streaming a response, after
+    get_async_db's session has been closed).
+    
+    Returns:
+        Async session factory.
+    """
+    return AsyncSessionLocal
@@ -1,21 +1,231 @@
 """
 Main FastAPI application.
+
+Importing this module has no database side effects. Apply the schema with
+``alembic upgrade head`` before starting the server.
 """
-from fastapi import FastAPI
-from app.database import engine, Base
-from app.routers import auth
+# Imported first so the startup clock covers every other import
+from app.startup import startup_timer
+import math
+from contextlib import asynccontextmanager
+from datetime import datetime
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse, PlainTextResponse
+from app.config import settings
+from app.database import AsyncSessionLocal, async_engine, replica_router, warm_up_async_engine
+from app.metrics import registry, CallbackMetric, compiled_cache_entries
+from app.repositories.async_partitioned_session_repository import AsyncPartitionedSessionRepository
+from app.middleware import MetricsMiddleware
+from app.responses import ResponseClass
+from app.repositories.session_stores import redis_session_store
+from app.routers import auth, users
+from app.services.hashing_executor import hashing_executor, HashingQueueFullError
+from app.services.session_cache import session_cache
+from app.services.session_renewer import session_renewer
+from app.services.session_sweeper import session_sweeper
+from app.services.signin_throttle import signin_throttle, RateLimitExceededError
+from app.services.stateless_session_service import stateless_session_service
+from app.services.user_id_filter import user_id_filter
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: warm the worker up, run the expired session
+    sweeper, sliding session renewals and replica health checks, and on
+    shutdown write queued renewals and release the hashing worker
+    processes.
+    
+    The warm-up opens pooled connections and starts the hashing workers,
+    so the first requests pay none of that. With
+    partitioned session storage, the live session tables are created before
+    serving, whatever the sweep interval.
+    
+    Args:
+        app: FastAPI application instance.
+    """
+    if settings.session_storage == "partitioned" and settings.session_mode == "database":
+        async with AsyncSessionLocal() as db:
+            await AsyncPartitionedSessionRepository(db).ensure_partitions(datetime.utcnow())
+    if replica_router.replicas:
+        await replica_router.check_health()
+        replica_router.start()
+    if settings.startup_warm_up:
+        await warm_up_async_engine(async_engine, settings.db_pool_size)
+        for replica in replica_router.healthy:
+            await warm_up_async_engine(replica, settings.db_pool_size)
+        await hashing_executor.warm_up()
+    if settings.user_id_filter_enabled:
+        await user_id_filter.load(AsyncSessionLocal)
+    if settings.session_sweep_interval_seconds > 0:
+        session_sweeper.start()
+    if settings.session_sliding_enabled and settings.session_mode == "database":
+        session_renewer.start()
+    startup_timer.mark_ready()
+    yield
+    await session_renewer.stop()
+    await session_sweeper.stop()
+    await replica_router.stop()
+    await redis_session_store.close()
+    hashing_executor.shutdown()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
     title="Banking Service API",
     description="REST service for bank user management",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ResponseClass
 )
 
 # Include routers
 app.include_router(auth.router)
+app.include_router(users.router)
+
+app.add_middleware(MetricsMiddleware, router=app.router)
+
+registry.register(CallbackMetric(
+    "hashing_queue_depth",
+    "Password hashing jobs queued or running.",
+    lambda: hashing_executor.pending
+))
+registry.register(CallbackMetric(
+    "session_cache_events_total",
+    "Session token cache lookups and removals by outcome.",
+    lambda: {
+        (event,): value
+        for event, value in session_cache.stats().items()
+        if event != "size"
+    },
+    metric_type="counter",
+    label_names=("event",)
+))
+registry.register(CallbackMetric(
+    "session_cache_size",
+    "Sessions held in the token cache.",
+    lambda: session_cache.stats()["size"]
+))
+registry.register(CallbackMetric(
+    "sessions_purged_total",
+    "Expired sessions deleted by the sweeper.",
+    lambda: session_sweeper.total_purged,
+    metric_type="counter"
+))
+registry.register(CallbackMetric(
+    "session_renewals_total",
+    "Sliding session renewals queued, and session expiries written by batched flushes.",
+    lambda: {("queued",): session_renewer.queued, ("written",): session_renewer.written},
+    metric_type="counter",
+    label_names=("event",)
+))
+registry.register(CallbackMetric(
+    "session_renewals_pending",
+    "Sessions with a renewal waiting for the next flush.",
+    lambda: session_renewer.pending
+))
+registry.register(CallbackMetric(
+    "stateless_tokens_revoked",
+    "Signed session tokens in the revocation set.",
+    lambda: stateless_session_service.revoked_count
+))
+
+registry.register(CallbackMetric(
+    "worker_startup_seconds",
+    "Time this worker spent importing, in lifespan startup, and until its first request.",
+    lambda: {(phase,): seconds for phase, seconds in startup_timer.phases().items()},
+    label_names=("phase",)
+))
+registry.register(CallbackMetric(
+    "db_compiled_cache_entries",
+    "Compiled SQL statements held in the primary engine's cache.",
+    lambda: compiled_cache_entries(async_engine.sync_engine)
+))
+registry.register(CallbackMetric(
+    "db_replicas_healthy",
+    "Read replicas that passed their last health check.",
+    lambda: replica_router.stats()["healthy"]
+))
+registry.register(CallbackMetric(
+    "db_read_sessions_total",
+    "Sessions that read from a replica or fell back to the primary.",
+    lambda: {
+        ("replica",): replica_router.stats()["replica_reads"],
+        ("primary_fallback",): replica_router.stats()["primary_fallbacks"],
+    },
+    metric_type="counter",
+    label_names=("target",)
+))
+registry.register(CallbackMetric(
+    "signin_throttled_total",
+    "Sign-in attempts rejected before verification, by limit.",
+    lambda: {(reason,): value for reason, value in signin_throttle.stats().items()},
+    metric_type="counter",
+    label_names=("reason",)
+))
+
+registry.register(CallbackMetric(
+    "user_id_filter_lookups_total",
+    "Signup user_id filter lookups by outcome.",
+    lambda: {
+        (outcome,): user_id_filter.stats()[outcome]
+        for outcome in ("definite_misses", "possible_hits", "false_positives")
+    },
+    metric_type="counter",
+    label_names=("outcome",)
+))
+registry.register(CallbackMetric(
+    "user_id_filter_items",
+    "User_ids held in the signup filter.",
+    lambda: user_id_filter.stats()["items"]
+))
+registry.register(CallbackMetric(
+    "user_id_filter_memory_bytes",
+    "Memory used by the signup filter's bit arrays.",
+    lambda: user_id_filter.stats()["memory_bytes"]
+))
+registry.register(CallbackMetric(
+    "user_id_filter_false_positive_rate",
+    "Estimated false-positive rate of the signup filter.",
+    lambda: user_id_filter.stats()["false_positive_rate"]
+))
+
+
+@app.exception_handler(HashingQueueFullError)
+async def hashing_queue_full_handler(request: Request, exc: HashingQueueFullError) -> JSONResponse:
+    """
+    Reject requests with 503 when password hashing is saturated.
+    
+    Args:
+        request: Incoming request.
+        exc: Raised exception.
+        
+    Returns:
+        503 response with a Retry-After header.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Service busy, retry later"},
+        headers={"Retry-After": str(settings.hashing_retry_after_seconds)}
+    )
+
+
+@app.exception_handler(RateLimitExceededError)
+async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceededError) -> JSONResponse:
+    """
+    Reject throttled sign-in attempts with 429.
+    
+    Args:
+        request: Incoming request.
+        exc: Raised exception.
+        
+    Returns:
+        429 response with a Retry-After header.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": "Too many sign-in attempts, retry later"},
+        headers={"Retry-After": str(math.ceil(exc.retry_after))}
+    )
 
 
 @app.get("/")
@@ -39,3 +249,16 @@ async def health():
     """
     return {"status": "healthy"}
 
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """
+    Metrics endpoint in Prometheus text exposition format.
+    
+    Returns:
+        Current metric values.
+    """
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
+startup_timer.mark_imported()
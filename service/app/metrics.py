@@ -0,0 +1,385 @@
+"""
+Prometheus metrics primitives, registry and application metrics.
+
+Recording never takes a shared lock: every thread writes to its own
+shard, and shards are only merged when /metrics is rendered.
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.default import (
+    CACHE_HIT, CACHE_MISS, CACHING_DISABLED, NO_CACHE_KEY, NO_DIALECT_SUPPORT
+)
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+# Outcome of an execution's lookup in the engine's compiled statement cache
+COMPILED_CACHE_OUTCOMES = {
+    CACHE_HIT: "hit",
+    CACHE_MISS: "miss",
+    CACHING_DISABLED: "disabled",
+    NO_CACHE_KEY: "no_key",
+    NO_DIALECT_SUPPORT: "unsupported",
+}
+
+
+def format_labels(label_names: Sequence[str], label_values: Sequence[str]) -> str:
+    """
+    Format a Prometheus label set.
+    
+    Args:
+        label_names: Label names.
+        label_values: Label values, in the same order.
+        
+    Returns:
+        Label set such as {method="GET",route="/health"}, or "" if empty.
+    """
+    if not label_names:
+        return ""
+    pairs = []
+    for name, value in zip(label_names, label_values):
+        escaped = str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class ShardedMetric:
+    """
+    Base class for metrics recorded into per-thread shards.
+    """
+    
+    metric_type = ""
+    
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        """
+        Initialize the metric.
+        
+        Args:
+            name: Metric name.
+            documentation: HELP text.
+            label_names: Names of the labels passed on every recording.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._local = threading.local()
+        self._shards: List[dict] = []
+        self._shards_lock = threading.Lock()
+    
+    def _shard(self) -> dict:
+        """
+        Return the calling thread's shard, creating it on first use.
+        """
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = {}
+            # Taken once per thread, never on the recording path afterwards
+            with self._shards_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+    
+    def _snapshots(self) -> List[dict]:
+        """
+        Copy every shard for rendering.
+        """
+        with self._shards_lock:
+            shards = list(self._shards)
+        return [shard.copy() for shard in shards]
+    
+    def render(self) -> List[str]:
+        """
+        Render the metric in Prometheus text format.
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        return lines + self._render_samples()
+    
+    def _render_samples(self) -> List[str]:
+        """
+        Render the sample lines of the metric.
+        """
+        raise NotImplementedError
+
+
+class Counter(ShardedMetric):
+    """
+    Value that only goes up, or up and down when used as a gauge.
+    """
+    
+    metric_type = "counter"
+    
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        """
+        Add to the value for a label set.
+        
+        Args:
+            *label_values: Label values.
+            amount: Amount to add.
+        """
+        shard = self._shard()
+        shard[label_values] = shard.get(label_values, 0) + amount
+    
+    def _render_samples(self) -> List[str]:
+        """
+        Render one sample per label set, summed over shards.
+        """
+        totals: Dict[LabelValues, float] = {}
+        for snapshot in self._snapshots():
+            for label_values, value in snapshot.items():
+                totals[label_values] = totals.get(label_values, 0) + value
+        return [
+            f"{self.name}{format_labels(self.label_names, label_values)} {value}"
+            for label_values, value in sorted(totals.items())
+        ]
+
+
+class Gauge(Counter):
+    """
+    Value that goes up and down, such as in-flight requests.
+    """
+    
+    metric_type = "gauge"
+    
+    def dec(self, *label_values: str, amount: float = 1) -> None:
+        """
+        Subtract from the value for a label set.
+        
+        Args:
+            *label_values: Label values.
+            amount: Amount to subtract.
+        """
+        self.inc(*label_values, amount=-amount)
+
+
+class Histogram(ShardedMetric):
+    """
+    Distribution of observed values in cumulative buckets.
+    """
+    
+    metric_type = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        """
+        Initialize the histogram.
+        
+        Args:
+            name: Metric name.
+            documentation: HELP text.
+            label_names: Names of the labels passed on every observation.
+            buckets: Sorted upper bounds of the buckets (+Inf is implicit).
+        """
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(buckets)
+    
+    def observe(self, value: float, *label_values: str) -> None:
+        """
+        Record one observation.
+        
+        Args:
+            value: Observed value.
+            *label_values: Label values.
+        """
+        shard = self._shard()
+        state = shard.get(label_values)
+        if state is None:
+            # Per-bucket counts (last one is +Inf), then sum and count
+            state = shard[label_values] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+        state[bisect_left(self.buckets, value)] += 1
+        state[-2] += value
+        state[-1] += 1
+    
+    def _render_samples(self) -> List[str]:
+        """
+        Render bucket, sum and count samples, summed over shards.
+        """
+        totals: Dict[LabelValues, list] = {}
+        for snapshot in self._snapshots():
+            for label_values, state in snapshot.items():
+                total = totals.setdefault(label_values, [0] * len(state))
+                for index, value in enumerate(list(state)):
+                    total[index] += value
+        
+        lines = []
+        bucket_label_names = self.label_names + ("le",)
+        for label_values, total in sorted(totals.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), total[:-2]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                labels = format_labels(bucket_label_names, label_values + (le,))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}_sum{labels} {total[-2]}")
+            lines.append(f"{self.name}_count{labels} {total[-1]}")
+        return lines
+
+
+class CallbackMetric:
+    """
+    Metric whose value is read from a callback at render time.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Union[float, Dict[LabelValues, float]]],
+        metric_type: str = "gauge",
+        label_names: Sequence[str] = ()
+    ):
+        """
+        Initialize the metric.
+        
+        Args:
+            name: Metric name.
+            documentation: HELP text.
+            callback: Returns the value, or a mapping of label values to values.
+            metric_type: Prometheus type, "gauge" or "counter".
+            label_names: Label names when the callback returns a mapping.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.callback = callback
+        self.metric_type = metric_type
+        self.label_names = tuple(label_names)
+    
+    def render(self) -> List[str]:
+        """
+        Render the metric in Prometheus text format.
+        """
+        values = self.callback()
+        if not isinstance(values, dict):
+            values = {(): values}
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        for label_values, value in sorted(values.items()):
+            lines.append(f"{self.name}{format_labels(self.label_names, label_values)} {value}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered together by /metrics.
+    """
+    
+    def __init__(self):
+        """
+        Initialize an empty registry.
+        """
+        self._metrics: Dict[str, object] = {}
+    
+    def register(self, metric):
+        """
+        Add a metric, replacing any metric with the same name.
+        
+        Args:
+            metric: Metric with a name and a render() method.
+            
+        Returns:
+            The registered metric.
+        """
+        self._metrics[metric.name] = metric
+        return metric
+    
+    def render(self) -> str:
+        """
+        Render every metric in Prometheus text exposition format.
+        
+        Returns:
+            Exposition text.
+        """
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_request_duration = registry.register(Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route.",
+    ("method", "route")
+))
+http_requests_total = registry.register(Counter(
+    "http_requests_total",
+    "HTTP requests by route and status code.",
+    ("method", "route", "status")
+))
+http_requests_in_flight = registry.register(Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served by route.",
+    ("method", "route")
+))
+db_statement_duration = registry.register(Histogram(
+    "db_statement_duration_seconds",
+    "SQL statement execution time by operation.",
+    ("operation",)
+))
+db_compiled_cache_lookups = registry.register(Counter(
+    "db_compiled_cache_lookups_total",
+    "SQL statement executions by outcome of the engine's compiled cache lookup.",
+    ("outcome",)
+))
+password_hashing_duration = registry.register(Histogram(
+    "password_hashing_duration_seconds",
+    "Argon2 hash and verify time in the hashing workers.",
+    ("operation",),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+))
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    """
+    Remember when a statement started and count its compiled cache lookup.
+    """
+    context._metrics_started = time.perf_counter()
+    if context.compiled is not None:
+        db_compiled_cache_lookups.inc(COMPILED_CACHE_OUTCOMES.get(context.cache_hit, "unknown"))
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    """
+    Record how long a statement took, labelled by its SQL verb.
+    """
+    started = getattr(context, "_metrics_started", None)
+    if started is not None:
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "UNKNOWN"
+        db_statement_duration.observe(time.perf_counter() - started, operation)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Attach statement timing hooks to a sync engine.
+    
+    Args:
+        engine: Engine to instrument (use AsyncEngine.sync_engine for async engines).
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def compiled_cache_entries(engine: Engine) -> int:
+    """
+    Count the compiled statements an engine holds in its cache.
+    
+    Args:
+        engine: Sync engine (use AsyncEngine.sync_engine for async engines).
+        
+    Returns:
+        Number of cached compilations, or 0 if caching is disabled.
+    """
+    cache = engine._compiled_cache
+    return len(cache) if cache is not None else 0
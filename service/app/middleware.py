@@ -0,0 +1,92 @@
+"""
+ASGI middleware recording per-route request metrics.
+"""
+import time
+from typing import Dict
+
+from starlette.routing import Match, Router
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.metrics import http_request_duration, http_requests_in_flight, http_requests_total
+from app.startup import startup_timer
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Records latency, in-flight count and status of every HTTP request.
+    
+    Requests are labelled with the route template (e.g. /auth/signin) rather
+    than the raw path, so label cardinality stays bounded. Written as plain
+    ASGI rather than BaseHTTPMiddleware to keep per-request overhead low.
+    """
+    
+    def __init__(self, app: ASGIApp, router: Router):
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: Wrapped ASGI application.
+            router: Router whose routes are used as labels.
+        """
+        self.app = app
+        self.router = router
+        self._static_routes: Dict[str, str] = {}
+    
+    def _route_label(self, scope: Scope) -> str:
+        """
+        Find the route template a request will be dispatched to.
+        
+        Args:
+            scope: ASGI connection scope.
+            
+        Returns:
+            Route path template, or "unmatched".
+        """
+        path = scope["path"]
+        label = self._static_routes.get(path)
+        if label is not None:
+            return label
+        
+        for route in self.router.routes:
+            match, _ = route.matches(scope)
+            if match != Match.NONE:
+                # Paths without parameters map to exactly one route, so cache them
+                if not getattr(route, "param_convertors", None):
+                    self._static_routes[path] = route.path
+                return route.path
+        return UNMATCHED_ROUTE
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI connection.
+        
+        Args:
+            scope: ASGI connection scope.
+            receive: ASGI receive channel.
+            send: ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        startup_timer.mark_first_request()
+        method = scope["method"]
+        route = self._route_label(scope)
+        status_code = 500
+        
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        http_requests_in_flight.inc(method, route)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_request_duration.observe(time.perf_counter() - started, method, route)
+            http_requests_total.inc(method, route, str(status_code))
+            http_requests_in_flight.dec(method, route)
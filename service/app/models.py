@@ -1,7 +1,7 @@
 """
 Database models for users and sessions.
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, LargeBinary
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -35,7 +35,7 @@ class Session(Base):
     Attributes:
         id: Primary key.
         user_id: Foreign key to users table.
-        token: Session token.
+        token_digest: SHA-256 digest of the session token.
         start_time: Session start timestamp.
         max_time: Session expiration timestamp.
         user: Relationship to user.
@@ -44,9 +44,9 @@ class Session(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    token = Column(String, unique=True, index=True, nullable=False)
+    token_digest = Column(LargeBinary(32), unique=True, index=True, nullable=False)
     start_time = Column(DateTime, default=datetime.utcnow, nullable=False)
-    max_time = Column(DateTime, nullable=False)
+    max_time = Column(DateTime, nullable=False, index=True)
     
     user = relationship("User", back_populates="sessions")
 
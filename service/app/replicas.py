@@ -0,0 +1,195 @@
+"""
+Read-replica routing for asyncio database sessions.
+"""
+import asyncio
+import itertools
+import logging
+from typing import Dict, List, Optional
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaRouter:
+    """
+    Round-robin choice among the read replicas that passed their last health check.
+    
+    Replicas start out healthy. check_health() pings every replica and
+    replaces the healthy list; the background task started by start()
+    runs it at a fixed interval. With no healthy replica, reads go to
+    the primary.
+    """
+    
+    def __init__(
+        self,
+        replicas: List[AsyncEngine],
+        interval_seconds: float = 10,
+        timeout_seconds: float = 2.0
+    ):
+        """
+        Initialize the router.
+        
+        Args:
+            replicas: Async engines of the read replicas.
+            interval_seconds: Delay between health checks.
+            timeout_seconds: Time a replica has to answer a health check.
+        """
+        self.replicas = replicas
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.healthy: List[AsyncEngine] = list(replicas)
+        self.replica_reads = 0
+        self.primary_fallbacks = 0
+        self._turn = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+    
+    def choose(self) -> Optional[Engine]:
+        """
+        Pick the next healthy replica.
+        
+        Returns:
+            The replica's sync engine, for Session.get_bind, or None if no
+            replica is healthy.
+        """
+        healthy = self.healthy
+        if not healthy:
+            self.primary_fallbacks += 1
+            return None
+        self.replica_reads += 1
+        return healthy[next(self._turn) % len(healthy)].sync_engine
+    
+    async def _ping(self, replica: AsyncEngine) -> bool:
+        """
+        Check that a replica answers a trivial query in time.
+        
+        Args:
+            replica: Replica engine.
+            
+        Returns:
+            True if the replica answered.
+        """
+        async def run_query() -> None:
+            async with replica.connect() as connection:
+                await connection.exec_driver_sql("SELECT 1")
+        
+        try:
+            await asyncio.wait_for(run_query(), self.timeout_seconds)
+        except Exception:
+            logger.warning("Read replica %s failed its health check", replica.url, exc_info=True)
+            return False
+        return True
+    
+    async def check_health(self) -> int:
+        """
+        Ping every replica concurrently and keep the ones that answered.
+        
+        Returns:
+            Number of healthy replicas.
+        """
+        results = await asyncio.gather(*(self._ping(replica) for replica in self.replicas))
+        self.healthy = [replica for replica, healthy in zip(self.replicas, results) if healthy]
+        return len(self.healthy)
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get replica health and routing counts.
+        
+        Returns:
+            Dictionary with the configured and healthy replica counts, the
+            sessions whose reads were routed to a replica and those that
+            fell back to the primary.
+        """
+        return {
+            "replicas": len(self.replicas),
+            "healthy": len(self.healthy),
+            "replica_reads": self.replica_reads,
+            "primary_fallbacks": self.primary_fallbacks,
+        }
+    
+    async def _run(self) -> None:
+        """
+        Check replica health forever at the configured interval.
+        """
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.check_health()
+    
+    def start(self) -> None:
+        """
+        Start the background health checks if they are not already running.
+        """
+        if self._task is None and self.replicas:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """
+        Cancel the background health checks and wait for them to finish.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+class RoutingSession(Session):
+    """
+    Session that sends plain SELECTs to a read replica and everything else to the primary.
+    
+    A session reads from one replica, chosen on its first read, so its
+    reads see a single replica's state. The first write, flush, locking
+    read, raw connection or non-SELECT statement pins the session to the
+    primary for the rest of its life, so a request always reads its own
+    writes. Sessions are request scoped, which makes the guarantee hold
+    per request.
+    """
+    
+    def __init__(self, *args, router: Optional[ReplicaRouter] = None, **kwargs):
+        """
+        Initialize the session.
+        
+        Args:
+            *args: Session positional arguments.
+            router: Replica router (None sends everything to the primary).
+            **kwargs: Session keyword arguments.
+        """
+        super().__init__(*args, **kwargs)
+        self.router = router
+        self.pinned_to_primary = router is None or not router.replicas
+        self._replica: Optional[Engine] = None
+    
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        """
+        Choose the engine a statement runs on.
+        
+        Args:
+            mapper: Mapper the statement targets, if any.
+            clause: Statement being executed (None for flushes and
+                connection() calls).
+            **kwargs: Further Session.get_bind arguments.
+            
+        Returns:
+            The replica's engine for reads, the primary's otherwise.
+        """
+        if not self.pinned_to_primary:
+            if (
+                isinstance(clause, Select)
+                and clause._for_update_arg is None
+                and not self._flushing
+            ):
+                if self._replica is None:
+                    self._replica = self.router.choose()
+                if self._replica is not None:
+                    return self._replica
+                # No healthy replica: read from the primary for the rest of the session
+                self.pinned_to_primary = True
+            else:
+                self.pinned_to_primary = True
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
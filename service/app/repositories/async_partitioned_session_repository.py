@@ -0,0 +1,420 @@
+"""
+Asyncio repository for sessions stored in rolling, time-partitioned tables.
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    Column, DateTime, ForeignKey, Integer, LargeBinary, MetaData, Table,
+    and_, bindparam, delete, func, insert, inspect, select, union_all, update
+)
+from sqlalchemy.sql import FromClause
+from typing import Dict, List, Optional, Set, Tuple
+from datetime import datetime, timedelta
+from app.config import settings
+from app.models import User
+from app.repositories.rows import SessionInfoRow, SessionTokenRow
+from app.session_tokens import hash_token
+
+# Partition tables are named PARTITION_PREFIX followed by their period index
+PARTITION_PREFIX = "sessions_p"
+
+EPOCH = datetime(1970, 1, 1)
+
+# Partition tables are created at run time, outside Base.metadata and the migrations
+partition_metadata = MetaData()
+
+# (database URL, table name) of partition tables this process created or found
+known_partitions: Set[Tuple[str, str]] = set()
+
+
+def partition_index(max_time: datetime, partition_seconds: int) -> int:
+    """
+    Get the index of the period a session expiry falls in.
+    
+    Args:
+        max_time: Session expiration timestamp.
+        partition_seconds: Length of one period.
+        
+    Returns:
+        Number of whole periods between the epoch and max_time.
+    """
+    return int((max_time - EPOCH).total_seconds() // partition_seconds)
+
+
+def partition_table(index: int) -> Table:
+    """
+    Get the table holding the sessions of one period.
+    
+    Args:
+        index: Period index, as returned by partition_index.
+        
+    Returns:
+        Table with the same columns as the sessions table.
+    """
+    name = f"{PARTITION_PREFIX}{index}"
+    table = partition_metadata.tables.get(name)
+    if table is None:
+        table = Table(
+            name,
+            partition_metadata,
+            Column("id", Integer, primary_key=True),
+            Column("user_id", Integer, ForeignKey(User.__table__.c.id), nullable=False, index=True),
+            Column("token_digest", LargeBinary(32), unique=True, nullable=False),
+            Column("start_time", DateTime, nullable=False),
+            Column("max_time", DateTime, nullable=False)
+        )
+    return table
+
+
+class AsyncPartitionedSessionRepository:
+    """
+    Session repository over one table per period of session expiry.
+    
+    A session is written to the table of the period its max_time falls in,
+    so every row of a table has expired once that period is over and the
+    table is dropped as a whole instead of being deleted row by row.
+    Lookups union the live tables: the period holding the current time and
+    every later one a session could expire in.
+    
+    Tables are created ahead of use by ensure_partitions, which runs at
+    startup and on every sweep; Settings requires the sweep interval to be
+    shorter than partition_seconds, so lookups always find their tables.
+    Writes also create their target table if this process has not seen
+    it yet, so an insert never fails on a missing partition.
+    """
+    
+    def __init__(
+        self,
+        db: AsyncSession,
+        partition_seconds: Optional[int] = None,
+        max_age_seconds: Optional[int] = None
+    ):
+        """
+        Initialize repository with async database session.
+        
+        Args:
+            db: Async database session instance.
+            partition_seconds: Length of one period (defaults to settings).
+            max_age_seconds: Maximum session age (defaults to settings).
+        """
+        self.db = db
+        self.partition_seconds = partition_seconds or settings.session_partition_seconds
+        self.max_age_seconds = max_age_seconds or settings.session_max_age_seconds
+    
+    def live_partitions(self, current_time: datetime) -> List[Table]:
+        """
+        Get the tables that may hold unexpired sessions, newest first.
+        
+        Args:
+            current_time: Current timestamp.
+            
+        Returns:
+            Partition tables from the latest possible expiry period down to
+            the current one.
+        """
+        first = partition_index(current_time, self.partition_seconds)
+        last = partition_index(
+            current_time + timedelta(seconds=self.max_age_seconds),
+            self.partition_seconds
+        )
+        return [partition_table(index) for index in range(last, first - 1, -1)]
+    
+    def valid_sessions(self, current_time: datetime) -> FromClause:
+        """
+        Get a selectable over the unexpired sessions of every live table.
+        
+        Args:
+            current_time: Current timestamp for validation.
+            
+        Returns:
+            Subquery with the columns of the sessions table.
+        """
+        selects = [
+            select(table).where(table.c.max_time > current_time)
+            for table in self.live_partitions(current_time)
+        ]
+        if len(selects) == 1:
+            return selects[0].subquery("valid_sessions")
+        return union_all(*selects).subquery("valid_sessions")
+    
+    async def create_session(
+        self,
+        user_id: int,
+        token: str,
+        start_time: datetime,
+        max_time: datetime
+    ) -> None:
+        """
+        Create a new session in its expiry period's table.
+        
+        Args:
+            user_id: User ID (foreign key).
+            token: Session token, stored only as its digest.
+            start_time: Session start timestamp.
+            max_time: Session expiration timestamp.
+        """
+        await self.insert_session(user_id, token, start_time, max_time)
+    
+    async def insert_session(
+        self,
+        user_id: int,
+        token: str,
+        start_time: datetime,
+        max_time: datetime
+    ) -> None:
+        """
+        Insert a new session into its expiry period's table and commit.
+        
+        Args:
+            user_id: User ID (foreign key).
+            token: Session token, stored only as its digest.
+            start_time: Session start timestamp.
+            max_time: Session expiration timestamp.
+        """
+        table = partition_table(partition_index(max_time, self.partition_seconds))
+        await self.ensure_table(table)
+        stmt = insert(table).values(
+            user_id=user_id,
+            token_digest=hash_token(token),
+            start_time=start_time,
+            max_time=max_time
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
+    
+    async def get_valid_session_by_user_id(
+        self,
+        user_id: int,
+        current_time: datetime
+    ) -> Optional[SessionTokenRow]:
+        """
+        Get a user's latest session that hasn't expired.
+        
+        Args:
+            user_id: User ID.
+            current_time: Current timestamp for validation.
+            
+        Returns:
+            The session's token_digest, start_time and max_time
+            if found, None otherwise.
+        """
+        sessions = self.valid_sessions(current_time)
+        stmt = select(
+            sessions.c.token_digest,
+            sessions.c.start_time,
+            sessions.c.max_time
+        ).where(
+            sessions.c.user_id == user_id
+        ).order_by(sessions.c.start_time.desc()).limit(1)
+        result = await self.db.execute(stmt)
+        row = result.first()
+        return SessionTokenRow(*row) if row is not None else None
+    
+    async def get_session_info_by_token(self, token: str, current_time: datetime) -> Optional[SessionInfoRow]:
+        """
+        Get an unexpired session's user_id and lifetime by token.
+        
+        Args:
+            token: Session token.
+            current_time: Current timestamp for validation.
+            
+        Returns:
+            The session's user_id (the user identifier), start_time and
+            max_time if a valid session matches, None otherwise.
+        """
+        sessions = self.valid_sessions(current_time)
+        stmt = select(
+            User.user_id,
+            sessions.c.start_time,
+            sessions.c.max_time
+        ).join(User, sessions.c.user_id == User.id).where(
+            sessions.c.token_digest == hash_token(token)
+        )
+        result = await self.db.execute(stmt)
+        row = result.first()
+        return SessionInfoRow(*row) if row is not None else None
+    
+    async def get_sessions_info_by_tokens(
+        self,
+        tokens: List[str],
+        current_time: datetime
+    ) -> Dict[str, SessionInfoRow]:
+        """
+        Get the unexpired sessions of many tokens with one IN query over the live partitions.
+        
+        Args:
+            tokens: Session tokens (keep batches within the database's
+                bound parameter limit).
+            current_time: Current timestamp for validation.
+            
+        Returns:
+            Sessions keyed by token. Unknown and expired tokens are absent.
+        """
+        tokens_by_digest = {hash_token(token): token for token in tokens}
+        sessions = self.valid_sessions(current_time)
+        stmt = select(
+            sessions.c.token_digest,
+            User.user_id,
+            sessions.c.start_time,
+            sessions.c.max_time
+        ).join(User, sessions.c.user_id == User.id).where(
+            sessions.c.token_digest.in_(tokens_by_digest)
+        )
+        result = await self.db.execute(stmt)
+        return {
+            tokens_by_digest[token_digest]: SessionInfoRow(user_id, start_time, max_time)
+            for token_digest, user_id, start_time, max_time in result
+        }
+    
+    async def delete_session_by_token(self, token: str) -> bool:
+        """
+        Delete an unexpired session by token and commit.
+        
+        Live tables are tried newest first until one holds the token.
+        
+        Args:
+            token: Session token.
+            
+        Returns:
+            True if a session was deleted, False if none matched.
+        """
+        token_digest = hash_token(token)
+        deleted = False
+        for table in self.live_partitions(datetime.utcnow()):
+            result = await self.db.execute(delete(table).where(table.c.token_digest == token_digest))
+            if result.rowcount:
+                deleted = True
+                break
+        await self.db.commit()
+        return deleted
+    
+    async def extend_sessions(self, max_times: Dict[bytes, datetime], current_time: datetime) -> int:
+        """
+        Move sessions' max_time forward and commit.
+        
+        A session stays in the table of its new max_time's period: rows
+        already there are updated in place, rows in other live tables are
+        copied across with the new max_time and deleted from their old
+        table. Every statement is executed once per batch, for all of the
+        sessions renewed into the same period.
+        
+        Args:
+            max_times: New max_time by token digest; a session whose
+                max_time is already later is left alone.
+            current_time: Current timestamp, for the live tables.
+            
+        Returns:
+            Number of sessions extended.
+        """
+        params_by_index: Dict[int, List[dict]] = {}
+        for digest, max_time in max_times.items():
+            params_by_index.setdefault(partition_index(max_time, self.partition_seconds), []).append(
+                {"digest": digest, "new_max_time": max_time}
+            )
+        
+        extended = 0
+        new_max_time = bindparam("new_max_time", type_=DateTime)
+        for index, params in params_by_index.items():
+            target = partition_table(index)
+            await self.ensure_table(target)
+            for table in self.live_partitions(current_time):
+                renewable = and_(
+                    table.c.token_digest == bindparam("digest"),
+                    table.c.max_time < new_max_time
+                )
+                if table is target:
+                    result = await self.db.execute(
+                        update(table).where(renewable).values(max_time=new_max_time),
+                        params
+                    )
+                else:
+                    await self.db.execute(
+                        insert(target).from_select(
+                            ["user_id", "token_digest", "start_time", "max_time"],
+                            select(
+                                table.c.user_id,
+                                table.c.token_digest,
+                                table.c.start_time,
+                                new_max_time
+                            ).where(renewable)
+                        ),
+                        params
+                    )
+                    result = await self.db.execute(delete(table).where(renewable), params)
+                extended += result.rowcount
+        await self.db.commit()
+        return extended
+    
+    def _partition_key(self, table: Table) -> Tuple[str, str]:
+        """
+        Identify a partition table across the databases this process uses.
+        """
+        return str(self.db.get_bind().url), table.name
+    
+    async def ensure_table(self, table: Table) -> None:
+        """
+        Create one partition table if this process has not seen it yet.
+        
+        Runs in the caller's transaction without committing. After the
+        first call for a table this is a set lookup, so it is cheap enough
+        for the insert path.
+        
+        Args:
+            table: Partition table.
+        """
+        key = self._partition_key(table)
+        if key in known_partitions:
+            return
+        await self.db.run_sync(lambda session: table.create(session.connection(), checkfirst=True))
+        known_partitions.add(key)
+    
+    async def ensure_partitions(self, current_time: datetime) -> None:
+        """
+        Create every live table and the one after, if missing, and commit.
+        
+        The extra table covers the expiries of the next period, so sessions
+        can be written until the following call.
+        
+        Args:
+            current_time: Current timestamp.
+        """
+        later = current_time + timedelta(seconds=self.partition_seconds)
+        tables = {table.name: table for table in self.live_partitions(later)}
+        tables.update((table.name, table) for table in self.live_partitions(current_time))
+        
+        def create_tables(session) -> None:
+            partition_metadata.create_all(session.connection(), tables=list(tables.values()))
+        
+        await self.db.run_sync(create_tables)
+        await self.db.commit()
+        known_partitions.update(self._partition_key(table) for table in tables.values())
+    
+    async def drop_expired_partitions(self, current_time: datetime) -> int:
+        """
+        Drop every table whose period is over and commit.
+        
+        Args:
+            current_time: Tables whose period ends at or before this are dropped.
+            
+        Returns:
+            Number of sessions the dropped tables held.
+        """
+        current_index = partition_index(current_time, self.partition_seconds)
+        table_names = await self.db.run_sync(
+            lambda session: inspect(session.connection()).get_table_names()
+        )
+        expired = [
+            partition_table(int(name[len(PARTITION_PREFIX):]))
+            for name in table_names
+            if name.startswith(PARTITION_PREFIX)
+            and name[len(PARTITION_PREFIX):].isdigit()
+            and int(name[len(PARTITION_PREFIX):]) < current_index
+        ]
+        
+        purged = 0
+        for table in expired:
+            purged += await self.db.scalar(select(func.count()).select_from(table))
+            await self.db.run_sync(lambda session, table=table: table.drop(session.connection()))
+            known_partitions.discard(self._partition_key(table))
+            partition_metadata.remove(table)
+        await self.db.commit()
+        return purged
@@ -0,0 +1,277 @@
+"""
+Asyncio repository for session database operations.
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import DateTime, select, insert, update, delete, and_, bindparam
+from sqlalchemy.sql import FromClause
+from typing import Dict, List, Optional
+from datetime import datetime
+from app.models import Session
+from app.repositories.rows import SessionInfoRow, SessionTokenRow
+from app.repositories.statements import (
+    DELETE_SESSION_BY_DIGEST, LATEST_SESSION_BY_USER, SESSION_BY_DIGEST,
+    SESSION_INFO_BY_DIGEST, SESSION_VALID_BY_DIGEST, SESSIONS_INFO_BY_DIGESTS
+)
+from app.session_tokens import hash_token
+
+
+class AsyncSessionRepository:
+    """
+    Asyncio counterpart of SessionRepository.
+    """
+    
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize repository with async database session.
+        
+        Args:
+            db: Async database session instance.
+        """
+        self.db = db
+    
+    def valid_sessions(self, current_time: datetime) -> FromClause:
+        """
+        Get the selectable sessions are read from.
+        
+        The sessions table holds every session, so callers filter on
+        max_time themselves.
+        
+        Args:
+            current_time: Current timestamp (unused; kept for the
+                partitioned repository's signature).
+                
+        Returns:
+            The sessions table.
+        """
+        return Session.__table__
+    
+    async def create_session(
+        self,
+        user_id: int,
+        token: str,
+        start_time: datetime,
+        max_time: datetime
+    ) -> Session:
+        """
+        Create a new session in the database.
+        
+        Args:
+            user_id: User ID (foreign key).
+            token: Session token, stored only as its digest.
+            start_time: Session start timestamp.
+            max_time: Session expiration timestamp.
+            
+        Returns:
+            Created session object.
+        """
+        session = Session(
+            user_id=user_id,
+            token_digest=hash_token(token),
+            start_time=start_time,
+            max_time=max_time
+        )
+        self.db.add(session)
+        await self.db.commit()
+        await self.db.refresh(session)
+        return session
+    
+    async def insert_session(
+        self,
+        user_id: int,
+        token: str,
+        start_time: datetime,
+        max_time: datetime
+    ) -> None:
+        """
+        Insert a new session with a single statement and commit.
+        
+        Unlike create_session, no ORM object is built or refreshed: callers
+        already hold every column value they need.
+        
+        Args:
+            user_id: User ID (foreign key).
+            token: Session token, stored only as its digest.
+            start_time: Session start timestamp.
+            max_time: Session expiration timestamp.
+        """
+        stmt = insert(Session).values(
+            user_id=user_id,
+            token_digest=hash_token(token),
+            start_time=start_time,
+            max_time=max_time
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
+    
+    async def get_valid_session_by_user_id(
+        self,
+        user_id: int,
+        current_time: datetime
+    ) -> Optional[SessionTokenRow]:
+        """
+        Get a user's latest session that hasn't expired.
+        
+        Only the columns needed to reuse the session are selected.
+        
+        Args:
+            user_id: User ID.
+            current_time: Current timestamp for validation.
+            
+        Returns:
+            The session's token_digest, start_time and max_time
+            if found, None otherwise.
+        """
+        result = await self.db.execute(
+            LATEST_SESSION_BY_USER,
+            {"user_pk": user_id, "current_time": current_time}
+        )
+        row = result.first()
+        return SessionTokenRow(*row) if row is not None else None
+    
+    async def get_session_by_token(self, token: str) -> Optional[Session]:
+        """
+        Get a session by token, looked up by the token's digest.
+        
+        Args:
+            token: Session token.
+            
+        Returns:
+            Session object if found, None otherwise.
+        """
+        result = await self.db.scalars(SESSION_BY_DIGEST, {"token_digest": hash_token(token)})
+        return result.first()
+    
+    async def get_session_info_by_token(self, token: str, current_time: datetime) -> Optional[SessionInfoRow]:
+        """
+        Get an unexpired session's user_id and lifetime by token.
+        
+        Args:
+            token: Session token.
+            current_time: Current timestamp for validation.
+            
+        Returns:
+            The session's user_id (the user identifier), start_time and
+            max_time if a valid session matches, None otherwise.
+        """
+        result = await self.db.execute(
+            SESSION_INFO_BY_DIGEST,
+            {"token_digest": hash_token(token), "current_time": current_time}
+        )
+        row = result.first()
+        return SessionInfoRow(*row) if row is not None else None
+    
+    async def get_sessions_info_by_tokens(
+        self,
+        tokens: List[str],
+        current_time: datetime
+    ) -> Dict[str, SessionInfoRow]:
+        """
+        Get the unexpired sessions of many tokens with one IN query.
+        
+        Args:
+            tokens: Session tokens (keep batches within the database's
+                bound parameter limit).
+            current_time: Current timestamp for validation.
+            
+        Returns:
+            Sessions keyed by token. Unknown and expired tokens are absent.
+        """
+        tokens_by_digest = {hash_token(token): token for token in tokens}
+        result = await self.db.execute(
+            SESSIONS_INFO_BY_DIGESTS,
+            {"token_digests": list(tokens_by_digest), "current_time": current_time}
+        )
+        return {
+            tokens_by_digest[token_digest]: SessionInfoRow(user_id, start_time, max_time)
+            for token_digest, user_id, start_time, max_time in result
+        }
+    
+    async def is_session_valid(self, token: str, current_time: datetime) -> bool:
+        """
+        Check if a session is valid (exists and not expired).
+        
+        Args:
+            token: Session token.
+            current_time: Current timestamp for validation.
+            
+        Returns:
+            True if session is valid, False otherwise.
+        """
+        return await self.db.scalar(
+            SESSION_VALID_BY_DIGEST,
+            {"token_digest": hash_token(token), "current_time": current_time}
+        )
+    
+    async def delete_session(self, session: Session) -> None:
+        """
+        Delete a session from the database.
+        
+        Args:
+            session: Session object to delete.
+        """
+        await self.db.delete(session)
+        await self.db.commit()
+    
+    async def delete_session_by_token(self, token: str) -> bool:
+        """
+        Delete a session by token with a single statement and commit.
+        
+        Args:
+            token: Session token.
+            
+        Returns:
+            True if a session was deleted, False if none matched.
+        """
+        result = await self.db.execute(
+            DELETE_SESSION_BY_DIGEST,
+            {"token_digest": hash_token(token)},
+            execution_options={"synchronize_session": False}
+        )
+        await self.db.commit()
+        return result.rowcount > 0
+    
+    async def extend_sessions(self, max_times: Dict[bytes, datetime], current_time: datetime) -> int:
+        """
+        Move sessions' max_time forward with one batched UPDATE and commit.
+        
+        Args:
+            max_times: New max_time by token digest; a session whose
+                max_time is already later is left alone.
+            current_time: Current timestamp (unused; kept for the
+                partitioned repository's signature).
+                
+        Returns:
+            Number of sessions extended.
+        """
+        sessions = Session.__table__
+        stmt = update(sessions).where(
+            and_(
+                sessions.c.token_digest == bindparam("digest"),
+                sessions.c.max_time < bindparam("new_max_time", type_=DateTime)
+            )
+        ).values(max_time=bindparam("new_max_time", type_=DateTime))
+        result = await self.db.execute(
+            stmt,
+            [{"digest": digest, "new_max_time": max_time} for digest, max_time in max_times.items()]
+        )
+        await self.db.commit()
+        return result.rowcount
+    
+    async def delete_expired_sessions(self, current_time: datetime, batch_size: int) -> int:
+        """
+        Delete one batch of expired sessions and commit.
+        
+        Args:
+            current_time: Sessions with max_time at or before this are expired.
+            batch_size: Maximum number of rows deleted in this transaction.
+            
+        Returns:
+            Number of sessions deleted.
+        """
+        expired_ids = select(Session.id).where(
+            Session.max_time <= current_time
+        ).limit(batch_size).scalar_subquery()
+        stmt = delete(Session).where(Session.id.in_(expired_ids))
+        result = await self.db.execute(stmt, execution_options={"synchronize_session": False})
+        await self.db.commit()
+        return result.rowcount
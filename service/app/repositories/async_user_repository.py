@@ -0,0 +1,190 @@
+"""
+Asyncio repository for user database operations.
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql import FromClause
+from typing import Dict, List, Optional, Set, Tuple
+from datetime import datetime
+from app.models import User, Session
+from app.repositories.rows import SessionTokenRow
+from app.repositories.statements import (
+    USER_BY_USER_ID, USER_EXISTS, USER_WITH_LATEST_SESSION, user_with_latest_session
+)
+
+# Dialects supporting INSERT ... ON CONFLICT DO NOTHING
+ON_CONFLICT_INSERTS = {
+    "sqlite": sqlite_insert,
+    "postgresql": postgresql_insert,
+}
+
+
+class AsyncUserRepository:
+    """
+    Asyncio counterpart of UserRepository.
+    """
+    
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize repository with async database session.
+        
+        Args:
+            db: Async database session instance.
+        """
+        self.db = db
+    
+    async def create_user(self, user_id: str, password_hash: str) -> User:
+        """
+        Create a new user in the database.
+        
+        Args:
+            user_id: User identifier.
+            password_hash: Hashed password.
+            
+        Returns:
+            Created user object.
+        """
+        user = User(user_id=user_id, password_hash=password_hash)
+        self.db.add(user)
+        await self.db.commit()
+        await self.db.refresh(user)
+        return user
+    
+    async def create_user_if_absent(self, user_id: str, password_hash: str) -> Optional[int]:
+        """
+        Create a user unless the user_id is taken, in a single statement.
+        
+        Uses INSERT ... ON CONFLICT DO NOTHING RETURNING where the dialect
+        supports it, so concurrent signups for the same user_id cannot race.
+        Other dialects fall back to a plain INSERT and the unique constraint.
+        
+        Args:
+            user_id: User identifier.
+            password_hash: Hashed password.
+            
+        Returns:
+            Primary key of the created user, or None if user_id already exists.
+        """
+        dialect_insert = ON_CONFLICT_INSERTS.get(self.db.get_bind().dialect.name)
+        
+        if dialect_insert is not None:
+            stmt = dialect_insert(User).values(
+                user_id=user_id,
+                password_hash=password_hash
+            ).on_conflict_do_nothing(index_elements=[User.user_id]).returning(User.id)
+            result = await self.db.execute(stmt)
+            created_id = result.scalar()
+        else:
+            stmt = insert(User).values(user_id=user_id, password_hash=password_hash).returning(User.id)
+            try:
+                result = await self.db.execute(stmt)
+                created_id = result.scalar()
+            except IntegrityError:
+                await self.db.rollback()
+                return None
+        
+        await self.db.commit()
+        return created_id
+    
+    async def create_users_if_absent(self, users: List[Dict[str, str]]) -> Set[str]:
+        """
+        Create many users in one executemany batch, skipping taken user_ids.
+        
+        Args:
+            users: Rows with user_id and password_hash keys.
+            
+        Returns:
+            The user_ids that were created. When a user_id appears more than
+            once in the batch only its first row is inserted.
+        """
+        dialect_insert = ON_CONFLICT_INSERTS.get(self.db.get_bind().dialect.name)
+        
+        if dialect_insert is None:
+            created_user_ids = set()
+            for user in users:
+                if await self.create_user_if_absent(user["user_id"], user["password_hash"]) is not None:
+                    created_user_ids.add(user["user_id"])
+            return created_user_ids
+        
+        stmt = dialect_insert(User).on_conflict_do_nothing(
+            index_elements=[User.user_id]
+        ).returning(User.user_id)
+        result = await self.db.execute(stmt, users)
+        created_user_ids = set(result.scalars().all())
+        await self.db.commit()
+        return created_user_ids
+    
+    async def update_password_hash(self, user_id: int, password_hash: str) -> None:
+        """
+        Replace a user's password hash without committing.
+        
+        The update joins the caller's transaction, so it is committed
+        together with whatever else that transaction writes.
+        
+        Args:
+            user_id: User ID (primary key).
+            password_hash: New hashed password.
+        """
+        stmt = update(User).where(User.id == user_id).values(password_hash=password_hash)
+        await self.db.execute(stmt)
+    
+    async def get_user_by_user_id(self, user_id: str) -> Optional[User]:
+        """
+        Get a user by user_id.
+        
+        Args:
+            user_id: User identifier.
+            
+        Returns:
+            User object if found, None otherwise.
+        """
+        result = await self.db.scalars(USER_BY_USER_ID, {"user_id": user_id})
+        return result.first()
+    
+    async def user_exists(self, user_id: str) -> bool:
+        """
+        Check if a user exists by user_id with an EXISTS query.
+        
+        Args:
+            user_id: User identifier.
+            
+        Returns:
+            True if user exists, False otherwise.
+        """
+        return await self.db.scalar(USER_EXISTS, {"user_id": user_id})
+    
+    async def get_user_with_valid_session(
+        self,
+        user_id: str,
+        current_time: datetime,
+        sessions: Optional[FromClause] = None
+    ) -> Tuple[Optional[User], Optional[SessionTokenRow]]:
+        """
+        Get a user and their latest valid session in a single query.
+        
+        Args:
+            user_id: User identifier.
+            current_time: Current timestamp for session validation.
+            sessions: Selectable with the sessions table's columns to join,
+                as returned by a session repository's valid_sessions
+                (defaults to the sessions table).
+                
+        Returns:
+            Tuple of the user (None if not found) and the token_digest,
+            start_time and max_time of their latest unexpired session (None
+            if there is none).
+        """
+        if sessions is None or sessions is Session.__table__:
+            stmt = USER_WITH_LATEST_SESSION
+        else:
+            stmt = user_with_latest_session(sessions)
+        result = await self.db.execute(stmt, {"user_id": user_id, "current_time": current_time})
+        row = result.first()
+        if row is None:
+            return None, None
+        if row.token_digest is None:
+            return row[0], None
+        return row[0], SessionTokenRow(*row[1:])
@@ -0,0 +1,54 @@
+"""
+Lightweight rows returned by column-projection repository lookups.
+
+Lookups on the request path select only the columns they need into these
+classes instead of loading ORM entities, so no identity map entry,
+instance state or related User (with its password_hash) is built.
+"""
+from datetime import datetime
+
+
+class SessionInfoRow:
+    """
+    A valid session as seen by token validation.
+    
+    Attributes:
+        user_id: User identifier (not the users table key).
+        start_time: Session start timestamp.
+        max_time: Session expiration timestamp.
+    """
+    __slots__ = ("user_id", "start_time", "max_time")
+    
+    def __init__(self, user_id: str, start_time: datetime, max_time: datetime):
+        """
+        Initialize the row from selected columns.
+        """
+        self.user_id = user_id
+        self.start_time = start_time
+        self.max_time = max_time
+    
+    def __repr__(self) -> str:
+        return f"SessionInfoRow(user_id={self.user_id!r}, max_time={self.max_time!r})"
+
+
+class SessionTokenRow:
+    """
+    A user's valid session, identified by its token digest.
+    
+    Attributes:
+        token_digest: Digest the session is stored by.
+        start_time: Session start timestamp.
+        max_time: Session expiration timestamp.
+    """
+    __slots__ = ("token_digest", "start_time", "max_time")
+    
+    def __init__(self, token_digest: bytes, start_time: datetime, max_time: datetime):
+        """
+        Initialize the row from selected columns.
+        """
+        self.token_digest = token_digest
+        self.start_time = start_time
+        self.max_time = max_time
+    
+    def __repr__(self) -> str:
+        return f"SessionTokenRow(token_digest={self.token_digest.hex()!r}, max_time={self.max_time!r})"
@@ -1,11 +1,17 @@
 """
 Repository for session database operations.
 """
-from sqlalchemy.orm import Session as DBSession, joinedload
-from sqlalchemy import select, and_
-from typing import Optional
+from sqlalchemy.orm import Session as DBSession
+from sqlalchemy import select, delete
+from typing import Dict, List, Optional
 from datetime import datetime
-from app.models import Session, User
+from app.models import Session
+from app.repositories.rows import SessionInfoRow, SessionTokenRow
+from app.repositories.statements import (
+    DELETE_SESSION_BY_DIGEST, LATEST_SESSION_BY_USER, SESSION_BY_DIGEST,
+    SESSION_INFO_BY_DIGEST, SESSION_VALID_BY_DIGEST, SESSIONS_INFO_BY_DIGESTS
+)
+from app.session_tokens import hash_token
 
 
 class SessionRepository:
@@ -34,7 +40,7 @@ class SessionRepository:
         
         Args:
             user_id: User ID (foreign key).
-            token: Session token.
+            token: Session token, stored only as its digest.
             start_time: Session start timestamp.
             max_time: Session expiration timestamp.
             
@@ -43,7 +49,7 @@ class SessionRepository:
         """
         session = Session(
             user_id=user_id,
-            token=token,
+            token_digest=hash_token(token),
             start_time=start_time,
             max_time=max_time
         )
@@ -52,31 +58,29 @@ class SessionRepository:
         self.db.refresh(session)
         return session
     
-    def get_valid_session_by_user_id(self, user_id: int, current_time: datetime) -> Optional[Session]:
+    def get_valid_session_by_user_id(self, user_id: int, current_time: datetime) -> Optional[SessionTokenRow]:
         """
-        Get a valid session for a user that hasn't expired.
+        Get a user's latest session that hasn't expired.
+        
+        Only the columns needed to reuse the session are selected.
         
         Args:
             user_id: User ID.
             current_time: Current timestamp for validation.
             
         Returns:
-            Valid session object if found, None otherwise.
-        """
-        stmt = select(Session).options(
-            joinedload(Session.user)
-        ).where(
-            and_(
-                Session.user_id == user_id,
-                Session.max_time > current_time
-            )
-        ).order_by(Session.start_time.desc())
-        result = self.db.scalars(stmt).first()
-        return result
+            The session's token_digest, start_time and max_time
+            if found, None otherwise.
+        """
+        row = self.db.execute(
+            LATEST_SESSION_BY_USER,
+            {"user_pk": user_id, "current_time": current_time}
+        ).first()
+        return SessionTokenRow(*row) if row is not None else None
     
     def get_session_by_token(self, token: str) -> Optional[Session]:
         """
-        Get a session by token.
+        Get a session by token, looked up by the token's digest.
         
         Args:
             token: Session token.
@@ -84,11 +88,47 @@ class SessionRepository:
         Returns:
             Session object if found, None otherwise.
         """
-        stmt = select(Session).options(
-            joinedload(Session.user)
-        ).where(Session.token == token)
-        result = self.db.scalars(stmt).first()
-        return result
+        return self.db.scalars(SESSION_BY_DIGEST, {"token_digest": hash_token(token)}).first()
+    
+    def get_session_info_by_token(self, token: str, current_time: datetime) -> Optional[SessionInfoRow]:
+        """
+        Get an unexpired session's user_id and lifetime by token.
+        
+        Args:
+            token: Session token.
+            current_time: Current timestamp for validation.
+            
+        Returns:
+            The session's user_id (the user identifier), start_time and
+            max_time if a valid session matches, None otherwise.
+        """
+        row = self.db.execute(
+            SESSION_INFO_BY_DIGEST,
+            {"token_digest": hash_token(token), "current_time": current_time}
+        ).first()
+        return SessionInfoRow(*row) if row is not None else None
+    
+    def get_sessions_info_by_tokens(self, tokens: List[str], current_time: datetime) -> Dict[str, SessionInfoRow]:
+        """
+        Get the unexpired sessions of many tokens with one IN query.
+        
+        Args:
+            tokens: Session tokens (keep batches within the database's
+                bound parameter limit).
+            current_time: Current timestamp for validation.
+            
+        Returns:
+            Sessions keyed by token. Unknown and expired tokens are absent.
+        """
+        tokens_by_digest = {hash_token(token): token for token in tokens}
+        result = self.db.execute(
+            SESSIONS_INFO_BY_DIGESTS,
+            {"token_digests": list(tokens_by_digest), "current_time": current_time}
+        )
+        return {
+            tokens_by_digest[token_digest]: SessionInfoRow(user_id, start_time, max_time)
+            for token_digest, user_id, start_time, max_time in result
+        }
     
     def is_session_valid(self, token: str, current_time: datetime) -> bool:
         """
@@ -101,10 +141,10 @@ class SessionRepository:
         Returns:
             True if session is valid, False otherwise.
         """
-        session = self.get_session_by_token(token)
-        if session is None:
-            return False
-        return session.max_time > current_time
+        return self.db.scalar(
+            SESSION_VALID_BY_DIGEST,
+            {"token_digest": hash_token(token), "current_time": current_time}
+        )
     
     def delete_session(self, session: Session) -> None:
         """
@@ -115,4 +155,40 @@ class SessionRepository:
         """
         self.db.delete(session)
         self.db.commit()
-
+    
+    def delete_session_by_token(self, token: str) -> bool:
+        """
+        Delete a session by token with a single statement and commit.
+        
+        Args:
+            token: Session token.
+            
+        Returns:
+            True if a session was deleted, False if none matched.
+        """
+        result = self.db.execute(
+            DELETE_SESSION_BY_DIGEST,
+            {"token_digest": hash_token(token)},
+            execution_options={"synchronize_session": False}
+        )
+        self.db.commit()
+        return result.rowcount > 0
+    
+    def delete_expired_sessions(self, current_time: datetime, batch_size: int) -> int:
+        """
+        Delete one batch of expired sessions and commit.
+        
+        Args:
+            current_time: Sessions with max_time at or before this are expired.
+            batch_size: Maximum number of rows deleted in this transaction.
+            
+        Returns:
+            Number of sessions deleted.
+        """
+        expired_ids = select(Session.id).where(
+            Session.max_time <= current_time
+        ).limit(batch_size).scalar_subquery()
+        stmt = delete(Session).where(Session.id.in_(expired_ids))
+        result = self.db.execute(stmt, execution_options={"synchronize_session": False})
+        self.db.commit()
+        return result.rowcount
@@ -0,0 +1,662 @@
+"""
+Session stores: the interface AsyncSessionService keeps sessions behind, and its backends.
+"""
+import json
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Dict, List, Optional, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import FromClause
+
+from app.config import settings
+from app.repositories.async_partitioned_session_repository import AsyncPartitionedSessionRepository
+from app.repositories.async_session_repository import AsyncSessionRepository
+from app.session_tokens import hash_token
+
+try:
+    import redis.asyncio as redis_asyncio
+    from redis.asyncio.retry import Retry
+    from redis.backoff import ExponentialBackoff
+    from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+except ImportError:  # pragma: no cover - redis is only needed by the "redis" session store
+    redis_asyncio = None
+
+EPOCH = datetime(1970, 1, 1)
+
+# Reconnect attempts for a Redis command whose connection failed or timed out
+REDIS_RETRIES = 3
+
+# PEXPIREAT a user's latest-session pointer only while it still names the
+# given session, so extending an older session cannot touch a newer one's
+EXTEND_USER_SESSION_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIREAT', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+@dataclass
+class SessionRecord:
+    """
+    A stored session.
+    
+    Attributes:
+        user_pk: Primary key of the user (the sessions.user_id column).
+        user_id: User identifier.
+        start_time: Session start timestamp.
+        max_time: Session expiration timestamp.
+        token_digest: SHA-256 digest of the token.
+    """
+    user_pk: Optional[int]
+    user_id: Optional[str]
+    start_time: datetime
+    max_time: datetime
+    token_digest: Optional[bytes] = None
+
+
+class SessionStore(ABC):
+    """
+    Where sessions live: keyed by token digest, expiring at max_time.
+    """
+    
+    def valid_sessions(self, current_time: datetime) -> Optional[FromClause]:
+        """
+        Get a selectable of unexpired sessions for joins with the users table.
+        
+        Args:
+            current_time: Current timestamp.
+            
+        Returns:
+            Selectable with the sessions table's columns, or None if the
+            store is not in the database.
+        """
+        return None
+    
+    @abstractmethod
+    async def add(
+        self,
+        token: str,
+        user_pk: int,
+        user_id: str,
+        start_time: datetime,
+        max_time: datetime
+    ) -> None:
+        """
+        Store a new session.
+        
+        Args:
+            token: Session token, stored only as its digest.
+            user_pk: Primary key of the user.
+            user_id: User identifier.
+            start_time: Session start timestamp.
+            max_time: Session expiration timestamp.
+        """
+    
+    @abstractmethod
+    async def get(self, token: str, current_time: datetime) -> Optional[SessionRecord]:
+        """
+        Get an unexpired session by token.
+        
+        Args:
+            token: Session token.
+            current_time: Current timestamp for validation.
+            
+        Returns:
+            The session (token_digest may be unset), or None.
+        """
+    
+    async def get_many(self, tokens: List[str], current_time: datetime) -> Dict[str, SessionRecord]:
+        """
+        Get the unexpired sessions of many tokens.
+        
+        Stores that can answer a batch in one round trip override this;
+        the default looks the tokens up one by one.
+        
+        Args:
+            tokens: Session tokens.
+            current_time: Current timestamp for validation.
+            
+        Returns:
+            Sessions keyed by token. Unknown and expired tokens are absent.
+        """
+        sessions = {}
+        for token in tokens:
+            session = await self.get(token, current_time)
+            if session is not None:
+                sessions[token] = session
+        return sessions
+    
+    @abstractmethod
+    async def get_latest_for_user(self, user_pk: int, current_time: datetime) -> Optional[SessionRecord]:
+        """
+        Get a user's latest unexpired session.
+        
+        Args:
+            user_pk: Primary key of the user.
+            current_time: Current timestamp for validation.
+            
+        Returns:
+            The session, with its token_digest, or None.
+        """
+    
+    @abstractmethod
+    async def delete(self, token: str) -> bool:
+        """
+        Delete a session by token.
+        
+        Args:
+            token: Session token.
+            
+        Returns:
+            True if a session was deleted, False if none matched.
+        """
+    
+    @abstractmethod
+    async def extend_sessions(self, max_times: Dict[bytes, datetime], current_time: datetime) -> int:
+        """
+        Move sessions' max_time forward, all in one batch.
+        
+        Args:
+            max_times: New max_time by token digest; sessions that are gone
+                or already expire later are left alone.
+            current_time: Current timestamp.
+            
+        Returns:
+            Number of sessions extended.
+        """
+    
+    async def purge_expired(self, current_time: datetime) -> int:
+        """
+        Remove expired sessions the store does not expire by itself.
+        
+        Args:
+            current_time: Sessions with max_time at or before this are expired.
+            
+        Returns:
+            Number of sessions removed.
+        """
+        return 0
+
+
+class SqlSessionStore(SessionStore):
+    """
+    Sessions in the database, through a request-scoped session repository.
+    
+    Purging is left to the session sweeper, which deletes in batches or
+    drops whole partitions.
+    """
+    
+    def __init__(self, repository: Union[AsyncSessionRepository, AsyncPartitionedSessionRepository]):
+        """
+        Initialize the store.
+        
+        Args:
+            repository: Repository over the sessions table or its partitions.
+        """
+        self.repository = repository
+    
+    def valid_sessions(self, current_time: datetime) -> FromClause:
+        """
+        Get the repository's selectable of unexpired sessions.
+        """
+        return self.repository.valid_sessions(current_time)
+    
+    async def add(
+        self,
+        token: str,
+        user_pk: int,
+        user_id: str,
+        start_time: datetime,
+        max_time: datetime
+    ) -> None:
+        """
+        Insert the session with a single statement and commit.
+        """
+        await self.repository.insert_session(
+            user_id=user_pk,
+            token=token,
+            start_time=start_time,
+            max_time=max_time
+        )
+    
+    async def get(self, token: str, current_time: datetime) -> Optional[SessionRecord]:
+        """
+        Look the session up by digest, joined with its user.
+        """
+        row = await self.repository.get_session_info_by_token(token, current_time)
+        if row is None:
+            return None
+        return SessionRecord(None, row.user_id, row.start_time, row.max_time)
+    
+    async def get_many(self, tokens: List[str], current_time: datetime) -> Dict[str, SessionRecord]:
+        """
+        Look the sessions up with one IN query on their digests.
+        """
+        rows = await self.repository.get_sessions_info_by_tokens(tokens, current_time)
+        return {
+            token: SessionRecord(None, row.user_id, row.start_time, row.max_time)
+            for token, row in rows.items()
+        }
+    
+    async def get_latest_for_user(self, user_pk: int, current_time: datetime) -> Optional[SessionRecord]:
+        """
+        Get the user's latest unexpired session row.
+        """
+        session = await self.repository.get_valid_session_by_user_id(user_pk, current_time)
+        if session is None:
+            return None
+        return SessionRecord(
+            user_pk,
+            None,
+            session.start_time,
+            session.max_time,
+            session.token_digest
+        )
+    
+    async def delete(self, token: str) -> bool:
+        """
+        Delete the session with a single statement and commit.
+        """
+        return await self.repository.delete_session_by_token(token)
+    
+    async def extend_sessions(self, max_times: Dict[bytes, datetime], current_time: datetime) -> int:
+        """
+        Extend the sessions with batched statements and commit.
+        """
+        return await self.repository.extend_sessions(max_times, current_time)
+
+class _Stripe:
+    """
+    One lock and the part of the keyspace it guards.
+    """
+    
+    def __init__(self):
+        """
+        Initialize an empty stripe.
+        """
+        self.lock = threading.Lock()
+        self.records: Dict[bytes, SessionRecord] = {}
+        self.latest_by_user: Dict[int, bytes] = {}
+
+
+class MemorySessionStore(SessionStore):
+    """
+    Process-local sessions, sharded over lock stripes.
+    
+    Sessions are striped by token digest and each user's latest session
+    by user primary key, so concurrent lookups of different tokens rarely
+    contend for the same lock. Expired sessions are dropped when read and
+    by purge_expired, which the session sweeper runs.
+    
+    Sessions are not shared between worker processes and are lost on
+    restart, so this store suits single-worker deployments and tests.
+    """
+    
+    def __init__(self, stripes: int = 16):
+        """
+        Initialize an empty store.
+        
+        Args:
+            stripes: Number of lock stripes.
+        """
+        self._stripes = [_Stripe() for _ in range(max(1, stripes))]
+    
+    def _record_stripe(self, token_digest: bytes) -> _Stripe:
+        """
+        Stripe holding the session with this digest.
+        """
+        return self._stripes[int.from_bytes(token_digest[:4], "little") % len(self._stripes)]
+    
+    def _user_stripe(self, user_pk: int) -> _Stripe:
+        """
+        Stripe holding this user's latest session digest.
+        """
+        return self._stripes[user_pk % len(self._stripes)]
+    
+    async def add(
+        self,
+        token: str,
+        user_pk: int,
+        user_id: str,
+        start_time: datetime,
+        max_time: datetime
+    ) -> None:
+        """
+        Store the session and make it the user's latest.
+        """
+        token_digest = hash_token(token)
+        record = SessionRecord(user_pk, user_id, start_time, max_time, token_digest)
+        stripe = self._record_stripe(token_digest)
+        with stripe.lock:
+            stripe.records[token_digest] = record
+        stripe = self._user_stripe(user_pk)
+        with stripe.lock:
+            stripe.latest_by_user[user_pk] = token_digest
+    
+    def _get_by_digest(self, token_digest: bytes, current_time: datetime) -> Optional[SessionRecord]:
+        """
+        Get an unexpired session by digest, dropping it if it has expired.
+        """
+        stripe = self._record_stripe(token_digest)
+        with stripe.lock:
+            record = stripe.records.get(token_digest)
+            if record is not None and record.max_time <= current_time:
+                del stripe.records[token_digest]
+                record = None
+        return record
+    
+    async def get(self, token: str, current_time: datetime) -> Optional[SessionRecord]:
+        """
+        Get the session from its stripe.
+        """
+        return self._get_by_digest(hash_token(token), current_time)
+    
+    async def get_latest_for_user(self, user_pk: int, current_time: datetime) -> Optional[SessionRecord]:
+        """
+        Follow the user's latest digest to its session.
+        """
+        stripe = self._user_stripe(user_pk)
+        with stripe.lock:
+            token_digest = stripe.latest_by_user.get(user_pk)
+        if token_digest is None:
+            return None
+        return self._get_by_digest(token_digest, current_time)
+    
+    async def delete(self, token: str) -> bool:
+        """
+        Remove the session and, if it was the user's latest, the user's entry.
+        """
+        token_digest = hash_token(token)
+        stripe = self._record_stripe(token_digest)
+        with stripe.lock:
+            record = stripe.records.pop(token_digest, None)
+        if record is None:
+            return False
+        stripe = self._user_stripe(record.user_pk)
+        with stripe.lock:
+            if stripe.latest_by_user.get(record.user_pk) == token_digest:
+                del stripe.latest_by_user[record.user_pk]
+        return True
+    
+    async def extend_sessions(self, max_times: Dict[bytes, datetime], current_time: datetime) -> int:
+        """
+        Replace the max_time of each stored session under its stripe's lock.
+        """
+        extended = 0
+        for token_digest, max_time in max_times.items():
+            stripe = self._record_stripe(token_digest)
+            with stripe.lock:
+                record = stripe.records.get(token_digest)
+                if record is not None and current_time < record.max_time < max_time:
+                    stripe.records[token_digest] = replace(record, max_time=max_time)
+                    extended += 1
+        return extended
+    
+    async def purge_expired(self, current_time: datetime) -> int:
+        """
+        Remove expired sessions stripe by stripe, then their users' entries.
+        """
+        expired: List[SessionRecord] = []
+        for stripe in self._stripes:
+            with stripe.lock:
+                for digest, record in list(stripe.records.items()):
+                    if record.max_time <= current_time:
+                        expired.append(stripe.records.pop(digest))
+        for record in expired:
+            stripe = self._user_stripe(record.user_pk)
+            with stripe.lock:
+                if stripe.latest_by_user.get(record.user_pk) == record.token_digest:
+                    del stripe.latest_by_user[record.user_pk]
+        return len(expired)
+    
+    def clear(self) -> None:
+        """
+        Remove every session.
+        """
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.records.clear()
+                stripe.latest_by_user.clear()
+
+
+def create_redis_client(url: str, pool_size: int) -> "redis_asyncio.Redis":
+    """
+    Create a redis.asyncio client for the session store.
+    
+    Commands wait for a free connection once pool_size are open, and a
+    command whose connection fails or times out is retried on a new
+    connection with exponential backoff.
+    
+    Args:
+        url: Server URL, redis://[:password@]host[:port][/db].
+        pool_size: Maximum open connections.
+        
+    Returns:
+        Client; no connection is opened yet.
+        
+    Raises:
+        RuntimeError: If the redis package is not installed.
+    """
+    if redis_asyncio is None:
+        raise RuntimeError('The "redis" session store requires the redis package (pip install redis)')
+    pool = redis_asyncio.BlockingConnectionPool.from_url(
+        url,
+        max_connections=pool_size,
+        retry=Retry(ExponentialBackoff(cap=1.0, base=0.01), REDIS_RETRIES),
+        retry_on_error=[RedisConnectionError, RedisTimeoutError]
+    )
+    return redis_asyncio.Redis(connection_pool=pool)
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Sessions in Redis, through the redis package's asyncio client.
+    
+    Each session is a JSON value under ``session:<digest>`` and each user's
+    latest token digest sits under ``user_session:<user_pk>``; both keys
+    are written in one round trip and expire at the session's max_time
+    (SET ... PXAT, Redis 6.2+), so the server purges them itself. Sessions
+    are shared by every worker and survive restarts.
+    """
+    
+    def __init__(
+        self,
+        client: Optional["redis_asyncio.Redis"] = None,
+        url: str = settings.redis_url,
+        pool_size: int = settings.redis_pool_size
+    ):
+        """
+        Initialize the store. The client is created on first use.
+        
+        Args:
+            client: redis.asyncio client (defaults to one for url).
+            url: Server URL, used when no client is given.
+            pool_size: Maximum open connections, used when no client is given.
+        """
+        self._client = client
+        self._extend_user_session = None
+        self.url = url
+        self.pool_size = pool_size
+    
+    @property
+    def client(self) -> "redis_asyncio.Redis":
+        """
+        The Redis client, created on first use.
+        """
+        if self._client is None:
+            self._client = create_redis_client(self.url, self.pool_size)
+        return self._client
+    
+    @property
+    def extend_user_session(self) -> "redis_asyncio.client.AsyncScript":
+        """
+        EXTEND_USER_SESSION_SCRIPT registered with the client, run by EVALSHA.
+        """
+        if self._extend_user_session is None:
+            self._extend_user_session = self.client.register_script(EXTEND_USER_SESSION_SCRIPT)
+        return self._extend_user_session
+    
+    @staticmethod
+    def _expires_at_ms(max_time: datetime) -> int:
+        """
+        Unix time in milliseconds of a naive UTC timestamp.
+        """
+        return int((max_time - EPOCH).total_seconds() * 1000)
+    
+    async def add(
+        self,
+        token: str,
+        user_pk: int,
+        user_id: str,
+        start_time: datetime,
+        max_time: datetime
+    ) -> None:
+        """
+        Write the session and the user's latest digest in one round trip.
+        """
+        token_digest = hash_token(token)
+        value = json.dumps({
+            "user_pk": user_pk,
+            "user_id": user_id,
+            "start_time": start_time.isoformat(),
+            "max_time": max_time.isoformat(),
+        })
+        expires_at_ms = self._expires_at_ms(max_time)
+        async with self.client.pipeline(transaction=False) as pipeline:
+            pipeline.set(f"session:{token_digest.hex()}", value, pxat=expires_at_ms)
+            pipeline.set(f"user_session:{user_pk}", token_digest.hex(), pxat=expires_at_ms)
+            await pipeline.execute()
+    
+    async def _get_by_digest(self, token_digest: bytes, current_time: datetime) -> Optional[SessionRecord]:
+        """
+        Get and decode an unexpired session by digest.
+        """
+        value = await self.client.get(f"session:{token_digest.hex()}")
+        return self._decode(value, token_digest, current_time)
+    
+    @staticmethod
+    def _decode(value: Optional[bytes], token_digest: bytes, current_time: datetime) -> Optional[SessionRecord]:
+        """
+        Decode a stored session value, or None if it is missing or expired.
+        """
+        if value is None:
+            return None
+        fields = json.loads(value)
+        record = SessionRecord(
+            fields["user_pk"],
+            fields["user_id"],
+            datetime.fromisoformat(fields["start_time"]),
+            datetime.fromisoformat(fields["max_time"]),
+            token_digest
+        )
+        # The server's clock decides expiry; don't trust it past our own
+        if record.max_time <= current_time:
+            return None
+        return record
+    
+    async def get(self, token: str, current_time: datetime) -> Optional[SessionRecord]:
+        """
+        Get the session with one GET.
+        """
+        return await self._get_by_digest(hash_token(token), current_time)
+    
+    async def get_many(self, tokens: List[str], current_time: datetime) -> Dict[str, SessionRecord]:
+        """
+        Get the sessions with one MGET.
+        """
+        if not tokens:
+            return {}
+        digests = [hash_token(token) for token in tokens]
+        values = await self.client.mget([f"session:{digest.hex()}" for digest in digests])
+        sessions = {}
+        for token, digest, value in zip(tokens, digests, values):
+            session = self._decode(value, digest, current_time)
+            if session is not None:
+                sessions[token] = session
+        return sessions
+    
+    async def get_latest_for_user(self, user_pk: int, current_time: datetime) -> Optional[SessionRecord]:
+        """
+        Follow the user's latest digest to its session (two GETs).
+        """
+        token_digest = await self.client.get(f"user_session:{user_pk}")
+        if token_digest is None:
+            return None
+        return await self._get_by_digest(bytes.fromhex(token_digest.decode("ascii")), current_time)
+    
+    async def delete(self, token: str) -> bool:
+        """
+        Delete the session key.
+        """
+        # A stale user_session key left behind just resolves to no session
+        return await self.client.delete(f"session:{hash_token(token).hex()}") > 0
+    
+    async def extend_sessions(self, max_times: Dict[bytes, datetime], current_time: datetime) -> int:
+        """
+        Rewrite the sessions with their new max_time and expiry in two round trips.
+        
+        The values are read with one MGET and written back in one pipeline.
+        SET XX only replaces keys that still exist, so a session deleted in
+        between is not brought back, and the user's pointer is only given
+        the new expiry while it still names the extended session.
+        """
+        digests = list(max_times)
+        values = await self.client.mget([f"session:{digest.hex()}" for digest in digests])
+        async with self.client.pipeline(transaction=False) as pipeline:
+            for digest, value in zip(digests, values):
+                session = self._decode(value, digest, current_time)
+                if session is None or session.max_time >= max_times[digest]:
+                    continue
+                fields = json.loads(value)
+                fields["max_time"] = max_times[digest].isoformat()
+                expires_at_ms = self._expires_at_ms(max_times[digest])
+                pipeline.set(f"session:{digest.hex()}", json.dumps(fields), pxat=expires_at_ms, xx=True)
+                await self.extend_user_session(
+                    keys=[f"user_session:{session.user_pk}"],
+                    args=[digest.hex(), expires_at_ms],
+                    client=pipeline
+                )
+            if not len(pipeline):
+                return 0
+            replies = await pipeline.execute()
+        return sum(1 for reply in replies[::2] if reply)
+    
+    async def close(self) -> None:
+        """
+        Close the client and its connection pool, if the client was created.
+        """
+        if self._client is not None:
+            await self._client.aclose(close_connection_pool=True)
+            self._client = None
+            self._extend_user_session = None
+
+
+memory_session_store = MemorySessionStore(stripes=settings.session_store_stripes)
+
+redis_session_store = RedisSessionStore()
+
+
+def get_session_store(db: AsyncSession, storage: Optional[str] = None) -> SessionStore:
+    """
+    Get the session store selected by configuration.
+    
+    Args:
+        db: Request-scoped async database session, used by the SQL stores.
+        storage: "table", "partitioned", "memory" or "redis" (defaults to
+            settings.session_storage).
+            
+    Returns:
+        The store. Memory and Redis stores are shared process-wide.
+    """
+    storage = storage or settings.session_storage
+    if storage == "memory":
+        return memory_session_store
+    if storage == "redis":
+        return redis_session_store
+    if storage == "partitioned":
+        return SqlSessionStore(AsyncPartitionedSessionRepository(db))
+    return SqlSessionStore(AsyncSessionRepository(db))
@@ -0,0 +1,96 @@
+"""
+Hot repository queries, built once and executed with bound parameters.
+
+Building a select() with its options and criteria, then generating its
+cache key, costs more Python per call than running the already compiled
+SQL. These statements are constructed at import and their cache keys are
+memoized on first execution, so a call only binds its parameters and
+looks the statement up in the engine's compiled cache.
+"""
+from sqlalchemy import and_, bindparam, delete, exists, select
+from sqlalchemy.orm import joinedload
+from sqlalchemy.sql import FromClause, Select
+
+from app.models import Session, User
+
+USER_BY_USER_ID = select(User).where(User.user_id == bindparam("user_id"))
+
+USER_EXISTS = select(exists().where(User.user_id == bindparam("user_id")))
+
+SESSION_BY_DIGEST = select(Session).options(
+    joinedload(Session.user)
+).where(Session.token_digest == bindparam("token_digest"))
+
+SESSION_INFO_BY_DIGEST = select(
+    User.user_id,
+    Session.start_time,
+    Session.max_time
+).join(User, Session.user_id == User.id).where(
+    and_(
+        Session.token_digest == bindparam("token_digest"),
+        Session.max_time > bindparam("current_time")
+    )
+)
+
+SESSIONS_INFO_BY_DIGESTS = select(
+    Session.token_digest,
+    User.user_id,
+    Session.start_time,
+    Session.max_time
+).join(User, Session.user_id == User.id).where(
+    and_(
+        Session.token_digest.in_(bindparam("token_digests", expanding=True)),
+        Session.max_time > bindparam("current_time")
+    )
+)
+
+SESSION_VALID_BY_DIGEST = select(
+    exists().where(
+        and_(
+            Session.token_digest == bindparam("token_digest"),
+            Session.max_time > bindparam("current_time")
+        )
+    )
+)
+
+LATEST_SESSION_BY_USER = select(
+    Session.token_digest,
+    Session.start_time,
+    Session.max_time
+).where(
+    and_(
+        Session.user_id == bindparam("user_pk"),
+        Session.max_time > bindparam("current_time")
+    )
+).order_by(Session.start_time.desc()).limit(1)
+
+DELETE_SESSION_BY_DIGEST = delete(Session).where(Session.token_digest == bindparam("token_digest"))
+
+
+def user_with_latest_session(sessions: FromClause) -> Select:
+    """
+    Build the signin lookup of a user and their latest valid session.
+    
+    Args:
+        sessions: Selectable with the sessions table's columns to join.
+        
+    Returns:
+        Statement taking user_id and current_time parameters.
+    """
+    return select(
+        User,
+        sessions.c.token_digest,
+        sessions.c.start_time,
+        sessions.c.max_time
+    ).outerjoin(
+        sessions,
+        and_(
+            sessions.c.user_id == User.id,
+            sessions.c.max_time > bindparam("current_time")
+        )
+    ).where(
+        User.user_id == bindparam("user_id")
+    ).order_by(sessions.c.start_time.desc()).limit(1)
+
+
+USER_WITH_LATEST_SESSION = user_with_latest_session(Session.__table__)
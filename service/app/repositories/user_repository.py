@@ -2,9 +2,9 @@
 Repository for user database operations.
 """
 from sqlalchemy.orm import Session as DBSession
-from sqlalchemy import select
 from typing import Optional
 from app.models import User
+from app.repositories.statements import USER_BY_USER_ID, USER_EXISTS
 
 
 class UserRepository:
@@ -48,13 +48,11 @@ class UserRepository:
         Returns:
             User object if found, None otherwise.
         """
-        stmt = select(User).where(User.user_id == user_id)
-        result = self.db.scalars(stmt).first()
-        return result
+        return self.db.scalars(USER_BY_USER_ID, {"user_id": user_id}).first()
     
     def user_exists(self, user_id: str) -> bool:
         """
-        Check if a user exists by user_id.
+        Check if a user exists by user_id with an EXISTS query.
         
         Args:
             user_id: User identifier.
@@ -62,6 +60,5 @@ class UserRepository:
         Returns:
             True if user exists, False otherwise.
         """
-        user = self.get_user_by_user_id(user_id)
-        return user is not None
+        return self.db.scalar(USER_EXISTS, {"user_id": user_id})
 
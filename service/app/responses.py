@@ -0,0 +1,78 @@
+"""
+JSON response classes and the fast response path for route handlers.
+"""
+import json
+from datetime import datetime
+from typing import Any, Type
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+def get_response_class(serializer: str = settings.response_serializer) -> Type[JSONResponse]:
+    """
+    Select the JSON response class for a configured serializer.
+    
+    Args:
+        serializer: "orjson" or "json".
+        
+    Returns:
+        ORJSONResponse if requested and orjson is installed, JSONResponse otherwise.
+    """
+    if serializer == "orjson" and orjson is not None:
+        return ORJSONResponse
+    return JSONResponse
+
+
+ResponseClass = get_response_class()
+
+
+def json_response(content: Any, status_code: int = 200) -> JSONResponse:
+    """
+    Serialize plain response data once, with the configured response class.
+    
+    Returning a Response from a handler makes FastAPI skip response_model
+    validation and serialization, so the data is not copied into a model,
+    validated and dumped again. response_model is still used for the
+    OpenAPI schema.
+    
+    Args:
+        content: JSON-compatible data; datetimes are allowed.
+        status_code: HTTP status code.
+        
+    Returns:
+        Rendered JSON response.
+    """
+    if ResponseClass is JSONResponse:
+        # The standard library encoder cannot handle datetimes; flat dicts,
+        # the common case, are converted without jsonable_encoder's overhead
+        if isinstance(content, dict) and not any(isinstance(value, (dict, list)) for value in content.values()):
+            content = {
+                key: value.isoformat() if isinstance(value, datetime) else value
+                for key, value in content.items()
+            }
+        else:
+            content = jsonable_encoder(content)
+    return ResponseClass(content, status_code=status_code)
+
+
+def ndjson_line(content: Any) -> bytes:
+    """
+    Serialize one NDJSON line with the configured serializer.
+    
+    Args:
+        content: JSON-compatible data; datetimes are allowed.
+        
+    Returns:
+        The JSON document followed by a newline.
+    """
+    if ResponseClass is ORJSONResponse:
+        return orjson.dumps(content) + b"\n"
+    return json.dumps(jsonable_encoder(content)).encode("utf-8") + b"\n"
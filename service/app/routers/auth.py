@@ -1,45 +1,57 @@
 """
 Authentication routes for user sign up and sign in.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session as DBSession
-from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from typing import Annotated, AsyncIterator, List, Optional
+from datetime import datetime
 
-from app.database import get_db
-from app.schemas import UserSignUpRequest, UserSignUpResponse, UserSignInRequest, SessionResponse
-from app.repositories.user_repository import UserRepository
-from app.services.password_service import PasswordService
-from app.services.session_service import SessionService
+from app.config import settings
+from app.database import get_async_db, get_async_session_factory
+from app.responses import json_response, ndjson_line
+from app.schemas import (
+    UserSignUpRequest,
+    UserSignUpResponse,
+    UserSignInRequest,
+    SessionResponse,
+    IntrospectRequest,
+    IntrospectResponse
+)
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.services.hashing_executor import hashing_executor
+from app.services.async_session_service import AsyncSessionService
+from app.services.signin_throttle import signin_throttle
+from app.services.stateless_session_service import stateless_session_service
+from app.services.user_id_filter import user_id_filter
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
-password_service = PasswordService()
-
 
-def get_user_repository(db: Annotated[DBSession, Depends(get_db)]) -> UserRepository:
+def get_user_repository(db: Annotated[AsyncSession, Depends(get_async_db)]) -> AsyncUserRepository:
     """
     Dependency to get user repository.
     
     Args:
-        db: Database session.
+        db: Async database session.
         
     Returns:
-        UserRepository instance.
+        AsyncUserRepository instance.
     """
-    return UserRepository(db)
+    return AsyncUserRepository(db)
 
 
-def get_session_service(db: Annotated[DBSession, Depends(get_db)]) -> SessionService:
+def get_session_service(db: Annotated[AsyncSession, Depends(get_async_db)]) -> AsyncSessionService:
     """
     Dependency to get session service.
     
     Args:
-        db: Database session.
+        db: Async database session.
         
     Returns:
-        SessionService instance.
+        AsyncSessionService instance.
     """
-    return SessionService(db)
+    return AsyncSessionService(db)
 
 
 @router.post(
@@ -49,11 +61,15 @@ def get_session_service(db: Annotated[DBSession, Depends(get_db)]) -> SessionSer
 )
 async def signup(
     request: UserSignUpRequest,
-    user_repository: Annotated[UserRepository, Depends(get_user_repository)]
-) -> UserSignUpResponse:
+    user_repository: Annotated[AsyncUserRepository, Depends(get_user_repository)]
+) -> JSONResponse:
     """
     Sign up a new user.
     
+    A user_id the filter has never seen goes straight to hashing and the
+    insert. A possible hit is checked against the database first, so a
+    taken user_id is rejected without spending an Argon2 hash.
+    
     Args:
         request: Sign up request with user_id and password.
         user_repository: User repository instance.
@@ -63,19 +79,30 @@ async def signup(
         
     Raises:
         HTTPException: If user already exists.
+        HashingQueueFullError: If password hashing capacity is exhausted.
     """
-    if user_repository.user_exists(request.user_id):
+    if user_id_filter.might_contain(request.user_id):
+        if await user_repository.user_exists(request.user_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User already exists"
+            )
+        user_id_filter.record_false_positive()
+    
+    # The insert still guards against users created by other processes
+    password_hash = await hashing_executor.hash_password(request.password)
+    created_id = await user_repository.create_user_if_absent(request.user_id, password_hash)
+    user_id_filter.add(request.user_id)
+    
+    if created_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User already exists"
         )
     
-    password_hash = password_service.hash_password(request.password)
-    user = user_repository.create_user(request.user_id, password_hash)
-    
-    return UserSignUpResponse(
-        user_id=user.user_id,
-        message="User created successfully"
+    return json_response(
+        {"user_id": request.user_id, "message": "User created successfully"},
+        status_code=status.HTTP_201_CREATED
     )
 
 
@@ -86,14 +113,24 @@ async def signup(
 )
 async def signin(
     request: UserSignInRequest,
-    user_repository: Annotated[UserRepository, Depends(get_user_repository)],
-    session_service: Annotated[SessionService, Depends(get_session_service)]
-) -> SessionResponse:
+    http_request: Request,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    user_repository: Annotated[AsyncUserRepository, Depends(get_user_repository)],
+    session_service: Annotated[AsyncSessionService, Depends(get_session_service)]
+) -> JSONResponse:
     """
     Sign in a user and create a session.
     
+    Attempts are checked against the sign-in throttle before the user is
+    looked up. In database session mode the user is loaded together with
+    their latest valid session; stateless mode loads only the user. If the
+    stored hash was made with outdated Argon2 parameters, it is replaced
+    in the same transaction as the new session.
+    
     Args:
         request: Sign in request with user_id and password.
+        http_request: Raw request, for the client address.
+        db: Async database session shared with the repository and service.
         user_repository: User repository instance.
         session_service: Session service instance.
         
@@ -102,29 +139,148 @@ async def signin(
         
     Raises:
         HTTPException: If user not found or password is incorrect.
+        HashingQueueFullError: If password hashing capacity is exhausted.
+        RateLimitExceededError: If the client IP or user_id is throttled.
     """
-    user = user_repository.get_user_by_user_id(request.user_id)
+    client_ip = signin_throttle.client_address(
+        http_request.client.host if http_request.client else None,
+        http_request.headers.get("x-forwarded-for")
+    )
+    signin_throttle.check(client_ip, request.user_id)
+    
+    if settings.session_mode == "stateless":
+        user = await user_repository.get_user_by_user_id(request.user_id)
+        existing_session = None
+    else:
+        user, existing_session = await session_service.get_user_with_valid_session(
+            user_repository,
+            request.user_id,
+            datetime.utcnow()
+        )
     
     if user is None:
+        signin_throttle.record_failure(client_ip, request.user_id)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid user_id or password"
         )
     
-    if not password_service.verify_password(request.password, user.password_hash):
+    matches, new_password_hash = await hashing_executor.verify_and_rehash(
+        request.password,
+        user.password_hash
+    )
+    
+    if not matches:
+        signin_throttle.record_failure(client_ip, request.user_id)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid user_id or password"
         )
     
-    token = session_service.create_session(user.id)
-    session_info = session_service.get_session_info(token)
+    signin_throttle.record_success(request.user_id)
     
+    if new_password_hash is not None:
+        await user_repository.update_password_hash(user.id, new_password_hash)
+    
+    if settings.session_mode == "stateless":
+        session_info = stateless_session_service.create_session_info(user.user_id)
+    else:
+        session_info = await session_service.create_session_info(user, existing_session)
+    
+    # A new session's insert already committed the rehash; otherwise commit it here
+    if new_password_hash is not None:
+        await db.commit()
+    
+    return json_response(session_info)
+
+
+def introspection_result(token: str, session_info: Optional[dict]) -> dict:
+    """
+    Build the introspection result for one token.
+    
+    Args:
+        token: Session token, as sent.
+        session_info: The token's session info, or None if it is not valid.
+        
+    Returns:
+        Result dictionary matching TokenIntrospection.
+    """
     if session_info is None:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create session"
-        )
+        return {"token": token, "active": False, "user_id": None, "max_time": None}
+    return {
+        "token": token,
+        "active": True,
+        "user_id": session_info["user_id"],
+        "max_time": session_info["max_time"]
+    }
+
+
+async def introspect_chunks(
+    tokens: List[str],
+    session_service: AsyncSessionService
+) -> AsyncIterator[List[dict]]:
+    """
+    Resolve tokens chunk by chunk, one store query per chunk.
     
-    return SessionResponse(**session_info)
+    Args:
+        tokens: Session tokens.
+        session_service: Session service instance.
+        
+    Yields:
+        Introspection results of each chunk, in request order.
+    """
+    chunk_size = settings.introspect_chunk_size
+    for start in range(0, len(tokens), chunk_size):
+        chunk = tokens[start:start + chunk_size]
+        if settings.session_mode == "stateless":
+            sessions_info = {token: stateless_session_service.get_session_info(token) for token in chunk}
+        else:
+            sessions_info = await session_service.get_sessions_info(chunk)
+        yield [introspection_result(token, sessions_info.get(token)) for token in chunk]
 
+
+@router.post(
+    "/introspect",
+    response_model=IntrospectResponse,
+    status_code=status.HTTP_200_OK
+)
+async def introspect(
+    request: IntrospectRequest,
+    http_request: Request,
+    session_factory: Annotated[async_sessionmaker, Depends(get_async_session_factory)]
+) -> Response:
+    """
+    Resolve a batch of session tokens for a gateway.
+    
+    Tokens are looked up in chunks of settings.introspect_chunk_size,
+    each with a single store query after the token cache. A client that
+    accepts application/x-ndjson gets one result line per token, streamed
+    as each chunk is resolved; otherwise all results are returned in one
+    JSON document. Either way the route opens a single database session
+    itself, since a streamed body outlives the request's dependencies.
+    
+    Args:
+        request: Introspection request with the tokens.
+        http_request: Raw request, for the Accept header.
+        session_factory: Async session factory.
+        
+    Returns:
+        JSON or NDJSON response with one result per token, in request order.
+    """
+    if "application/x-ndjson" in http_request.headers.get("accept", ""):
+        async def lines() -> AsyncIterator[bytes]:
+            async with session_factory() as db:
+                session_service = AsyncSessionService(db)
+                async for results in introspect_chunks(request.tokens, session_service):
+                    yield b"".join(ndjson_line(result) for result in results)
+        
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+    
+    async with session_factory() as db:
+        session_service = AsyncSessionService(db)
+        results = [
+            result
+            async for results in introspect_chunks(request.tokens, session_service)
+            for result in results
+        ]
+    return json_response({"results": results})
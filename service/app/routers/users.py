@@ -0,0 +1,70 @@
+"""
+User management routes.
+"""
+import json
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Annotated
+
+from app.config import settings
+from app.database import get_async_db
+from app.services.user_import_service import UserImportService, iter_lines
+
+router = APIRouter(prefix="/users", tags=["users"])
+
+
+def get_user_import_service(db: Annotated[AsyncSession, Depends(get_async_db)]) -> UserImportService:
+    """
+    Dependency to get user import service.
+    
+    Args:
+        db: Async database session.
+        
+    Returns:
+        UserImportService instance.
+    """
+    return UserImportService(db)
+
+
+@router.post(
+    "/import",
+    response_class=Response,
+    status_code=status.HTTP_200_OK
+)
+async def import_users(
+    request: Request,
+    user_import_service: Annotated[UserImportService, Depends(get_user_import_service)]
+) -> Response:
+    """
+    Bulk import users from an NDJSON request body.
+    
+    Each line is {"user_id": ..., "password": ...} or
+    {"user_id": ..., "password_hash": "$argon2..."}. The body is consumed
+    as a stream and imported batch by batch, so its size is not limited by
+    memory. The response has one NDJSON line per rejected record followed
+    by a summary line.
+    
+    Args:
+        request: Incoming request with an NDJSON body.
+        user_import_service: User import service instance.
+        
+    Returns:
+        NDJSON response.
+        
+    Raises:
+        HTTPException: If bulk import is disabled.
+    """
+    if not settings.user_import_enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not Found"
+        )
+    
+    # The body must be fully read here: a StreamingResponse would compete
+    # with Starlette's disconnect listener for the request stream
+    results = [
+        json.dumps(result) + "\n"
+        async for result in user_import_service.import_users(iter_lines(request.stream()))
+    ]
+    return Response(content="".join(results), media_type="application/x-ndjson")
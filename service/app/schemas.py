@@ -1,9 +1,10 @@
 """
 Pydantic models for request and response validation.
 """
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
 from datetime import datetime
+from app.config import settings
 
 
 class UserSignUpRequest(BaseModel):
@@ -42,6 +43,31 @@ class UserSignInRequest(BaseModel):
     password: str = Field(..., min_length=1, description="User password")
 
 
+class UserImportRecord(BaseModel):
+    """
+    One NDJSON line of a bulk user import.
+    
+    Exactly one of password and password_hash must be given.
+    
+    Attributes:
+        user_id: User identifier.
+        password: Plain text password, hashed during import.
+        password_hash: Existing Argon2 hash, stored as is.
+    """
+    user_id: str = Field(..., min_length=1, description="User identifier")
+    password: Optional[str] = Field(None, min_length=1, description="User password")
+    password_hash: Optional[str] = Field(None, min_length=1, description="Argon2 password hash")
+    
+    @model_validator(mode="after")
+    def check_one_credential(self) -> "UserImportRecord":
+        """
+        Ensure exactly one of password and password_hash is set.
+        """
+        if (self.password is None) == (self.password_hash is None):
+            raise ValueError("Exactly one of password or password_hash is required")
+        return self
+
+
 class SessionResponse(BaseModel):
     """
     Response model for session information.
@@ -60,3 +86,43 @@ class SessionResponse(BaseModel):
     class Config:
         from_attributes = True
 
+
+class IntrospectRequest(BaseModel):
+    """
+    Request model for batch token introspection.
+    
+    Attributes:
+        tokens: Session tokens to resolve.
+    """
+    tokens: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.introspect_max_tokens,
+        description="Session tokens"
+    )
+
+
+class TokenIntrospection(BaseModel):
+    """
+    Introspection result for one token.
+    
+    Attributes:
+        token: Session token, as sent.
+        active: Whether the token belongs to a valid session.
+        user_id: User identifier (None if inactive).
+        max_time: Session expiration timestamp (None if inactive).
+    """
+    token: str
+    active: bool
+    user_id: Optional[str] = None
+    max_time: Optional[datetime] = None
+
+
+class IntrospectResponse(BaseModel):
+    """
+    Response model for batch token introspection.
+    
+    Attributes:
+        results: One result per requested token, in request order.
+    """
+    results: List[TokenIntrospection]
@@ -0,0 +1,244 @@
+"""
+Asyncio session management service.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple, Union
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import User
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.repositories.rows import SessionTokenRow
+from app.repositories.session_stores import SessionRecord, SessionStore, get_session_store
+from app.session_tokens import new_session_token
+from app.services.session_cache import SessionCache, session_cache
+from app.services.session_renewer import SessionRenewer, session_renewer
+from app.config import settings
+
+
+class AsyncSessionService:
+    """
+    Asyncio counterpart of SessionService.
+    
+    Sessions are kept in the SessionStore selected by
+    settings.session_storage: the sessions table, its time partitions,
+    process memory or a Redis server. With sliding expiry enabled, every
+    validation may renew the session through the SessionRenewer.
+    """
+    
+    def __init__(
+        self,
+        db: AsyncSession,
+        cache: SessionCache = session_cache,
+        storage: Optional[str] = None,
+        renewer: SessionRenewer = session_renewer
+    ):
+        """
+        Initialize session service with async database session.
+        
+        Args:
+            db: Async database session instance.
+            cache: Token cache consulted before the store.
+            storage: "table", "partitioned", "memory" or "redis" (defaults
+                to settings.session_storage).
+            renewer: Sliding expiry renewals of validated sessions.
+        """
+        self.db = db
+        self.store: SessionStore = get_session_store(db, storage)
+        self.cache = cache
+        self.renewer = renewer
+    
+    async def get_user_with_valid_session(
+        self,
+        user_repository: AsyncUserRepository,
+        user_id: str,
+        current_time: datetime
+    ) -> Tuple[Optional[User], Optional[Union[SessionTokenRow, SessionRecord]]]:
+        """
+        Get a user and their latest valid session.
+        
+        Database stores are joined in a single query; other stores are
+        read after the user is loaded.
+        
+        Args:
+            user_repository: Repository on the same database session.
+            user_id: User identifier.
+            current_time: Current timestamp for session validation.
+            
+        Returns:
+            Tuple of the user (None if not found) and their latest unexpired
+            session (None if there is none).
+        """
+        sessions = self.store.valid_sessions(current_time)
+        if sessions is not None:
+            return await user_repository.get_user_with_valid_session(user_id, current_time, sessions)
+        
+        user = await user_repository.get_user_by_user_id(user_id)
+        if user is None:
+            return None, None
+        return user, await self.store.get_latest_for_user(user.id, current_time)
+    
+    async def create_session(self, user_id: int) -> str:
+        """
+        Create a new session for a user.
+        If a valid session exists and its token is still in the token
+        cache, return the existing token. Otherwise, create a new session.
+        
+        Args:
+            user_id: User ID.
+            
+        Returns:
+            Session token.
+        """
+        user = await self.db.get(User, user_id)
+        existing_session = await self.store.get_latest_for_user(user_id, datetime.utcnow())
+        session_info = await self.create_session_info(user, existing_session)
+        return session_info["token"]
+    
+    async def create_session_info(
+        self,
+        user: User,
+        existing_session: Optional[Union[SessionTokenRow, SessionRecord]]
+    ) -> dict:
+        """
+        Get session information for a signed-in user, creating a session if needed.
+        
+        The info is built from in-memory values, so reusing a session costs
+        no lookup and creating one costs a single store write. Stores only
+        keep token digests, so an existing session is reused only while its
+        token is in this process's token cache; otherwise a new one is made.
+        
+        Args:
+            user: Authenticated user.
+            existing_session: The user's latest valid session, as returned by
+                get_user_with_valid_session.
+                
+        Returns:
+            Dictionary with session info.
+        """
+        token = None
+        if existing_session is not None:
+            token = self.cache.get_token(existing_session.token_digest)
+        
+        if token is not None:
+            session_info = {
+                "token": token,
+                "user_id": user.user_id,
+                "start_time": existing_session.start_time,
+                "max_time": existing_session.max_time
+            }
+        else:
+            token = new_session_token()
+            start_time = datetime.utcnow()
+            session_info = {
+                "token": token,
+                "user_id": user.user_id,
+                "start_time": start_time,
+                "max_time": start_time + timedelta(seconds=settings.session_max_age_seconds)
+            }
+            await self.store.add(
+                token=token,
+                user_pk=user.id,
+                user_id=user.user_id,
+                start_time=session_info["start_time"],
+                max_time=session_info["max_time"]
+            )
+        
+        self.cache.set(session_info)
+        return session_info
+    
+    async def get_session_info(self, token: str) -> Optional[dict]:
+        """
+        Get session information by token.
+        
+        Args:
+            token: Session token.
+            
+        Returns:
+            Dictionary with session info if valid, None otherwise.
+        """
+        current_time = datetime.utcnow()
+        session_info = self.cache.get(token, current_time)
+        if session_info is not None:
+            return self._renew(session_info, current_time, cached=True)
+        
+        session = await self.store.get(token, current_time)
+        
+        if session is None:
+            return None
+        
+        session_info = {
+            "token": token,
+            "user_id": session.user_id,
+            "start_time": session.start_time,
+            "max_time": session.max_time
+        }
+        return self._renew(session_info, current_time, cached=False)
+    
+    def _renew(self, session_info: dict, current_time: datetime, cached: bool) -> dict:
+        """
+        Queue a sliding renewal of a validated session and keep the cache current.
+        
+        Args:
+            session_info: Session info of a valid session.
+            current_time: Current timestamp.
+            cached: Whether session_info came from the cache.
+            
+        Returns:
+            The session info, with its renewed max_time if it was renewed.
+        """
+        renewed = self.renewer.renew(session_info, current_time)
+        if renewed is not None:
+            session_info = renewed
+        elif cached:
+            return session_info
+        self.cache.set(session_info)
+        return session_info
+    
+    async def get_sessions_info(self, tokens: List[str]) -> Dict[str, dict]:
+        """
+        Get session information for many tokens.
+        
+        Tokens missing from the cache are looked up together, with a
+        single store round trip.
+        
+        Args:
+            tokens: Session tokens.
+            
+        Returns:
+            Session info dictionaries keyed by token, for valid tokens only.
+        """
+        current_time = datetime.utcnow()
+        sessions_info = {}
+        missing = []
+        for token in tokens:
+            session_info = self.cache.get(token, current_time)
+            if session_info is not None:
+                sessions_info[token] = self._renew(session_info, current_time, cached=True)
+            else:
+                missing.append(token)
+        
+        if missing:
+            for token, session in (await self.store.get_many(missing, current_time)).items():
+                session_info = {
+                    "token": token,
+                    "user_id": session.user_id,
+                    "start_time": session.start_time,
+                    "max_time": session.max_time
+                }
+                sessions_info[token] = self._renew(session_info, current_time, cached=False)
+        return sessions_info
+    
+    async def delete_session(self, token: str) -> bool:
+        """
+        Delete a session by token and drop it from the cache.
+        
+        Args:
+            token: Session token.
+            
+        Returns:
+            True if a session was deleted, False if none matched.
+        """
+        deleted = await self.store.delete(token)
+        
+        # Invalidate after the delete commits so a concurrent lookup cannot re-cache it
+        self.cache.invalidate(token)
+        return deleted
@@ -0,0 +1,312 @@
+"""
+Process pool executor for Argon2 password hashing and verification.
+"""
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from app.config import settings
+from app.metrics import password_hashing_duration
+from app.services.password_service import PasswordService
+
+_worker_password_service: Optional[PasswordService] = None
+
+
+class HashingQueueFullError(Exception):
+    """
+    Raised when the hashing executor has no free slot for a new job.
+    """
+
+
+def _init_worker() -> None:
+    """
+    Create the password service once per worker process.
+    """
+    global _worker_password_service
+    _worker_password_service = PasswordService()
+
+
+def _hash_password(password: str) -> Tuple[str, float]:
+    """
+    Hash a password inside a worker process.
+    
+    Returns:
+        Hashed password and the hashing time in seconds.
+    """
+    started = time.perf_counter()
+    password_hash = _worker_password_service.hash_password(password)
+    return password_hash, time.perf_counter() - started
+
+
+def _hash_passwords(passwords: List[str]) -> Tuple[List[str], float]:
+    """
+    Hash a chunk of passwords inside a worker process.
+    
+    Returns:
+        Hashed passwords and the total hashing time in seconds.
+    """
+    started = time.perf_counter()
+    password_hashes = [_worker_password_service.hash_password(password) for password in passwords]
+    return password_hashes, time.perf_counter() - started
+
+
+def _verify_password(password: str, password_hash: str) -> Tuple[bool, float]:
+    """
+    Verify a password inside a worker process.
+    
+    Returns:
+        Whether the password matches and the verification time in seconds.
+    """
+    started = time.perf_counter()
+    matches = _worker_password_service.verify_password(password, password_hash)
+    return matches, time.perf_counter() - started
+
+
+def _verify_and_rehash(password: str, password_hash: str) -> Tuple[Tuple[bool, Optional[str]], float]:
+    """
+    Verify a password and rehash outdated hashes inside a worker process.
+    
+    Returns:
+        Verification result with optional new hash, and the total time in seconds.
+    """
+    started = time.perf_counter()
+    result = _worker_password_service.verify_and_rehash(password, password_hash)
+    return result, time.perf_counter() - started
+
+
+def _warm_up() -> int:
+    """
+    Run one hash so the worker has loaded Argon2 and touched its memory.
+    
+    Returns:
+        Worker process ID.
+    """
+    _worker_password_service.hash_password("warm-up")
+    return os.getpid()
+
+
+class HashingExecutor:
+    """
+    Runs Argon2 hashing in a process pool so it never blocks the event loop.
+    
+    The number of jobs submitted but not yet completed is bounded: once
+    ``max_pending`` jobs are in flight, new submissions fail fast with
+    HashingQueueFullError instead of queuing without limit. A slot is held
+    until its job finishes in the pool, even if the caller awaiting it has
+    been cancelled, so the limit reflects the work the pool still has.
+    
+    Workers time each Argon2 call and send the duration back with the
+    result, since metrics recorded inside a worker process are never
+    scraped.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, max_pending: int = 64):
+        """
+        Initialize executor settings. The process pool is started lazily.
+        
+        Args:
+            max_workers: Number of worker processes (defaults to CPU count).
+            max_pending: Maximum number of queued and running jobs.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+    
+    @property
+    def pending(self) -> int:
+        """
+        Number of jobs currently queued or running.
+        """
+        return self._pending
+    
+    def _reserve(self, slots: int) -> None:
+        """
+        Take pending slots for jobs about to be submitted.
+        
+        Args:
+            slots: Number of jobs.
+            
+        Raises:
+            HashingQueueFullError: If fewer slots are free.
+        """
+        with self._pending_lock:
+            if self._pending + slots > self.max_pending:
+                raise HashingQueueFullError("Password hashing queue is full")
+            self._pending += slots
+    
+    def _release(self, slots: int) -> None:
+        """
+        Free pending slots.
+        
+        Args:
+            slots: Number of jobs.
+        """
+        with self._pending_lock:
+            self._pending -= slots
+    
+    def _job_done(self, future: Future) -> None:
+        """
+        Free a job's pending slot once the pool is done with it.
+        
+        Runs as the job future's done callback, from a pool thread.
+        """
+        self._release(1)
+    
+    def _start(self, function: Callable, *args) -> "asyncio.Future":
+        """
+        Submit one job holding a reserved slot until it finishes.
+        
+        Returns:
+            Awaitable for the job's result. Cancelling it cancels the job
+            only if the job has not started yet.
+        """
+        try:
+            future = self._get_executor().submit(function, *args)
+        except BaseException:
+            self._release(1)
+            raise
+        future.add_done_callback(self._job_done)
+        return asyncio.wrap_future(future)
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        Return the process pool, starting it on first use.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker
+            )
+        return self._executor
+    
+    async def _submit(self, operation: str, function: Callable, *args):
+        """
+        Run a function in the process pool, enforcing the pending limit.
+        
+        Args:
+            operation: Operation label for the hashing duration metric.
+            function: Worker function returning a result and its duration.
+            *args: Worker function arguments.
+            
+        Returns:
+            The worker function's result.
+            
+        Raises:
+            HashingQueueFullError: If the pending limit has been reached.
+        """
+        self._reserve(1)
+        result, duration = await self._start(function, *args)
+        password_hashing_duration.observe(duration, operation)
+        return result
+    
+    async def hash_password(self, password: str) -> str:
+        """
+        Hash a password using Argon2 in a worker process.
+        
+        Args:
+            password: Plain text password to hash.
+            
+        Returns:
+            Hashed password string.
+        """
+        return await self._submit("hash", _hash_password, password)
+    
+    async def hash_passwords(self, passwords: List[str]) -> List[str]:
+        """
+        Hash many passwords, spread over every worker process.
+        
+        The passwords are split into one chunk per worker, but never more
+        chunks than max_pending, and each chunk takes one pending slot. A
+        batch therefore always fits once the queue drains.
+        
+        Args:
+            passwords: Plain text passwords to hash.
+            
+        Returns:
+            Hashed password strings, in input order.
+            
+        Raises:
+            HashingQueueFullError: If there are not enough free pending slots.
+        """
+        if not passwords:
+            return []
+        
+        chunk_size = -(-len(passwords) // max(1, min(self.max_workers, self.max_pending)))
+        chunks = [passwords[index:index + chunk_size] for index in range(0, len(passwords), chunk_size)]
+        self._reserve(len(chunks))
+        jobs = []
+        for index, chunk in enumerate(chunks):
+            try:
+                jobs.append(self._start(_hash_passwords, chunk))
+            except BaseException:
+                # _start freed this chunk's slot; free those never submitted
+                self._release(len(chunks) - index - 1)
+                raise
+        hashed_chunks = await asyncio.gather(*jobs)
+        
+        password_hashes = []
+        for chunk_hashes, duration in hashed_chunks:
+            for _ in chunk_hashes:
+                password_hashing_duration.observe(duration / len(chunk_hashes), "hash")
+            password_hashes.extend(chunk_hashes)
+        return password_hashes
+    
+    async def verify_password(self, password: str, password_hash: str) -> bool:
+        """
+        Verify a password against its hash in a worker process.
+        
+        Args:
+            password: Plain text password to verify.
+            password_hash: Hashed password to compare against.
+            
+        Returns:
+            True if password matches, False otherwise.
+        """
+        return await self._submit("verify", _verify_password, password, password_hash)
+    
+    async def verify_and_rehash(self, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and rehash it if its cost parameters are outdated.
+        
+        Both steps run in the same worker job, so an upgrade takes a single
+        pending slot.
+        
+        Args:
+            password: Plain text password to verify.
+            password_hash: Hashed password to compare against.
+            
+        Returns:
+            Whether the password matches, and a replacement hash if the
+            stored one was made with different parameters (None otherwise).
+        """
+        return await self._submit("verify", _verify_and_rehash, password, password_hash)
+    
+    async def warm_up(self) -> None:
+        """
+        Start every worker process ahead of the first real job.
+        
+        One job per worker is submitted at once, which makes the pool
+        spawn all of its processes.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        await asyncio.gather(*(loop.run_in_executor(executor, _warm_up) for _ in range(self.max_workers)))
+    
+    def shutdown(self) -> None:
+        """
+        Stop the worker processes. The pool restarts on next use.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+hashing_executor = HashingExecutor(
+    max_workers=settings.hashing_workers or None,
+    max_pending=settings.hashing_max_pending
+)
@@ -1,8 +1,10 @@
 """
 Password hashing and verification service using Argon2.
 """
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
+from typing import Optional, Tuple
+from argon2 import PasswordHasher, extract_parameters
+from argon2.exceptions import InvalidHashError, VerifyMismatchError
+from app.config import settings
 
 
 class PasswordService:
@@ -10,11 +12,25 @@ class PasswordService:
     Service for password hashing and verification using Argon2 algorithm.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        time_cost: Optional[int] = None,
+        memory_cost: Optional[int] = None,
+        parallelism: Optional[int] = None
+    ):
         """
-        Initialize password hasher with default parameters.
+        Initialize password hasher with the configured cost parameters.
+        
+        Args:
+            time_cost: Argon2 iterations (defaults to settings).
+            memory_cost: Argon2 memory in KiB (defaults to settings).
+            parallelism: Argon2 lanes (defaults to settings).
         """
-        self.hasher = PasswordHasher()
+        self.hasher = PasswordHasher(
+            time_cost=time_cost or settings.argon2_time_cost,
+            memory_cost=memory_cost or settings.argon2_memory_cost,
+            parallelism=parallelism or settings.argon2_parallelism
+        )
     
     def hash_password(self, password: str) -> str:
         """
@@ -44,4 +60,53 @@ class PasswordService:
             return True
         except VerifyMismatchError:
             return False
-
+    
+    def needs_rehash(self, password_hash: str) -> bool:
+        """
+        Check whether a hash was made with different cost parameters.
+        
+        Args:
+            password_hash: Hashed password.
+            
+        Returns:
+            True if the hash should be replaced, False otherwise.
+        """
+        return self.hasher.check_needs_rehash(password_hash)
+    
+    def verify_and_rehash(self, password: str, password_hash: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and rehash it if its parameters are outdated.
+        
+        Lowering the configured cost is handled the same way as raising
+        it: any hash whose parameters differ is replaced.
+        
+        Args:
+            password: Plain text password to verify.
+            password_hash: Hashed password to compare against.
+            
+        Returns:
+            Whether the password matches, and a new hash if the stored one
+            should be replaced (None otherwise).
+        """
+        if not self.verify_password(password, password_hash):
+            return False, None
+        if self.needs_rehash(password_hash):
+            return True, self.hash_password(password)
+        return True, None
+    
+    @staticmethod
+    def is_argon2_hash(password_hash: str) -> bool:
+        """
+        Check whether a string is an encoded Argon2 hash.
+        
+        Args:
+            password_hash: Candidate hash string.
+            
+        Returns:
+            True if the string parses as an Argon2 hash, False otherwise.
+        """
+        try:
+            extract_parameters(password_hash)
+            return True
+        except InvalidHashError:
+            return False
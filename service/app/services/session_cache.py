@@ -0,0 +1,144 @@
+"""
+In-process cache of resolved session information keyed by token, and the
+configured token cache singleton.
+"""
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional
+
+from app.config import settings
+from app.services.shared_session_cache import SharedSessionCache
+from app.session_tokens import hash_token
+
+
+class SessionCache:
+    """
+    Bounded LRU cache of session info with per-entry expiry at max_time.
+    
+    Sessions cannot change before their max_time, so a cached entry stays
+    valid until then unless the session is deleted, in which case the
+    caller must invalidate it. Tokens are also indexed by their digest, so
+    a sign-in can hand a cached session's token out again; the stores
+    only keep digests.
+    """
+    
+    def __init__(self, max_entries: int = 10000):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_entries: Maximum number of cached sessions (0 disables caching).
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._tokens: Dict[bytes, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, token: str, current_time: datetime) -> Optional[dict]:
+        """
+        Get cached session info for a token.
+        
+        Args:
+            token: Session token.
+            current_time: Current timestamp for expiry checks.
+            
+        Returns:
+            Session info dictionary if cached and unexpired, None otherwise.
+        """
+        with self._lock:
+            session_info = self._entries.get(token)
+            if session_info is None:
+                self.misses += 1
+                return None
+            if session_info["max_time"] <= current_time:
+                del self._entries[token]
+                self._tokens.pop(hash_token(token), None)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            return dict(session_info)
+    
+    def set(self, session_info: dict) -> None:
+        """
+        Cache session info, evicting the least recently used entry if full.
+        
+        Args:
+            session_info: Session info dictionary including token and max_time.
+        """
+        if self.max_entries <= 0:
+            return
+        token = session_info["token"]
+        token_digest = hash_token(token)
+        with self._lock:
+            self._entries[token] = dict(session_info)
+            self._entries.move_to_end(token)
+            self._tokens[token_digest] = token
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._tokens.pop(hash_token(evicted), None)
+                self.evictions += 1
+    
+    def get_token(self, token_digest: bytes) -> Optional[str]:
+        """
+        Get the token of a cached session by its digest.
+        
+        Args:
+            token_digest: Digest the session is stored by.
+            
+        Returns:
+            The token, or None if the session is not cached.
+        """
+        with self._lock:
+            return self._tokens.get(token_digest)
+    
+    def invalidate(self, token: str) -> None:
+        """
+        Remove a token from the cache.
+        
+        Args:
+            token: Session token.
+        """
+        with self._lock:
+            self._entries.pop(token, None)
+            self._tokens.pop(hash_token(token), None)
+    
+    def clear(self) -> None:
+        """
+        Remove all entries and reset counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._tokens.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+    
+    def stats(self) -> dict:
+        """
+        Get cache counters.
+        
+        Returns:
+            Dictionary with size, hits, misses, evictions and expirations.
+        """
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+
+
+if settings.session_cache_backend == "shared":
+    session_cache = SharedSessionCache(
+        settings.session_cache_path,
+        max_entries=settings.session_cache_max_entries,
+        stripes=settings.session_cache_stripes
+    )
+else:
+    session_cache = SessionCache(max_entries=settings.session_cache_max_entries)
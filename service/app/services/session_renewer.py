@@ -0,0 +1,175 @@
+"""
+Sliding session expiry with coalesced, batched max_time writes.
+"""
+import asyncio
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.repositories.session_stores import get_session_store
+from app.session_tokens import hash_token
+
+logger = logging.getLogger(__name__)
+
+
+class SessionRenewer:
+    """
+    Extends active sessions and writes the extensions in batches.
+    
+    A validated session is renewed to max_age_seconds from now, capped at
+    absolute_max_age_seconds after it started, once its max_time would
+    move by at least renewal_interval_seconds. Since a renewal sets
+    max_time from the current time, a session can only be renewed again
+    a full interval later, however many requests it makes. Renewals are
+    queued in memory, coalesced per session, and flushed by a background
+    task with one batched write per interval; the caller hands out the
+    renewed max_time right away. Renewals queued when a worker dies are
+    lost, and those sessions keep their previous max_time.
+    """
+    
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        enabled: bool = False,
+        max_age_seconds: int = 3600,
+        absolute_max_age_seconds: int = 86400,
+        renewal_interval_seconds: int = 300,
+        flush_interval_seconds: float = 5.0,
+        storage: str = "table"
+    ):
+        """
+        Initialize the renewer.
+        
+        Args:
+            session_factory: Factory for async database sessions.
+            enabled: Renew sessions at all (False keeps max_time fixed).
+            max_age_seconds: Lifetime granted by each renewal.
+            absolute_max_age_seconds: Limit on a session's lifetime from its start.
+            renewal_interval_seconds: Minimum extension worth a write.
+            flush_interval_seconds: Delay between flushes of queued renewals.
+            storage: Session storage, as in settings.session_storage.
+        """
+        self.session_factory = session_factory
+        self.enabled = enabled
+        self.max_age = timedelta(seconds=max_age_seconds)
+        self.absolute_max_age = timedelta(seconds=absolute_max_age_seconds)
+        self.renewal_interval = timedelta(seconds=renewal_interval_seconds)
+        self.flush_interval_seconds = flush_interval_seconds
+        self.storage = storage
+        self._pending: Dict[bytes, datetime] = {}
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.written = 0
+        self.flushes = 0
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def pending(self) -> int:
+        """
+        Number of sessions with a renewal waiting to be written.
+        """
+        return len(self._pending)
+    
+    def renew(self, session_info: dict, current_time: datetime) -> Optional[dict]:
+        """
+        Queue a renewal of a validated session if one is due.
+        
+        Args:
+            session_info: Session info dictionary of a valid session.
+            current_time: Current timestamp.
+            
+        Returns:
+            Session info with the new max_time, or None if the session is
+            not renewed.
+        """
+        if not self.enabled:
+            return None
+        max_time = min(current_time + self.max_age, session_info["start_time"] + self.absolute_max_age)
+        if max_time - session_info["max_time"] < self.renewal_interval:
+            return None
+        
+        token_digest = hash_token(session_info["token"])
+        with self._lock:
+            if self._pending.get(token_digest, max_time) <= max_time:
+                self._pending[token_digest] = max_time
+            self.queued += 1
+        return {**session_info, "max_time": max_time}
+    
+    async def flush_once(self) -> int:
+        """
+        Write every queued renewal in one batch.
+        
+        If the write fails, the renewals are queued again for the next flush.
+        
+        Returns:
+            Number of sessions extended.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        
+        try:
+            async with self.session_factory() as db:
+                extended = await get_session_store(db, self.storage).extend_sessions(pending, datetime.utcnow())
+        except Exception:
+            with self._lock:
+                for token_digest, max_time in pending.items():
+                    if self._pending.get(token_digest, max_time) <= max_time:
+                        self._pending[token_digest] = max_time
+            raise
+        
+        self.written += extended
+        self.flushes += 1
+        logger.debug("Extended %d of %d renewed sessions", extended, len(pending))
+        return extended
+    
+    async def _run(self) -> None:
+        """
+        Flush forever at the configured interval.
+        """
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            try:
+                await self.flush_once()
+            except Exception:
+                logger.exception("Session renewal flush failed")
+    
+    def start(self) -> None:
+        """
+        Start the background task if it is not already running.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """
+        Cancel the background task and write what is still queued.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        try:
+            await self.flush_once()
+        except Exception:
+            logger.exception("Final session renewal flush failed")
+
+
+session_renewer = SessionRenewer(
+    enabled=settings.session_sliding_enabled,
+    max_age_seconds=settings.session_max_age_seconds,
+    absolute_max_age_seconds=settings.session_absolute_max_age_seconds,
+    renewal_interval_seconds=settings.session_renewal_interval_seconds,
+    flush_interval_seconds=settings.session_renewal_flush_seconds,
+    storage=settings.session_storage
+)
@@ -2,10 +2,11 @@
 Session management service.
 """
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, List, Optional
 from sqlalchemy.orm import Session as DBSession
-from secrets import token_urlsafe
 from app.repositories.session_repository import SessionRepository
+from app.session_tokens import new_session_token
+from app.services.session_cache import SessionCache, session_cache
 from app.config import settings
 
 
@@ -14,21 +15,23 @@ class SessionService:
     Service for session management and token generation.
     """
     
-    def __init__(self, db: DBSession):
+    def __init__(self, db: DBSession, cache: SessionCache = session_cache):
         """
         Initialize session service with database session.
         
         Args:
             db: Database session instance.
+            cache: Token cache consulted before the database.
         """
         self.db = db
         self.session_repository = SessionRepository(db)
+        self.cache = cache
     
     def create_session(self, user_id: int) -> str:
         """
         Create a new session for a user.
-        If a valid session exists, return the existing token.
-        Otherwise, create a new session.
+        If a valid session exists and its token is still in the token
+        cache, return the existing token. Otherwise, create a new session.
         
         Args:
             user_id: User ID.
@@ -45,20 +48,29 @@ class SessionService:
         )
         
         if existing_session is not None:
-            return existing_session.token
+            token = self.cache.get_token(existing_session.token_digest)
+            if token is not None:
+                return token
         
         # Create new session
-        token = token_urlsafe(32)
+        token = new_session_token()
         start_time = current_time
         max_time = start_time + timedelta(seconds=settings.session_max_age_seconds)
         
-        self.session_repository.create_session(
+        session = self.session_repository.create_session(
             user_id=user_id,
             token=token,
             start_time=start_time,
             max_time=max_time
         )
         
+        # The cache is the only place the token is kept for reuse
+        self.cache.set({
+            "token": token,
+            "user_id": session.user.user_id,
+            "start_time": start_time,
+            "max_time": max_time
+        })
         return token
     
     def get_session_info(self, token: str) -> Optional[dict]:
@@ -72,18 +84,72 @@ class SessionService:
             Dictionary with session info if valid, None otherwise.
         """
         current_time = datetime.utcnow()
-        session = self.session_repository.get_session_by_token(token)
+        session_info = self.cache.get(token, current_time)
+        if session_info is not None:
+            return session_info
         
-        if session is None:
-            return None
+        session = self.session_repository.get_session_info_by_token(token, current_time)
         
-        if session.max_time <= current_time:
+        if session is None:
             return None
         
-        return {
-            "token": session.token,
-            "user_id": session.user.user_id,
+        session_info = {
+            "token": token,
+            "user_id": session.user_id,
             "start_time": session.start_time,
             "max_time": session.max_time
         }
+        self.cache.set(session_info)
+        return session_info
+    
+    def get_sessions_info(self, tokens: List[str]) -> Dict[str, dict]:
+        """
+        Get session information for many tokens.
+        
+        Tokens missing from the cache are looked up with a single query.
+        
+        Args:
+            tokens: Session tokens.
+            
+        Returns:
+            Session info dictionaries keyed by token, for valid tokens only.
+        """
+        current_time = datetime.utcnow()
+        sessions_info = {}
+        missing = []
+        for token in tokens:
+            session_info = self.cache.get(token, current_time)
+            if session_info is not None:
+                sessions_info[token] = session_info
+            else:
+                missing.append(token)
+        
+        if missing:
+            rows = self.session_repository.get_sessions_info_by_tokens(missing, current_time)
+            for token, row in rows.items():
+                session_info = {
+                    "token": token,
+                    "user_id": row.user_id,
+                    "start_time": row.start_time,
+                    "max_time": row.max_time
+                }
+                self.cache.set(session_info)
+                sessions_info[token] = session_info
+        return sessions_info
+    
+    def delete_session(self, token: str) -> bool:
+        """
+        Delete a session by token and drop it from the cache.
+        
+        Args:
+            token: Session token.
+            
+        Returns:
+            True if a session was deleted, False if none matched.
+        """
+        deleted = self.session_repository.delete_session_by_token(token)
+        
+        # Invalidate after the delete commits so a concurrent lookup cannot re-cache it
+        self.cache.invalidate(token)
+        return deleted
 
@@ -0,0 +1,126 @@
+"""
+Background task that purges expired sessions.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.repositories.async_partitioned_session_repository import AsyncPartitionedSessionRepository
+from app.repositories.async_session_repository import AsyncSessionRepository
+from app.repositories.session_stores import get_session_store
+
+logger = logging.getLogger(__name__)
+
+
+class SessionSweeper:
+    """
+    Periodically deletes sessions whose max_time has passed.
+    
+    Rows are deleted in batches of at most ``batch_size`` per transaction
+    so that long purges never hold the SQLite write lock for long. With
+    partitioned storage, expired tables are dropped whole instead and the
+    tables for upcoming periods are created; the memory store is purged in
+    place and Redis expires sessions itself.
+    """
+    
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        interval_seconds: float = 300,
+        batch_size: int = 500,
+        storage: str = "table"
+    ):
+        """
+        Initialize the sweeper.
+        
+        Args:
+            session_factory: Factory for async database sessions.
+            interval_seconds: Delay between sweeps.
+            batch_size: Maximum rows deleted per transaction.
+            storage: Session storage, as in settings.session_storage.
+        """
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.storage = storage
+        self.last_purged = 0
+        self.total_purged = 0
+        self._task: Optional[asyncio.Task] = None
+    
+    async def sweep_once(self) -> int:
+        """
+        Delete all currently expired sessions, one batch per transaction.
+        
+        With partitioned storage, create the upcoming tables and drop the
+        expired ones instead; other stores purge themselves.
+        
+        Returns:
+            Number of sessions purged.
+        """
+        current_time = datetime.utcnow()
+        purged = 0
+        
+        async with self.session_factory() as db:
+            if self.storage == "partitioned":
+                partitioned_repository = AsyncPartitionedSessionRepository(db)
+                await partitioned_repository.ensure_partitions(current_time)
+                purged = await partitioned_repository.drop_expired_partitions(current_time)
+            elif self.storage in ("memory", "redis"):
+                purged = await get_session_store(db, self.storage).purge_expired(current_time)
+            else:
+                session_repository = AsyncSessionRepository(db)
+                while True:
+                    deleted = await session_repository.delete_expired_sessions(current_time, self.batch_size)
+                    purged += deleted
+                    if deleted < self.batch_size:
+                        break
+                    # Let other requests reach the database between batches
+                    await asyncio.sleep(0)
+        
+        self.last_purged = purged
+        self.total_purged += purged
+        logger.info("Purged %d expired sessions", purged)
+        return purged
+    
+    async def _run(self) -> None:
+        """
+        Sweep forever at the configured interval.
+        """
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.sweep_once()
+            except Exception:
+                logger.exception("Expired session sweep failed")
+    
+    def start(self) -> None:
+        """
+        Start the background task if it is not already running.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """
+        Cancel the background task and wait for it to finish.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+session_sweeper = SessionSweeper(
+    interval_seconds=settings.session_sweep_interval_seconds,
+    batch_size=settings.session_sweep_batch_size,
+    storage=settings.session_storage
+)
@@ -0,0 +1,316 @@
+"""
+Host-wide cache of resolved session information in a shared memory map.
+"""
+import fcntl
+import mmap
+import os
+import struct
+import threading
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from app.session_tokens import hash_token
+
+MAGIC = b"SESSCACH"
+LAYOUT_VERSION = 1
+HEADER = struct.Struct("<8sIIII")
+HEADER_SIZE = 64
+# version, token digest, start_time and max_time in microseconds, user_id length, user_id
+SLOT = struct.Struct("<I32sqqH64s10x")
+SLOT_VERSION = struct.Struct("<I")
+SLOT_SIZE = SLOT.size
+DIGEST_OFFSET = 4
+USER_ID_BYTES = 64
+WAYS = 8
+BUCKET_SIZE = WAYS * SLOT_SIZE
+READ_RETRIES = 3
+EPOCH = datetime(1970, 1, 1)
+EMPTY_DIGEST = bytes(32)
+
+
+def to_microseconds(timestamp: datetime) -> int:
+    """
+    Convert a naive UTC timestamp to microseconds since the epoch.
+    """
+    return (timestamp - EPOCH) // timedelta(microseconds=1)
+
+
+def from_microseconds(microseconds: int) -> datetime:
+    """
+    Convert microseconds since the epoch to a naive UTC timestamp.
+    """
+    return EPOCH + timedelta(microseconds=microseconds)
+
+
+class SharedSessionCache:
+    """
+    Drop-in replacement for SessionCache shared by every worker on a host.
+    
+    Entries live in fixed 128-byte slots of a file-backed shared memory
+    map (put the file on tmpfs, e.g. /dev/shm). A token's digest picks a
+    bucket of eight slots; a full bucket evicts the entry that expires
+    first. Lookups take no lock: each slot carries a version that writers
+    make odd while they change it, and a reader retries a slot whose
+    version moved under it (a seqlock). Writers hold a striped lock,
+    a threading lock within the process plus an fcntl lock on one byte
+    of the file across processes.
+    
+    The hit, miss, eviction and expiration counters are per process; the
+    size is host-wide. Sessions whose user_id is longer than 64 bytes in
+    UTF-8 are not cached. Slots hold token digests, never tokens, so a
+    sign-in always issues a new session.
+    """
+    
+    def __init__(self, path: str, max_entries: int = 10000, stripes: int = 64):
+        """
+        Initialize the cache. The file is created or attached on first use.
+        
+        Args:
+            path: Base path of the backing file; the slot count is appended
+                so that differently sized caches never share a file.
+            max_entries: Minimum number of slots (0 disables caching).
+            stripes: Writer lock stripes.
+        """
+        self.max_entries = max_entries
+        self.buckets = max(1, -(-max_entries // WAYS))
+        self.slots = self.buckets * WAYS
+        self.path = f"{path}-v{LAYOUT_VERSION}-{self.slots}"
+        self.stripes = stripes
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._attach_lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._map: Optional[mmap.mmap] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def _attach(self) -> mmap.mmap:
+        """
+        Open and map the backing file, initializing it if this is the first worker.
+        """
+        with self._attach_lock:
+            if self._map is not None:
+                return self._map
+            size = HEADER_SIZE + self.slots * SLOT_SIZE
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            # Byte 0 serializes initialization; stripe locks start at byte 1
+            fcntl.lockf(fd, fcntl.LOCK_EX, 1, 0)
+            try:
+                if os.pread(fd, HEADER.size, 0) != self._header():
+                    # A new file, or one whose first worker died while initializing it
+                    os.ftruncate(fd, size)
+                    os.pwrite(fd, bytes(size), 0)
+                    os.pwrite(fd, self._header(), 0)
+            finally:
+                fcntl.lockf(fd, fcntl.LOCK_UN, 1, 0)
+            self._fd = fd
+            self._map = mmap.mmap(fd, size)
+            return self._map
+    
+    def _header(self) -> bytes:
+        """
+        Header identifying the layout of the backing file.
+        """
+        return HEADER.pack(MAGIC, LAYOUT_VERSION, self.slots, WAYS, USER_ID_BYTES)
+    
+    def _bucket(self, digest: bytes) -> Tuple[int, int]:
+        """
+        Get the byte offset of a digest's bucket and its lock stripe.
+        """
+        bucket = int.from_bytes(digest[:8], "little") % self.buckets
+        return HEADER_SIZE + bucket * BUCKET_SIZE, bucket % self.stripes
+    
+    def _lock(self, stripe: int) -> None:
+        """
+        Take a writer stripe lock.
+        """
+        self._locks[stripe].acquire()
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, 1 + stripe)
+    
+    def _unlock(self, stripe: int) -> None:
+        """
+        Release a writer stripe lock.
+        """
+        fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, 1 + stripe)
+        self._locks[stripe].release()
+    
+    @staticmethod
+    def _find(bucket: bytes, digest: bytes) -> int:
+        """
+        Find the slot holding a digest in a copy of its bucket.
+        
+        Returns:
+            Offset of the slot within the bucket, or -1.
+        """
+        position = bucket.find(digest)
+        while position != -1 and position % SLOT_SIZE != DIGEST_OFFSET:
+            position = bucket.find(digest, position + 1)
+        return position - DIGEST_OFFSET if position != -1 else -1
+    
+    def _write(self, offset: int, digest: bytes, start_us: int, max_us: int, user_id: bytes) -> None:
+        """
+        Rewrite a slot, keeping its version odd while it changes. Needs the stripe lock.
+        """
+        cache = self._map
+        version = SLOT_VERSION.unpack_from(cache, offset)[0]
+        SLOT_VERSION.pack_into(cache, offset, version + 1)
+        cache[offset + DIGEST_OFFSET:offset + SLOT_SIZE] = SLOT.pack(
+            0, digest, start_us, max_us, len(user_id), user_id
+        )[DIGEST_OFFSET:]
+        SLOT_VERSION.pack_into(cache, offset, version + 2)
+    
+    def get(self, token: str, current_time: datetime) -> Optional[dict]:
+        """
+        Get cached session info for a token.
+        
+        Args:
+            token: Session token.
+            current_time: Current timestamp for expiry checks.
+            
+        Returns:
+            Session info dictionary if cached and unexpired, None otherwise.
+        """
+        if self.max_entries <= 0:
+            self.misses += 1
+            return None
+        cache = self._map or self._attach()
+        digest = hash_token(token)
+        start, _ = self._bucket(digest)
+        for _ in range(READ_RETRIES):
+            bucket = cache[start:start + BUCKET_SIZE]
+            slot = self._find(bucket, digest)
+            if slot == -1:
+                break
+            version, _, start_us, max_us, length, user_id = SLOT.unpack_from(bucket, slot)
+            if version & 1 or SLOT_VERSION.unpack_from(cache, start + slot)[0] != version:
+                continue
+            if from_microseconds(max_us) <= current_time:
+                self.expirations += 1
+                break
+            self.hits += 1
+            return {
+                "token": token,
+                "user_id": user_id[:length].decode("utf-8"),
+                "start_time": from_microseconds(start_us),
+                "max_time": from_microseconds(max_us)
+            }
+        self.misses += 1
+        return None
+    
+    def set(self, session_info: dict) -> None:
+        """
+        Cache session info, reusing an expired slot or evicting the entry
+        that expires first if the bucket is full.
+        
+        Args:
+            session_info: Session info dictionary including token and max_time.
+        """
+        user_id = session_info["user_id"].encode("utf-8")
+        if self.max_entries <= 0 or len(user_id) > USER_ID_BYTES:
+            return
+        cache = self._map or self._attach()
+        digest = hash_token(session_info["token"])
+        start, stripe = self._bucket(digest)
+        now_us = to_microseconds(datetime.utcnow())
+        self._lock(stripe)
+        try:
+            bucket = cache[start:start + BUCKET_SIZE]
+            slot = self._find(bucket, digest)
+            if slot == -1:
+                expiries = [
+                    SLOT.unpack_from(bucket, way * SLOT_SIZE)[3] for way in range(WAYS)
+                ]
+                way = min(range(WAYS), key=expiries.__getitem__)
+                if expiries[way] > now_us:
+                    self.evictions += 1
+                slot = way * SLOT_SIZE
+            self._write(
+                start + slot,
+                digest,
+                to_microseconds(session_info["start_time"]),
+                to_microseconds(session_info["max_time"]),
+                user_id
+            )
+        finally:
+            self._unlock(stripe)
+    
+    def get_token(self, token_digest: bytes) -> Optional[str]:
+        """
+        Get the token of a cached session by its digest.
+        
+        Args:
+            token_digest: Digest the session is stored by.
+            
+        Returns:
+            Always None: tokens are not kept in the shared map.
+        """
+        return None
+    
+    def invalidate(self, token: str) -> None:
+        """
+        Remove a token from the cache on every worker.
+        
+        Args:
+            token: Session token.
+        """
+        if self.max_entries <= 0:
+            return
+        cache = self._map or self._attach()
+        digest = hash_token(token)
+        start, stripe = self._bucket(digest)
+        self._lock(stripe)
+        try:
+            slot = self._find(cache[start:start + BUCKET_SIZE], digest)
+            if slot != -1:
+                self._write(start + slot, EMPTY_DIGEST, 0, 0, b"")
+        finally:
+            self._unlock(stripe)
+    
+    def clear(self) -> None:
+        """
+        Remove all entries and reset this process's counters.
+        """
+        if self.max_entries > 0:
+            self._map or self._attach()
+            for stripe in range(self.stripes):
+                self._lock(stripe)
+                try:
+                    for bucket in range(stripe, self.buckets, self.stripes):
+                        for way in range(WAYS):
+                            self._write(HEADER_SIZE + bucket * BUCKET_SIZE + way * SLOT_SIZE, EMPTY_DIGEST, 0, 0, b"")
+                finally:
+                    self._unlock(stripe)
+        self.hits = self.misses = self.evictions = self.expirations = 0
+    
+    def stats(self) -> dict:
+        """
+        Get cache counters.
+        
+        Returns:
+            Dictionary with size (unexpired entries on the host), hits,
+            misses, evictions and expirations.
+        """
+        size = 0
+        if self._map is not None:
+            now_us = to_microseconds(datetime.utcnow())
+            slots = self._map[HEADER_SIZE:]
+            size = sum(1 for slot in SLOT.iter_unpack(slots) if slot[3] > now_us)
+        return {
+            "size": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+    
+    def close(self) -> None:
+        """
+        Unmap the backing file. The file and its entries are kept.
+        """
+        with self._attach_lock:
+            if self._map is not None:
+                self._map.close()
+                os.close(self._fd)
+                self._map = None
+                self._fd = None
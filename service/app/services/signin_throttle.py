@@ -0,0 +1,367 @@
+"""
+In-process admission control for sign-in attempts.
+"""
+import threading
+import time
+from collections import OrderedDict, deque
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
+from typing import Deque, Dict, List, Optional, Union
+
+from app.config import settings
+
+
+class RateLimitExceededError(Exception):
+    """
+    Raised when a sign-in attempt is over a rate or failure limit.
+    """
+    
+    def __init__(self, reason: str, retry_after: float):
+        """
+        Initialize the error.
+        
+        Args:
+            reason: Limit that rejected the attempt.
+            retry_after: Seconds until the attempt would be admitted.
+        """
+        super().__init__(f"Sign-in rate limit exceeded ({reason})")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class TokenBucketLimiter:
+    """
+    Token buckets keyed by an identity, refilled continuously.
+    
+    At most ``max_keys`` buckets are kept; the least recently used one is
+    evicted first. An evicted bucket comes back full, which only matters
+    for identities that have been idle longer than every other key.
+    """
+    
+    def __init__(self, rate_per_second: float, burst: int, max_keys: int = 100000):
+        """
+        Initialize an empty limiter.
+        
+        Args:
+            rate_per_second: Tokens added per second (0 disables the limiter).
+            burst: Bucket capacity.
+            max_keys: Maximum number of buckets kept.
+        """
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.throttled = 0
+    
+    def acquire(self, key: str, now: float) -> float:
+        """
+        Take one token from a key's bucket.
+        
+        Args:
+            key: Identity the bucket belongs to.
+            now: Current monotonic time in seconds.
+            
+        Returns:
+            0 if a token was taken, otherwise seconds until one is available.
+        """
+        if self.rate_per_second <= 0:
+            return 0.0
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                tokens = float(self.burst)
+            else:
+                tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate_per_second)
+                self._buckets.move_to_end(key)
+            
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+            else:
+                wait = (1 - tokens) / self.rate_per_second
+                self.throttled += 1
+            
+            self._buckets[key] = [tokens, now]
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return wait
+    
+    def clear(self) -> None:
+        """
+        Remove every bucket.
+        """
+        with self._lock:
+            self._buckets.clear()
+
+
+class SlidingWindowCounter:
+    """
+    Per-key event counter over a sliding time window.
+    
+    Each key keeps the timestamps of its last ``max_events`` events only,
+    so memory is bounded by ``max_keys * max_events`` whatever the attack
+    volume. Keys are evicted least recently used first.
+    """
+    
+    def __init__(self, max_events: int, window_seconds: float, max_keys: int = 100000):
+        """
+        Initialize an empty counter.
+        
+        Args:
+            max_events: Events within the window that trigger the limit (0 disables it).
+            window_seconds: Window length in seconds.
+            max_keys: Maximum number of keys kept.
+        """
+        self.max_events = max_events
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        self._events: "OrderedDict[str, Deque[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.throttled = 0
+    
+    def record(self, key: str, now: float) -> None:
+        """
+        Record an event for a key.
+        
+        Args:
+            key: Identity the event belongs to.
+            now: Current monotonic time in seconds.
+        """
+        if self.max_events <= 0:
+            return
+        with self._lock:
+            events = self._events.get(key)
+            if events is None:
+                events = self._events[key] = deque(maxlen=self.max_events)
+            else:
+                self._events.move_to_end(key)
+            events.append(now)
+            while len(self._events) > self.max_keys:
+                self._events.popitem(last=False)
+    
+    def retry_after(self, key: str, now: float) -> float:
+        """
+        Check whether a key has reached the limit within the window.
+        
+        Args:
+            key: Identity to check.
+            now: Current monotonic time in seconds.
+            
+        Returns:
+            0 if the key is under the limit, otherwise seconds until the
+            oldest counted event leaves the window.
+        """
+        if self.max_events <= 0:
+            return 0.0
+        with self._lock:
+            events = self._events.get(key)
+            if events is None or len(events) < self.max_events:
+                return 0.0
+            wait = events[0] + self.window_seconds - now
+            if wait <= 0:
+                return 0.0
+            self.throttled += 1
+            return wait
+    
+    def reset(self, key: str) -> None:
+        """
+        Forget a key's events.
+        
+        Args:
+            key: Identity to reset.
+        """
+        with self._lock:
+            self._events.pop(key, None)
+    
+    def clear(self) -> None:
+        """
+        Remove every key.
+        """
+        with self._lock:
+            self._events.clear()
+
+
+class SigninThrottle:
+    """
+    Rejects sign-in attempts before any database lookup or Argon2 work.
+    
+    An attempt is admitted only if neither its client IP nor its user_id
+    has too many recent failures, and both their token buckets have a
+    token left. Failure checks run first so a locked-out identity does not
+    drain its bucket.
+    
+    Behind a load balancer every connection comes from the balancer, so
+    client_address takes the client IP from X-Forwarded-For when the
+    connection comes from a trusted proxy.
+    """
+    
+    def __init__(
+        self,
+        enabled: bool = True,
+        ip_rate_per_second: float = 10.0,
+        ip_burst: int = 50,
+        user_rate_per_second: float = 0.2,
+        user_burst: int = 5,
+        max_failures_per_ip: int = 100,
+        max_failures_per_user: int = 5,
+        failure_window_seconds: float = 300,
+        max_keys: int = 100000,
+        trusted_proxies: str = ""
+    ):
+        """
+        Initialize the limiters.
+        
+        Args:
+            enabled: Whether attempts are checked at all.
+            ip_rate_per_second: Sustained attempts per client IP.
+            ip_burst: Attempts a client IP may make at once.
+            user_rate_per_second: Sustained attempts per user_id.
+            user_burst: Attempts a user_id may receive at once.
+            max_failures_per_ip: Failures per client IP within the window.
+            max_failures_per_user: Failures per user_id within the window.
+            failure_window_seconds: Failure window length in seconds.
+            max_keys: Maximum identities tracked by each limiter.
+            trusted_proxies: Comma-separated proxy addresses or networks
+                whose X-Forwarded-For header is believed.
+                
+        Raises:
+            ValueError: If a trusted proxy is not an address or network.
+        """
+        self.enabled = enabled
+        self.trusted_proxies: List[Union[IPv4Network, IPv6Network]] = [
+            ip_network(proxy.strip()) for proxy in trusted_proxies.split(",") if proxy.strip()
+        ]
+        self.ip_limiter = TokenBucketLimiter(ip_rate_per_second, ip_burst, max_keys)
+        self.user_limiter = TokenBucketLimiter(user_rate_per_second, user_burst, max_keys)
+        self.ip_failures = SlidingWindowCounter(max_failures_per_ip, failure_window_seconds, max_keys)
+        self.user_failures = SlidingWindowCounter(max_failures_per_user, failure_window_seconds, max_keys)
+    
+    def _is_trusted(self, address: str) -> bool:
+        """
+        Check whether an address belongs to a trusted proxy.
+        """
+        try:
+            parsed = ip_address(address)
+        except ValueError:
+            return False
+        return any(parsed in network for network in self.trusted_proxies)
+    
+    def client_address(self, peer: Optional[str], forwarded_for: Optional[str]) -> str:
+        """
+        Get the address attempts are counted against.
+        
+        X-Forwarded-For is read right to left, skipping trusted proxies,
+        and only when the connection itself comes from a trusted proxy;
+        the entries left of the first untrusted hop may be forged by the
+        client and are ignored.
+        
+        Args:
+            peer: Address of the connecting host, if known.
+            forwarded_for: X-Forwarded-For header value, if any.
+            
+        Returns:
+            Client IP address, or "unknown" if there is no peer address.
+        """
+        if peer is None:
+            return "unknown"
+        if not forwarded_for or not self._is_trusted(peer):
+            return peer
+        address = peer
+        for hop in reversed(forwarded_for.split(",")):
+            address = hop.strip()
+            if not self._is_trusted(address):
+                break
+        return address
+    
+    def check(self, client_ip: str, user_id: str, now: Optional[float] = None) -> None:
+        """
+        Admit a sign-in attempt or reject it.
+        
+        Args:
+            client_ip: Client address.
+            user_id: User identifier being signed in.
+            now: Current monotonic time (defaults to time.monotonic()).
+            
+        Raises:
+            RateLimitExceededError: If any limit rejects the attempt.
+        """
+        if not self.enabled:
+            return
+        if now is None:
+            now = time.monotonic()
+        
+        retry_after = self.ip_failures.retry_after(client_ip, now)
+        if retry_after > 0:
+            raise RateLimitExceededError("ip_failures", retry_after)
+        retry_after = self.user_failures.retry_after(user_id, now)
+        if retry_after > 0:
+            raise RateLimitExceededError("user_failures", retry_after)
+        retry_after = self.ip_limiter.acquire(client_ip, now)
+        if retry_after > 0:
+            raise RateLimitExceededError("ip_rate", retry_after)
+        retry_after = self.user_limiter.acquire(user_id, now)
+        if retry_after > 0:
+            raise RateLimitExceededError("user_rate", retry_after)
+    
+    def record_failure(self, client_ip: str, user_id: str, now: Optional[float] = None) -> None:
+        """
+        Count a failed sign-in against both identities.
+        
+        Args:
+            client_ip: Client address.
+            user_id: User identifier.
+            now: Current monotonic time (defaults to time.monotonic()).
+        """
+        if not self.enabled:
+            return
+        if now is None:
+            now = time.monotonic()
+        self.ip_failures.record(client_ip, now)
+        self.user_failures.record(user_id, now)
+    
+    def record_success(self, user_id: str) -> None:
+        """
+        Clear a user's failures after a successful sign-in.
+        
+        Args:
+            user_id: User identifier.
+        """
+        if self.enabled:
+            self.user_failures.reset(user_id)
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get rejected attempt counts by reason.
+        
+        Returns:
+            Dictionary mapping each limit to the attempts it rejected.
+        """
+        return {
+            "ip_failures": self.ip_failures.throttled,
+            "user_failures": self.user_failures.throttled,
+            "ip_rate": self.ip_limiter.throttled,
+            "user_rate": self.user_limiter.throttled,
+        }
+    
+    def clear(self) -> None:
+        """
+        Forget every tracked identity.
+        """
+        self.ip_limiter.clear()
+        self.user_limiter.clear()
+        self.ip_failures.clear()
+        self.user_failures.clear()
+
+
+signin_throttle = SigninThrottle(
+    enabled=settings.signin_throttle_enabled,
+    ip_rate_per_second=settings.signin_ip_rate_per_second,
+    ip_burst=settings.signin_ip_burst,
+    user_rate_per_second=settings.signin_user_rate_per_second,
+    user_burst=settings.signin_user_burst,
+    max_failures_per_ip=settings.signin_max_failures_per_ip,
+    max_failures_per_user=settings.signin_max_failures_per_user,
+    failure_window_seconds=settings.signin_failure_window_seconds,
+    max_keys=settings.signin_throttle_max_keys,
+    trusted_proxies=settings.trusted_proxies
+)
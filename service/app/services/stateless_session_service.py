@@ -0,0 +1,146 @@
+"""
+Stateless session service using signed tokens.
+"""
+import heapq
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from jose import jwt, JWTError
+from app.config import settings
+
+TOKEN_ALGORITHM = "HS256"
+
+
+class StatelessSessionService:
+    """
+    Service issuing HMAC-signed session tokens that validate without the database.
+    
+    Each token carries the user identifier, start time and expiry, signed
+    with settings.secret_key. Logged out tokens are kept in an in-process
+    revocation set until they would have expired anyway, so the set only
+    ever holds tokens that are still unexpired. Times in the claims are
+    UTC epoch seconds from time.time(), independent of the host's time zone.
+    """
+    
+    def __init__(self, secret_key: str = settings.secret_key):
+        """
+        Initialize the service.
+        
+        Args:
+            secret_key: HMAC key used to sign and verify tokens.
+        """
+        self.secret_key = secret_key
+        self._revoked: Dict[str, int] = {}
+        # (exp, token) of every revoked token, earliest expiry first
+        self._expiries: List[Tuple[int, str]] = []
+        self._lock = threading.Lock()
+    
+    def create_session(self, user_id: str) -> str:
+        """
+        Issue a signed session token.
+        
+        Args:
+            user_id: User identifier.
+            
+        Returns:
+            Signed session token.
+        """
+        return self.create_session_info(user_id)["token"]
+    
+    def create_session_info(self, user_id: str) -> dict:
+        """
+        Issue a signed session token and return its session info.
+        
+        Args:
+            user_id: User identifier.
+            
+        Returns:
+            Dictionary with session info.
+        """
+        start_time = int(time.time())
+        claims = {
+            "sub": user_id,
+            "iat": start_time,
+            "exp": start_time + settings.session_max_age_seconds
+        }
+        return {
+            "token": jwt.encode(claims, self.secret_key, algorithm=TOKEN_ALGORITHM),
+            "user_id": user_id,
+            "start_time": datetime.utcfromtimestamp(claims["iat"]),
+            "max_time": datetime.utcfromtimestamp(claims["exp"])
+        }
+    
+    def _decode(self, token: str) -> Optional[dict]:
+        """
+        Verify the signature and expiry of a token.
+        
+        Args:
+            token: Session token.
+            
+        Returns:
+            Token claims if valid, None otherwise.
+        """
+        try:
+            return jwt.decode(token, self.secret_key, algorithms=[TOKEN_ALGORITHM])
+        except JWTError:
+            return None
+    
+    def get_session_info(self, token: str) -> Optional[dict]:
+        """
+        Get session information from a token without any database access.
+        
+        Args:
+            token: Session token.
+            
+        Returns:
+            Dictionary with session info if valid, None otherwise.
+        """
+        claims = self._decode(token)
+        
+        if claims is None or token in self._revoked:
+            return None
+        
+        return {
+            "token": token,
+            "user_id": claims["sub"],
+            "start_time": datetime.utcfromtimestamp(claims["iat"]),
+            "max_time": datetime.utcfromtimestamp(claims["exp"])
+        }
+    
+    def delete_session(self, token: str) -> bool:
+        """
+        Revoke a token until its expiry.
+        
+        Args:
+            token: Session token.
+            
+        Returns:
+            True if a valid token was revoked, False otherwise.
+        """
+        claims = self._decode(token)
+        
+        if claims is None:
+            return False
+        
+        now = int(time.time())
+        with self._lock:
+            # Revocation order is not expiry order once lifetimes differ,
+            # so expired tokens are pruned from a heap ordered by exp
+            while self._expiries and self._expiries[0][0] <= now:
+                _, expired_token = heapq.heappop(self._expiries)
+                self._revoked.pop(expired_token, None)
+            if token not in self._revoked:
+                self._revoked[token] = claims["exp"]
+                heapq.heappush(self._expiries, (claims["exp"], token))
+        return True
+    
+    @property
+    def revoked_count(self) -> int:
+        """
+        Number of tokens currently in the revocation set.
+        """
+        return len(self._revoked)
+
+
+stateless_session_service = StatelessSessionService()
@@ -0,0 +1,223 @@
+"""
+Process-local Bloom filter of existing user_ids.
+"""
+import math
+from hashlib import blake2b
+from typing import Dict, List, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import settings
+from app.models import User
+
+
+def _hash_pair(user_id: str) -> Tuple[int, int]:
+    """
+    Derive the two base hashes used for double hashing.
+    
+    Args:
+        user_id: User identifier.
+        
+    Returns:
+        Two 64-bit integers; the second is odd so probes never repeat.
+    """
+    digest = blake2b(user_id.encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter sized for a capacity and false-positive rate.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float):
+        """
+        Allocate an empty filter.
+        
+        Args:
+            capacity: Number of items the filter is sized for.
+            error_rate: False-positive rate at capacity.
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+    
+    def _positions(self, hashes: Tuple[int, int]) -> List[int]:
+        """
+        Bit positions for an item's base hashes.
+        """
+        first, second = hashes
+        return [(first + index * second) % self.size for index in range(self.hash_count)]
+    
+    def add(self, hashes: Tuple[int, int]) -> None:
+        """
+        Set an item's bits.
+        
+        Args:
+            hashes: Base hashes from _hash_pair.
+        """
+        for position in self._positions(hashes):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def might_contain(self, hashes: Tuple[int, int]) -> bool:
+        """
+        Check whether all of an item's bits are set.
+        
+        Args:
+            hashes: Base hashes from _hash_pair.
+            
+        Returns:
+            False if the item was definitely never added.
+        """
+        for position in self._positions(hashes):
+            if not self._bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+    
+    @property
+    def false_positive_rate(self) -> float:
+        """
+        Estimated false-positive rate at the current fill.
+        """
+        return (1 - math.exp(-self.hash_count * self.count / self.size)) ** self.hash_count
+    
+    @property
+    def memory_bytes(self) -> int:
+        """
+        Size of the bit array in bytes.
+        """
+        return len(self._bits)
+
+
+class UserIdFilter:
+    """
+    Scalable Bloom filter answering "has this user_id possibly been taken?".
+    
+    The first layer gets half the configured error rate. When the newest
+    layer reaches its capacity, a layer twice as large with half its error
+    rate is added, so the combined false-positive rate stays below the
+    configured rate however far the population grows.
+    
+    Until load() has completed the filter is not ready and every lookup is
+    a possible hit. The filter only knows about users present at load time
+    and users added through this process, so a definite miss never replaces
+    the unique constraint on insert; it only skips the existence query.
+    Only touched from the event loop thread, so no lock is needed.
+    """
+    
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.01):
+        """
+        Initialize an empty, not yet ready filter.
+        
+        Args:
+            capacity: Items the first layer is sized for.
+            error_rate: False-positive rate of the first layer.
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.ready = False
+        self.definite_misses = 0
+        self.possible_hits = 0
+        self.false_positives = 0
+        self._layers = [BloomFilter(capacity, error_rate / 2)]
+    
+    def add(self, user_id: str) -> None:
+        """
+        Record a user_id as taken, growing the filter if needed.
+        
+        Args:
+            user_id: User identifier.
+        """
+        layer = self._layers[-1]
+        if layer.count >= layer.capacity:
+            layer = BloomFilter(layer.capacity * 2, layer.error_rate / 2)
+            self._layers.append(layer)
+        layer.add(_hash_pair(user_id))
+    
+    def might_contain(self, user_id: str) -> bool:
+        """
+        Check whether a user_id may be taken.
+        
+        Args:
+            user_id: User identifier.
+            
+        Returns:
+            False only if the user_id is definitely not in the filter.
+        """
+        if not self.ready:
+            return True
+        hashes = _hash_pair(user_id)
+        for layer in self._layers:
+            if layer.might_contain(hashes):
+                self.possible_hits += 1
+                return True
+        self.definite_misses += 1
+        return False
+    
+    def record_false_positive(self) -> None:
+        """
+        Count a possible hit that the database did not confirm.
+        """
+        self.false_positives += 1
+    
+    async def load(self, session_factory: async_sessionmaker, batch_size: int = 10000) -> None:
+        """
+        Rebuild the filter from a streaming scan of the users table.
+        
+        The first layer is sized for twice the current user count (or the
+        configured capacity, if larger), so a freshly loaded filter starts
+        with a single layer.
+        
+        Args:
+            session_factory: Factory for async database sessions.
+            batch_size: Rows fetched per round trip.
+        """
+        self.ready = False
+        async with session_factory() as db:
+            user_count = await db.scalar(select(func.count()).select_from(User))
+            self._layers = [BloomFilter(max(self.capacity, user_count * 2), self.error_rate / 2)]
+            result = await db.stream_scalars(
+                select(User.user_id).execution_options(yield_per=batch_size)
+            )
+            async for user_id in result:
+                self.add(user_id)
+        self.ready = True
+    
+    def clear(self) -> None:
+        """
+        Remove every user_id, keeping the ready flag.
+        """
+        self._layers = [BloomFilter(self.capacity, self.error_rate / 2)]
+    
+    def stats(self) -> Dict[str, float]:
+        """
+        Get filter size, accuracy and lookup statistics.
+        
+        Returns:
+            Dictionary with items, layers, memory_bytes, the estimated
+            false_positive_rate, and definite_misses, possible_hits and
+            false_positives lookup counts.
+        """
+        true_negative_rate = 1.0
+        for layer in self._layers:
+            true_negative_rate *= 1 - layer.false_positive_rate
+        return {
+            "items": sum(layer.count for layer in self._layers),
+            "layers": len(self._layers),
+            "memory_bytes": sum(layer.memory_bytes for layer in self._layers),
+            "false_positive_rate": 1 - true_negative_rate,
+            "definite_misses": self.definite_misses,
+            "possible_hits": self.possible_hits,
+            "false_positives": self.false_positives,
+        }
+
+
+user_id_filter = UserIdFilter(
+    capacity=settings.user_id_filter_capacity,
+    error_rate=settings.user_id_filter_error_rate
+)
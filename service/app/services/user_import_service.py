@@ -0,0 +1,168 @@
+"""
+Bulk user import service for onboarding migrations.
+"""
+import asyncio
+from typing import AsyncIterable, AsyncIterator, List, Tuple
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.schemas import UserImportRecord
+from app.services.hashing_executor import hashing_executor, HashingQueueFullError
+from app.services.password_service import PasswordService
+from app.services.user_id_filter import user_id_filter
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """
+    Split a stream of byte chunks into lines.
+    
+    Lines are left undecoded so that one with invalid UTF-8 is rejected
+    by the import like any other bad line.
+    
+    Args:
+        chunks: Byte chunks, e.g. a request body stream.
+        
+    Yields:
+        Lines without their line terminator.
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+
+class UserImportService:
+    """
+    Imports users from NDJSON lines in batches.
+    
+    Plain passwords are hashed across all hashing worker processes and
+    pre-hashed Argon2 strings are stored unchanged. Each batch is inserted
+    with a single executemany statement. Rejected lines are reported one
+    by one and never abort the import.
+    """
+    
+    def __init__(self, db: AsyncSession, batch_size: int = settings.user_import_batch_size):
+        """
+        Initialize import service with async database session.
+        
+        Args:
+            db: Async database session instance.
+            batch_size: Users hashed and inserted per batch.
+        """
+        self.user_repository = AsyncUserRepository(db)
+        self.batch_size = batch_size
+    
+    async def import_users(self, lines: AsyncIterable[bytes]) -> AsyncIterator[dict]:
+        """
+        Import users from NDJSON lines.
+        
+        Args:
+            lines: UTF-8 encoded NDJSON lines, each a UserImportRecord.
+            
+        Yields:
+            One dictionary per rejected line (line, user_id, error), then a
+            final summary dictionary with created and failed counts.
+        """
+        created = 0
+        failed = 0
+        batch: List[Tuple[int, UserImportRecord]] = []
+        line_number = 0
+        
+        async for line in lines:
+            line_number += 1
+            if not line.strip():
+                continue
+            
+            try:
+                text = line.decode("utf-8")
+            except UnicodeDecodeError:
+                failed += 1
+                yield {"line": line_number, "user_id": None, "error": "Line is not valid UTF-8"}
+                continue
+            
+            try:
+                record = UserImportRecord.model_validate_json(text)
+            except ValidationError as exc:
+                failed += 1
+                yield {"line": line_number, "user_id": None, "error": exc.errors()[0]["msg"]}
+                continue
+            
+            if record.password_hash is not None and not PasswordService.is_argon2_hash(record.password_hash):
+                failed += 1
+                yield {"line": line_number, "user_id": record.user_id, "error": "password_hash is not an Argon2 hash"}
+                continue
+            
+            batch.append((line_number, record))
+            if len(batch) >= self.batch_size:
+                failures = await self._import_batch(batch)
+                created += len(batch) - len(failures)
+                failed += len(failures)
+                for failure in failures:
+                    yield failure
+                batch = []
+        
+        if batch:
+            failures = await self._import_batch(batch)
+            created += len(batch) - len(failures)
+            failed += len(failures)
+            for failure in failures:
+                yield failure
+        
+        yield {"created": created, "failed": failed}
+    
+    async def _hash_passwords(self, passwords: List[str]) -> List[str]:
+        """
+        Hash passwords, waiting for capacity while logins saturate the pool.
+        
+        hash_passwords never needs more than max_pending slots, so a retry
+        succeeds as soon as the queue drains.
+        
+        Args:
+            passwords: Plain text passwords.
+            
+        Returns:
+            Hashed passwords in input order.
+        """
+        while True:
+            try:
+                return await hashing_executor.hash_passwords(passwords)
+            except HashingQueueFullError:
+                await asyncio.sleep(settings.hashing_retry_after_seconds)
+    
+    async def _import_batch(self, batch: List[Tuple[int, UserImportRecord]]) -> List[dict]:
+        """
+        Hash and insert one batch of records.
+        
+        Args:
+            batch: Line numbers and validated records.
+            
+        Returns:
+            One failure dictionary per record that was not inserted.
+        """
+        password_hashes = iter(await self._hash_passwords(
+            [record.password for _, record in batch if record.password is not None]
+        ))
+        users = [
+            {
+                "user_id": record.user_id,
+                "password_hash": record.password_hash if record.password is None else next(password_hashes)
+            }
+            for _, record in batch
+        ]
+        created_user_ids = await self.user_repository.create_users_if_absent(users)
+        for user_id in created_user_ids:
+            user_id_filter.add(user_id)
+        
+        failures = []
+        for line_number, record in batch:
+            if record.user_id in created_user_ids:
+                # Only the first occurrence of a user_id in the batch was inserted
+                created_user_ids.discard(record.user_id)
+            else:
+                failures.append({"line": line_number, "user_id": record.user_id, "error": "User already exists"})
+        return failures
@@ -0,0 +1,32 @@
+"""
+Session token generation and storage digests.
+
+Sessions are stored by the SHA-256 digest of their token, never by the
+token itself, so a leaked sessions table yields no usable token. Only
+the client and the issuing process's token cache ever hold a token.
+"""
+import hashlib
+from secrets import token_urlsafe
+
+
+def hash_token(token: str) -> bytes:
+    """
+    Compute the 32-byte digest a token is stored and indexed by.
+    
+    Args:
+        token: Session token.
+        
+    Returns:
+        SHA-256 digest of the token.
+    """
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def new_session_token() -> str:
+    """
+    Create a token for a new session.
+    
+    Returns:
+        43-character URL-safe random token.
+    """
+    return token_urlsafe(32)
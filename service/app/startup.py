@@ -0,0 +1,62 @@
+"""
+Worker startup timing, from importing app.main to serving the first request.
+"""
+import time
+from typing import Dict, Optional
+
+
+class StartupTimer:
+    """
+    Records when each startup phase of this worker process finished.
+    
+    The clock starts when this module is first imported, which app.main
+    does before importing anything else.
+    """
+    
+    def __init__(self):
+        """
+        Start the clock.
+        """
+        self.import_started = time.perf_counter()
+        self.imported: Optional[float] = None
+        self.ready: Optional[float] = None
+        self.first_request: Optional[float] = None
+    
+    def mark_imported(self) -> None:
+        """
+        Record that app.main finished importing.
+        """
+        self.imported = time.perf_counter()
+    
+    def mark_ready(self) -> None:
+        """
+        Record that the lifespan startup (warm-up) finished.
+        """
+        self.ready = time.perf_counter()
+    
+    def mark_first_request(self) -> None:
+        """
+        Record the first request reaching the application, once.
+        """
+        if self.first_request is None:
+            self.first_request = time.perf_counter()
+    
+    def phases(self) -> Dict[str, float]:
+        """
+        Get the duration of each finished phase.
+        
+        Returns:
+            Seconds spent importing, in lifespan startup, and from the start
+            of the import to the first request, for the phases reached.
+        """
+        phases = {}
+        if self.imported is not None:
+            phases["import"] = self.imported - self.import_started
+            if self.ready is not None:
+                phases["lifespan"] = self.ready - self.imported
+        if self.first_request is not None:
+            phases["first_request"] = self.first_request - self.import_started
+        return phases
+
+
+startup_timer = StartupTimer()
@@ -0,0 +1,100 @@
+"""
+Benchmark concurrent signin database throughput with and without the engine profile.
+
+"Default" is a bare create_async_engine on a fresh SQLite file (rollback
+journal, synchronous=FULL, default cache). "Tuned" uses
+create_async_database_engine, which applies the Settings-driven pragmas
+(WAL, synchronous=NORMAL, busy_timeout, mmap and cache size).
+
+Each signin runs the database part of /auth/signin for a user without a
+session: the user/session lookup followed by the session INSERT. Argon2
+verification is left out so the numbers reflect the database alone.
+
+Usage (from the service directory):
+    python -m benchmarks.engine_profile_signin --requests 2000 --concurrency 20
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker
+
+from app.database import Base, create_async_database_engine, get_async_database_url
+from app.models import User
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.services.async_session_service import AsyncSessionService
+from app.services.session_cache import SessionCache
+
+
+async def run_signins(engine: AsyncEngine, total_requests: int, concurrency: int) -> float:
+    """
+    Create the schema and users, then run concurrent signins.
+    
+    Args:
+        engine: Async engine under test.
+        total_requests: Number of signins, one per distinct user.
+        concurrency: Maximum signins in flight.
+        
+    Returns:
+        Signins per second.
+    """
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(
+            insert(User),
+            [{"user_id": f"user_{index}", "password_hash": "unused"} for index in range(total_requests)]
+        )
+    
+    session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    semaphore = asyncio.Semaphore(concurrency)
+    cache = SessionCache(max_entries=0)
+    
+    async def signin(index: int) -> None:
+        async with semaphore, session_factory() as db:
+            user, existing_session = await AsyncUserRepository(db).get_user_with_valid_session(
+                f"user_{index}",
+                datetime.utcnow()
+            )
+            await AsyncSessionService(db, cache=cache).create_session_info(user, existing_session)
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(signin(index) for index in range(total_requests)))
+    elapsed = time.perf_counter() - started
+    await engine.dispose()
+    return total_requests / elapsed
+
+
+async def main(total_requests: int, concurrency: int) -> None:
+    """
+    Run the benchmark with the default and the tuned engine.
+    
+    Args:
+        total_requests: Number of signins per engine.
+        concurrency: Maximum signins in flight.
+    """
+    directory = tempfile.mkdtemp()
+    default_url = f"sqlite:///{os.path.join(directory, 'default.db')}"
+    tuned_url = f"sqlite:///{os.path.join(directory, 'tuned.db')}"
+    
+    default_rate = await run_signins(
+        create_async_engine(get_async_database_url(default_url)),
+        total_requests,
+        concurrency
+    )
+    tuned_rate = await run_signins(create_async_database_engine(tuned_url), total_requests, concurrency)
+    
+    print(f"requests={total_requests} concurrency={concurrency}")
+    print(f"default engine: {default_rate:8.1f} signins/s")
+    print(f"tuned engine:   {tuned_rate:8.1f} signins/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.requests, arguments.concurrency))
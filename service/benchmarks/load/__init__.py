@@ -0,0 +1,8 @@
+"""
+Load-testing and latency benchmark suite for the auth API.
+
+Run from the service directory:
+    python -m benchmarks.load --target inprocess
+    python -m benchmarks.load --target uvicorn --output results.json
+    python -m benchmarks.load --url http://localhost:8000 --baseline baseline.json
+"""
@@ -0,0 +1,200 @@
+"""
+Command line entry point for the load-testing suite.
+
+Targets:
+    inprocess  the app served through httpx's ASGI transport (default)
+    uvicorn    a uvicorn subprocess started on a free local port
+    --url      an already running server
+
+Results are printed as a table and optionally written as JSON. With
+--baseline, the run exits with status 1 if any scenario regresses.
+
+Every request comes from one client address, so the inprocess and
+uvicorn targets run with the sign-in throttle disabled. Disable it on a
+--url server too, or the signin scenario measures 429 responses.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import AsyncIterator, List
+
+import httpx
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.database import Base, create_async_database_engine, create_database_engine, get_async_db
+from app.main import app
+from app.services.hashing_executor import hashing_executor
+from app.services.signin_throttle import signin_throttle
+from benchmarks.load.runner import find_regressions, run_scenario
+from benchmarks.load.scenarios import SCENARIOS
+
+READY_TIMEOUT_SECONDS = 30
+
+
+def temporary_database_url() -> str:
+    """
+    Create an empty SQLite database file with the schema.
+    
+    Returns:
+        Database URL of the new file.
+    """
+    database_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'load.db')}"
+    engine = create_database_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    return database_url
+
+
+@asynccontextmanager
+async def inprocess_client() -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Serve the app in-process on a temporary database.
+    
+    Yields:
+        HTTP client using the ASGI transport.
+    """
+    async_engine = create_async_database_engine(temporary_database_url())
+    session_factory = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+    
+    async def override_get_async_db():
+        async with session_factory() as db:
+            yield db
+    
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    throttle_enabled, signin_throttle.enabled = signin_throttle.enabled, False
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://inprocess") as client:
+            yield client
+    finally:
+        app.dependency_overrides.clear()
+        signin_throttle.enabled = throttle_enabled
+        hashing_executor.shutdown()
+        await async_engine.dispose()
+
+
+@asynccontextmanager
+async def uvicorn_client() -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Start a uvicorn subprocess on a temporary database.
+    
+    Yields:
+        HTTP client bound to the subprocess.
+    """
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env={**os.environ, "DATABASE_URL": temporary_database_url(), "SIGNIN_THROTTLE_ENABLED": "False"}
+    )
+    try:
+        async with url_client(f"http://127.0.0.1:{port}") as client:
+            yield client
+    finally:
+        server.terminate()
+        server.wait()
+
+
+@asynccontextmanager
+async def url_client(base_url: str) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Connect to a running server, waiting until /health answers.
+    
+    Args:
+        base_url: Server base URL.
+        
+    Yields:
+        HTTP client bound to the server.
+    """
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        deadline = time.monotonic() + READY_TIMEOUT_SECONDS
+        while True:
+            try:
+                (await client.get("/health")).raise_for_status()
+                break
+            except httpx.HTTPError:
+                if time.monotonic() > deadline:
+                    raise
+                await asyncio.sleep(0.2)
+        yield client
+
+
+def print_table(results: dict) -> None:
+    """
+    Print scenario results as a table.
+    
+    Args:
+        results: Scenario summaries keyed by name.
+    """
+    print(f"{'scenario':<25}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>10}")
+    for name, result in results.items():
+        latency = result["latency_ms"]
+        print(
+            f"{name:<25}{result['throughput_rps']:>10.1f}{latency['p50']:>10.1f}"
+            f"{latency['p95']:>10.1f}{latency['p99']:>10.1f}{result['error_rate']:>10.2%}"
+        )
+
+
+async def main(arguments: argparse.Namespace) -> int:
+    """
+    Run the selected scenarios and compare them with the baseline.
+    
+    Args:
+        arguments: Parsed command line arguments.
+        
+    Returns:
+        Process exit code: 1 if a regression was found, 0 otherwise.
+    """
+    if arguments.url:
+        target, client_context = arguments.url, url_client(arguments.url)
+    elif arguments.target == "uvicorn":
+        target, client_context = "uvicorn", uvicorn_client()
+    else:
+        target, client_context = "inprocess", inprocess_client()
+    
+    results = {}
+    async with client_context as client:
+        for name in arguments.scenarios:
+            results[name] = await run_scenario(client, SCENARIOS[name](), arguments.requests, arguments.concurrency)
+    
+    print_table(results)
+    report = {
+        "target": target,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "scenarios": results,
+    }
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+    
+    if arguments.baseline:
+        with open(arguments.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)["scenarios"]
+        regressions: List[str] = find_regressions(results, baseline, arguments.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load", description="Auth API load tests.")
+    parser.add_argument("--target", choices=["inprocess", "uvicorn"], default="inprocess")
+    parser.add_argument("--url", help="Base URL of an already running server (overrides --target)")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="Results JSON of a previous run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,140 @@
+"""
+Load generation, latency statistics and baseline comparison.
+"""
+import asyncio
+import time
+from typing import Dict, List
+
+import httpx
+
+from benchmarks.load.scenarios import Scenario
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of sorted values.
+    
+    Args:
+        sorted_values: Values in ascending order.
+        fraction: Percentile as a fraction, e.g. 0.95.
+        
+    Returns:
+        Percentile value, or 0.0 for an empty list.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float, concurrency: int) -> dict:
+    """
+    Summarize one scenario run.
+    
+    Args:
+        latencies: Per-request latencies in seconds.
+        errors: Number of failed requests.
+        elapsed: Wall time of the run in seconds.
+        concurrency: Maximum requests in flight.
+        
+    Returns:
+        Dictionary with request counts, throughput, error rate and latency
+        percentiles in milliseconds.
+    """
+    sorted_ms = sorted(latency * 1000 for latency in latencies)
+    total_requests = len(latencies)
+    return {
+        "requests": total_requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "error_rate": errors / total_requests if total_requests else 0.0,
+        "throughput_rps": total_requests / elapsed if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "p50": percentile(sorted_ms, 0.50),
+            "p95": percentile(sorted_ms, 0.95),
+            "p99": percentile(sorted_ms, 0.99),
+            "max": sorted_ms[-1] if sorted_ms else 0.0,
+        },
+    }
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    total_requests: int,
+    concurrency: int
+) -> dict:
+    """
+    Set up a scenario, then send its requests and measure them.
+    
+    Args:
+        client: HTTP client bound to the target.
+        scenario: Scenario to run.
+        total_requests: Number of measured requests.
+        concurrency: Maximum requests in flight.
+        
+    Returns:
+        Summary as returned by summarize().
+    """
+    await scenario.setup(client, total_requests)
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+    
+    async def send(index: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                response = await scenario.request(client, index)
+                failed = not response.is_success
+            except httpx.HTTPError:
+                failed = True
+            latencies.append(time.perf_counter() - started)
+            errors += failed
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(send(index) for index in range(total_requests)))
+    return summarize(latencies, errors, time.perf_counter() - started, concurrency)
+
+
+def find_regressions(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """
+    Compare scenario results against a baseline.
+    
+    A scenario regresses when its p95 latency grows, or its throughput
+    drops, by more than ``tolerance``, or when its error rate exceeds the
+    baseline's.
+    
+    Args:
+        results: Scenario summaries of the current run, keyed by name.
+        baseline: Scenario summaries of the baseline run, keyed by name.
+        tolerance: Allowed relative change, e.g. 0.2 for 20%.
+        
+    Returns:
+        Human-readable regression descriptions (empty if none).
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        
+        p95 = result["latency_ms"]["p95"]
+        reference_p95 = reference["latency_ms"]["p95"]
+        if p95 > reference_p95 * (1 + tolerance):
+            regressions.append(f"{name}: p95 {p95:.1f}ms > baseline {reference_p95:.1f}ms")
+        
+        throughput = result["throughput_rps"]
+        reference_throughput = reference["throughput_rps"]
+        if throughput < reference_throughput * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {throughput:.1f} req/s < baseline {reference_throughput:.1f} req/s"
+            )
+        
+        if result["error_rate"] > reference["error_rate"]:
+            regressions.append(
+                f"{name}: error rate {result['error_rate']:.2%} > baseline {reference['error_rate']:.2%}"
+            )
+    return regressions
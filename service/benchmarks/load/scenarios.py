@@ -0,0 +1,182 @@
+"""
+Load-test scenarios for the auth API.
+"""
+import asyncio
+from typing import Dict
+from uuid import uuid4
+
+import httpx
+
+PASSWORD = "load_test_password"
+
+
+class Scenario:
+    """
+    A repeatable request pattern.
+    
+    Subclasses implement request(); setup() prepares any data the requests
+    rely on and is excluded from the measurements. User ids are prefixed
+    with a per-run id so scenarios can run repeatedly against one database.
+    """
+    
+    name = ""
+    description = ""
+    
+    def __init__(self):
+        """
+        Initialize the scenario with a unique user id prefix.
+        """
+        self.prefix = f"load_{uuid4().hex[:8]}"
+    
+    async def setup(self, client: httpx.AsyncClient, total_requests: int) -> None:
+        """
+        Prepare data before measuring.
+        
+        Args:
+            client: HTTP client bound to the target.
+            total_requests: Number of requests the run will send.
+        """
+    
+    async def request(self, client: httpx.AsyncClient, index: int) -> httpx.Response:
+        """
+        Send one measured request.
+        
+        Args:
+            client: HTTP client bound to the target.
+            index: Request number within the run.
+            
+        Returns:
+            HTTP response.
+        """
+        raise NotImplementedError
+    
+    async def signup(self, client: httpx.AsyncClient, user_id: str) -> httpx.Response:
+        """
+        Sign up a user with the scenario password.
+        """
+        return await client.post("/auth/signup", json={"user_id": user_id, "password": PASSWORD})
+    
+    async def signin(self, client: httpx.AsyncClient, user_id: str) -> httpx.Response:
+        """
+        Sign in a user with the scenario password.
+        """
+        return await client.post("/auth/signin", json={"user_id": user_id, "password": PASSWORD})
+
+
+class HealthScenario(Scenario):
+    """
+    GET /health, the floor for request overhead.
+    """
+    
+    name = "health"
+    description = "GET /health"
+    
+    async def request(self, client: httpx.AsyncClient, index: int) -> httpx.Response:
+        """
+        Check service health.
+        """
+        return await client.get("/health")
+
+
+class SignupBurstScenario(Scenario):
+    """
+    A burst of signups for distinct new users.
+    """
+    
+    name = "signup_burst"
+    description = "POST /auth/signup for a new user per request"
+    
+    async def request(self, client: httpx.AsyncClient, index: int) -> httpx.Response:
+        """
+        Sign up the next new user.
+        """
+        return await self.signup(client, f"{self.prefix}_{index}")
+
+
+class SigninExistingSessionScenario(Scenario):
+    """
+    Repeated signins of one user whose session is reused.
+    """
+    
+    name = "signin_existing_session"
+    description = "POST /auth/signin for a user with a valid session"
+    
+    async def setup(self, client: httpx.AsyncClient, total_requests: int) -> None:
+        """
+        Create the shared user and its session.
+        """
+        (await self.signup(client, self.prefix)).raise_for_status()
+        (await self.signin(client, self.prefix)).raise_for_status()
+    
+    async def request(self, client: httpx.AsyncClient, index: int) -> httpx.Response:
+        """
+        Sign in the shared user.
+        """
+        return await self.signin(client, self.prefix)
+
+
+class SigninColdScenario(Scenario):
+    """
+    Signins of distinct users that have no session yet.
+    """
+    
+    name = "signin_cold"
+    description = "POST /auth/signin creating a new session per request"
+    setup_concurrency = 8
+    
+    async def setup(self, client: httpx.AsyncClient, total_requests: int) -> None:
+        """
+        Create one user per request.
+        """
+        semaphore = asyncio.Semaphore(self.setup_concurrency)
+        
+        async def signup(index: int) -> None:
+            async with semaphore:
+                (await self.signup(client, f"{self.prefix}_{index}")).raise_for_status()
+        
+        await asyncio.gather(*(signup(index) for index in range(total_requests)))
+    
+    async def request(self, client: httpx.AsyncClient, index: int) -> httpx.Response:
+        """
+        Sign in the next user without a session.
+        """
+        return await self.signin(client, f"{self.prefix}_{index}")
+
+
+class MixedTrafficScenario(Scenario):
+    """
+    60% health checks, 30% signins with a valid session, 10% signups.
+    """
+    
+    name = "mixed"
+    description = "60% GET /health, 30% existing-session signin, 10% signup"
+    
+    async def setup(self, client: httpx.AsyncClient, total_requests: int) -> None:
+        """
+        Create the shared user and its session.
+        """
+        (await self.signup(client, self.prefix)).raise_for_status()
+        (await self.signin(client, self.prefix)).raise_for_status()
+    
+    async def request(self, client: httpx.AsyncClient, index: int) -> httpx.Response:
+        """
+        Send the request for this slot of the traffic mix.
+        """
+        slot = index % 10
+        if slot < 6:
+            return await client.get("/health")
+        if slot < 9:
+            return await self.signin(client, self.prefix)
+        return await self.signup(client, f"{self.prefix}_{index}")
+
+
+SCENARIOS: Dict[str, type] = {
+    scenario.name: scenario
+    for scenario in (
+        HealthScenario,
+        SignupBurstScenario,
+        SigninExistingSessionScenario,
+        SigninColdScenario,
+        MixedTrafficScenario,
+    )
+}
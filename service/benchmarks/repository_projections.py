@@ -0,0 +1,204 @@
+"""
+Compare allocations and latency per lookup: ORM entities versus column projections.
+
+Each lookup on the request path runs three ways against one SQLite file
+filled with --users users and one session each, on a fresh database
+session per lookup as a request would:
+
+  token    session by token: select(Session) with joinedload(Session.user),
+           versus SessionRepository.get_session_info_by_token
+  latest   a user's latest valid session: select(Session) ordered by
+           start_time, versus SessionRepository.get_valid_session_by_user_id
+  exists   user presence: loading the User, versus UserRepository.user_exists
+
+Memory is traced with tracemalloc over a separate, shorter pass, since
+tracing slows the timed pass down: "peak" is the most allocated at once
+during a lookup and "held" what the open session still references when
+it returns.
+
+Usage (from the service directory):
+    python -m benchmarks.repository_projections --users 10000 --lookups 20000
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable, List, Tuple
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session as DBSession, joinedload, sessionmaker
+
+from app.database import Base, create_database_engine
+from app.models import Session, User
+from app.repositories.session_repository import SessionRepository
+from app.repositories.user_repository import UserRepository
+from app.session_tokens import hash_token, new_session_token
+
+
+def orm_token(db: DBSession, token: str, user_id: str, user_pk: int, now: datetime) -> bool:
+    """
+    Load the session entity and its user by token, as get_session_by_token does.
+    """
+    session = db.scalars(
+        select(Session).options(joinedload(Session.user)).where(Session.token_digest == hash_token(token))
+    ).first()
+    return session is not None and session.max_time > now and session.user.user_id == user_id
+
+
+def projected_token(db: DBSession, token: str, user_id: str, user_pk: int, now: datetime) -> bool:
+    """
+    Select the session info columns by token.
+    """
+    return SessionRepository(db).get_session_info_by_token(token, now) is not None
+
+
+def orm_latest(db: DBSession, token: str, user_id: str, user_pk: int, now: datetime) -> bool:
+    """
+    Load a user's latest valid session entity.
+    """
+    session = db.scalars(
+        select(Session).where(
+            Session.user_id == user_pk,
+            Session.max_time > now
+        ).order_by(Session.start_time.desc()).limit(1)
+    ).first()
+    return session is not None
+
+
+def projected_latest(db: DBSession, token: str, user_id: str, user_pk: int, now: datetime) -> bool:
+    """
+    Select a user's latest valid session columns.
+    """
+    return SessionRepository(db).get_valid_session_by_user_id(user_pk, now) is not None
+
+
+def orm_exists(db: DBSession, token: str, user_id: str, user_pk: int, now: datetime) -> bool:
+    """
+    Load the User to check that it exists.
+    """
+    return db.scalars(select(User).where(User.user_id == user_id)).first() is not None
+
+
+def projected_exists(db: DBSession, token: str, user_id: str, user_pk: int, now: datetime) -> bool:
+    """
+    Check that the user exists with EXISTS.
+    """
+    return UserRepository(db).user_exists(user_id)
+
+
+LOOKUPS = {
+    "token": (orm_token, projected_token),
+    "latest": (orm_latest, projected_latest),
+    "exists": (orm_exists, projected_exists),
+}
+
+
+def build(factory: sessionmaker, users: int) -> List[Tuple[str, str, int]]:
+    """
+    Create the schema and one user with one valid session per index.
+    
+    Returns:
+        (token, user_id, users.id) for every session.
+    """
+    now = datetime.utcnow()
+    tokens = [new_session_token() for _ in range(users)]
+    with factory() as db:
+        Base.metadata.create_all(db.get_bind())
+        db.execute(insert(User), [
+            {"id": index + 1, "user_id": f"user_{index}", "password_hash": "unused"}
+            for index in range(users)
+        ])
+        db.execute(insert(Session), [
+            {
+                "user_id": index + 1,
+                "token_digest": hash_token(token),
+                "start_time": now,
+                "max_time": now + timedelta(hours=1)
+            }
+            for index, token in enumerate(tokens)
+        ])
+        db.commit()
+    return [(token, f"user_{index}", index + 1) for index, token in enumerate(tokens)]
+
+
+def measure(factory: sessionmaker, lookup: Callable, probes: List[Tuple[str, str, int]]) -> List[float]:
+    """
+    Time lookups, each on a fresh database session.
+    
+    Returns:
+        Latencies in microseconds.
+    """
+    now = datetime.utcnow()
+    latencies = []
+    for token, user_id, user_pk in probes:
+        started = time.perf_counter()
+        with factory() as db:
+            assert lookup(db, token, user_id, user_pk, now)
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+    return latencies
+
+
+def allocations(factory: sessionmaker, lookup: Callable, probes: List[Tuple[str, str, int]]) -> Tuple[float, float]:
+    """
+    Trace memory allocated by lookups, each on a fresh database session.
+    
+    Returns:
+        Peak bytes allocated during a lookup, and bytes still held by the
+        session and its results when the lookup returns, per lookup.
+    """
+    now = datetime.utcnow()
+    peak_bytes = 0
+    held_bytes = 0
+    tracemalloc.start()
+    for token, user_id, user_pk in probes:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        with factory() as db:
+            result = lookup(db, token, user_id, user_pk, now)
+            current, peak = tracemalloc.get_traced_memory()
+        assert result
+        peak_bytes += peak - baseline
+        held_bytes += current - baseline
+    tracemalloc.stop()
+    return peak_bytes / len(probes), held_bytes / len(probes)
+
+
+def main(users: int, lookups: int, traced: int) -> None:
+    """
+    Build the database and report allocations and latency for every lookup.
+    
+    Args:
+        users: Users (and sessions) in the database.
+        lookups: Random lookups timed per variant.
+        traced: Random lookups traced for allocations per variant.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_database_engine(f"sqlite:///{os.path.join(directory, 'projections.db')}")
+        factory = sessionmaker(bind=engine, autoflush=False)
+        population = build(factory, users)
+        probes = random.choices(population, k=lookups)
+        
+        for name, variants in LOOKUPS.items():
+            for label, lookup in zip(("orm", "projected"), variants):
+                measure(factory, lookup, probes[:1000])
+                latencies = measure(factory, lookup, probes)
+                quantiles = statistics.quantiles(latencies, n=100)
+                peak_bytes, held_bytes = allocations(factory, lookup, probes[:traced])
+                print(
+                    f"{name:<7} {label:<10} p50={quantiles[49]:7.1f}us p99={quantiles[98]:7.1f}us "
+                    f"peak={peak_bytes:8.0f}B held={held_bytes:8.0f}B per lookup"
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--traced", type=int, default=200, help="Lookups traced for allocations")
+    arguments = parser.parse_args()
+    main(arguments.users, arguments.lookups, arguments.traced)
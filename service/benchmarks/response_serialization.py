@@ -0,0 +1,86 @@
+"""
+Benchmark per-request serialization cost of the signin response.
+
+"model" is the former path: the session info dict is copied into a
+SessionResponse, then FastAPI validates it against response_model,
+dumps it with jsonable_encoder and renders a JSONResponse. "json" and
+"orjson" build the response once from the dict with json_response, using
+each response class.
+
+Usage (from the service directory):
+    python -m benchmarks.response_serialization --iterations 20000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta
+from secrets import token_urlsafe
+from typing import Awaitable, Callable
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+import app.responses
+from app.responses import json_response
+from app.schemas import SessionResponse
+
+
+async def measure(render: Callable[[], Awaitable[bytes]], iterations: int) -> float:
+    """
+    Time a response rendering function.
+    
+    Args:
+        render: Coroutine function returning the response body.
+        iterations: Number of renders timed (in five rounds).
+        
+    Returns:
+        Median microseconds per render across the rounds.
+    """
+    rounds = []
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(iterations // 5):
+            await render()
+        rounds.append((time.perf_counter() - started) / (iterations // 5) * 1_000_000)
+    return statistics.median(rounds)
+
+
+async def main(iterations: int) -> None:
+    """
+    Compare the three response paths on one session info dict.
+    
+    Args:
+        iterations: Number of renders per path.
+    """
+    start_time = datetime.utcnow()
+    session_info = {
+        "token": token_urlsafe(32),
+        "user_id": "bench_user",
+        "start_time": start_time,
+        "max_time": start_time + timedelta(hours=1)
+    }
+    response_field = create_model_field("Response_signin", SessionResponse, mode="serialization")
+    
+    async def render_model() -> bytes:
+        content = await serialize_response(field=response_field, response_content=SessionResponse(**session_info))
+        return JSONResponse(content).body
+    
+    async def render_fast() -> bytes:
+        return json_response(session_info).body
+    
+    timings = {"model": await measure(render_model, iterations)}
+    for name, response_class in (("json", JSONResponse), ("orjson", ORJSONResponse)):
+        app.responses.ResponseClass = response_class
+        timings[name] = await measure(render_fast, iterations)
+    
+    for name, microseconds in timings.items():
+        print(f"{name:<8} {microseconds:7.2f}us per response ({timings['model'] / microseconds:4.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.iterations))
@@ -0,0 +1,141 @@
+"""
+Benchmark session validation throughput of each session store as concurrency grows.
+
+Every validator is an asyncio task calling AsyncSessionService.get_session_info
+with the token cache disabled, so each validation reaches the store. The SQL
+store gets a fresh database session per validation, as a request would.
+Without --redis-url the Redis store runs against fakeredis in process, which
+shares the event loop with the validators; point it at a real server for
+representative numbers.
+
+Usage (from the service directory):
+    python -m benchmarks.session_stores --validations 4000 --concurrency 1 4 16 64
+    python -m benchmarks.session_stores --redis-url redis://localhost:6379/0
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List, Tuple
+
+from fakeredis import aioredis
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.database import Base, get_async_database_url
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.repositories.session_stores import MemorySessionStore, RedisSessionStore, SessionStore
+from app.services.async_session_service import AsyncSessionService
+from app.services.session_cache import SessionCache
+from app.session_tokens import new_session_token
+
+
+async def fill(store: SessionStore, user_pk: int, sessions: int) -> List[str]:
+    """
+    Store sessions for one user.
+    
+    Returns:
+        Their tokens.
+    """
+    tokens = []
+    start_time = datetime.utcnow()
+    for _ in range(sessions):
+        token = new_session_token()
+        await store.add(token, user_pk, "bench_user", start_time, start_time + timedelta(hours=1))
+        tokens.append(token)
+    return tokens
+
+
+async def run(validate: Callable[[], Awaitable], validations: int, concurrency: int) -> Tuple[float, List[float]]:
+    """
+    Run validations spread over concurrent validator tasks.
+    
+    Args:
+        validate: Coroutine function performing one validation.
+        validations: Total number of validations.
+        concurrency: Number of validator tasks.
+        
+    Returns:
+        Wall time in seconds and per-validation latencies in microseconds.
+    """
+    latencies: List[float] = []
+    
+    async def validator(count: int) -> None:
+        for _ in range(count):
+            started = time.perf_counter()
+            await validate()
+            latencies.append((time.perf_counter() - started) * 1_000_000)
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(validator(validations // concurrency) for _ in range(concurrency)))
+    return time.perf_counter() - started, latencies
+
+
+def report(name: str, concurrency: int, results: Tuple[float, List[float]]) -> None:
+    """
+    Print throughput and latency percentiles.
+    """
+    elapsed, latencies = results
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<7} validators={concurrency:<4} {len(latencies) / elapsed:10.0f}/s "
+        f"p50={quantiles[49]:9.1f}us p99={quantiles[98]:9.1f}us"
+    )
+
+
+async def main(validations: int, concurrency_levels: List[int], sessions: int, redis_url: str) -> None:
+    """
+    Run the benchmark for every store and concurrency level.
+    """
+    database_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    Base.metadata.create_all(bind=create_engine(database_url))
+    async_engine = create_async_engine(get_async_database_url(database_url))
+    session_factory = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+    async with session_factory() as db:
+        user = await AsyncUserRepository(db).create_user("bench_user", "not_a_real_hash")
+        sql_tokens = await fill(AsyncSessionService(db, storage="table").store, user.id, sessions)
+    
+    if redis_url is None:
+        redis_store = RedisSessionStore(aioredis.FakeRedis())
+    else:
+        redis_store = RedisSessionStore(url=redis_url, pool_size=max(concurrency_levels))
+    memory_store = MemorySessionStore()
+    stores = {
+        "memory": (memory_store, await fill(memory_store, user.id, sessions)),
+        "redis": (redis_store, await fill(redis_store, user.id, sessions)),
+    }
+    no_cache = SessionCache(max_entries=0)
+    
+    for concurrency in concurrency_levels:
+        async def validate_sql() -> None:
+            async with session_factory() as db:
+                service = AsyncSessionService(db, cache=no_cache, storage="table")
+                assert await service.get_session_info(random.choice(sql_tokens)) is not None
+        
+        report("sql", concurrency, await run(validate_sql, validations, concurrency))
+        
+        for name, (store, tokens) in stores.items():
+            service = AsyncSessionService(None, cache=no_cache, storage=name)
+            service.store = store
+            
+            async def validate(service=service, tokens=tokens) -> None:
+                assert await service.get_session_info(random.choice(tokens)) is not None
+            
+            report(name, concurrency, await run(validate, validations, concurrency))
+    
+    await redis_store.close()
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--validations", type=int, default=4000, help="Validations per store and level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--sessions", type=int, default=1000, help="Sessions stored per backend")
+    parser.add_argument("--redis-url", default=None, help="Redis server (default: in-process fake)")
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.validations, arguments.concurrency, arguments.sessions, arguments.redis_url))
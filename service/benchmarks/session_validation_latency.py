@@ -0,0 +1,99 @@
+"""
+Benchmark session token validation latency: database mode versus stateless mode.
+
+Database mode runs AsyncSessionService.get_session_info with the token cache
+disabled, so every validation is a database lookup. Stateless mode verifies
+the signed token's HMAC and expiry in pure Python.
+
+Usage (from the service directory):
+    python -m benchmarks.session_validation_latency --iterations 2000
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.database import Base, get_async_database_url
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.services.async_session_service import AsyncSessionService
+from app.services.session_cache import SessionCache
+from app.services.stateless_session_service import StatelessSessionService
+
+
+async def measure(validate: Callable[[], Awaitable], iterations: int) -> List[float]:
+    """
+    Time repeated validations.
+    
+    Args:
+        validate: Coroutine function performing one validation.
+        iterations: Number of validations to time.
+        
+    Returns:
+        Per-validation latencies in microseconds.
+    """
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await validate()
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+    return latencies
+
+
+def report(name: str, latencies: List[float]) -> None:
+    """
+    Print latency percentiles.
+    
+    Args:
+        name: Mode name.
+        latencies: Latencies in microseconds.
+    """
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<10} mean={statistics.fmean(latencies):9.1f}us "
+        f"p50={quantiles[49]:9.1f}us p99={quantiles[98]:9.1f}us"
+    )
+
+
+async def main(iterations: int) -> None:
+    """
+    Run the benchmark for both session modes.
+    
+    Args:
+        iterations: Number of validations per mode.
+    """
+    database_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    Base.metadata.create_all(bind=create_engine(database_url))
+    async_engine = create_async_engine(get_async_database_url(database_url))
+    session_factory = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+    
+    async with session_factory() as db:
+        user = await AsyncUserRepository(db).create_user("bench_user", "not_a_real_hash")
+        database_service = AsyncSessionService(db, cache=SessionCache(max_entries=0))
+        database_token = await database_service.create_session(user.id)
+        
+        async def validate_database():
+            assert await database_service.get_session_info(database_token) is not None
+        
+        report("database", await measure(validate_database, iterations))
+    
+    stateless_service = StatelessSessionService()
+    stateless_token = stateless_service.create_session("bench_user")
+    
+    async def validate_stateless():
+        assert stateless_service.get_session_info(stateless_token) is not None
+    
+    report("stateless", await measure(validate_stateless, iterations))
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=2000)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.iterations))
@@ -0,0 +1,94 @@
+"""
+Benchmark token cache hit rate and lookup throughput with several worker processes.
+
+Each worker process validates tokens drawn at random from one population,
+as a load balancer spreads a client's requests across uvicorn workers. A
+lookup that misses is filled into the cache, standing in for the store
+query and cache fill of AsyncSessionService.get_session_info. With the
+"process" backend every worker warms its own SessionCache; with "shared"
+all workers attach to one SharedSessionCache file, so a session cached
+by any worker is a hit on the others.
+
+Usage (from the service directory):
+    python -m benchmarks.shared_session_cache --workers 1 2 4 8 --lookups 50000
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from app.services.session_cache import SessionCache
+from app.services.shared_session_cache import SharedSessionCache
+
+
+def worker(backend: str, path: str, tokens: List[str], lookups: int, seed: int, start_at: float) -> Tuple[int, float]:
+    """
+    Validate random tokens against one worker's view of the cache.
+    
+    Returns:
+        Hits and seconds spent.
+    """
+    if backend == "shared":
+        cache = SharedSessionCache(path, max_entries=len(tokens))
+    else:
+        cache = SessionCache(max_entries=len(tokens))
+    choose = random.Random(seed).choice
+    now = datetime.utcnow()
+    max_time = now + timedelta(hours=1)
+    hits = 0
+    # Attach before the clock starts and begin together
+    cache.get("attach", now)
+    while time.time() < start_at:
+        time.sleep(0.001)
+    started = time.perf_counter()
+    for _ in range(lookups):
+        token = choose(tokens)
+        if cache.get(token, now) is not None:
+            hits += 1
+        else:
+            cache.set({"token": token, "user_id": "bench_user", "start_time": now, "max_time": max_time})
+    return hits, time.perf_counter() - started
+
+
+def run(backend: str, workers: int, tokens: List[str], lookups: int) -> Tuple[float, float]:
+    """
+    Run every worker process against a fresh cache.
+    
+    Returns:
+        Hit rate and aggregate lookups per second.
+    """
+    with tempfile.TemporaryDirectory(dir="/dev/shm" if os.path.isdir("/dev/shm") else None) as directory:
+        path = os.path.join(directory, "session_cache")
+        start_at = time.time() + 1.0
+        with multiprocessing.get_context("spawn").Pool(workers) as pool:
+            results = pool.starmap(
+                worker,
+                [(backend, path, tokens, lookups, seed, start_at) for seed in range(workers)]
+            )
+    hits = sum(result[0] for result in results)
+    elapsed = max(result[1] for result in results)
+    return hits / (lookups * workers), lookups * workers / elapsed
+
+
+def main(worker_counts: List[int], lookups: int, sessions: int) -> None:
+    """
+    Run the benchmark for both backends and every worker count.
+    """
+    tokens = [f"token_{index:08d}" for index in range(sessions)]
+    for workers in worker_counts:
+        for backend in ("process", "shared"):
+            hit_rate, rate = run(backend, workers, tokens, lookups)
+            print(f"{backend:<7} workers={workers:<3} hit_rate={hit_rate:6.1%} {rate:10.0f} lookups/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--lookups", type=int, default=50000, help="Lookups per worker")
+    parser.add_argument("--sessions", type=int, default=20000, help="Distinct tokens validated")
+    arguments = parser.parse_args()
+    main(arguments.workers, arguments.lookups, arguments.sessions)
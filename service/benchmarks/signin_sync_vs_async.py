@@ -0,0 +1,147 @@
+"""
+Benchmark /auth/signin throughput on the sync and async database stacks.
+
+The async stack is the real application. The sync stack is the same route
+wired to the blocking SessionLocal repositories, as before the async
+migration. Both share the hashing executor so only database access differs.
+
+Usage (from the service directory):
+    python -m benchmarks.signin_sync_vs_async --requests 200 --concurrency 20
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import Annotated
+
+import httpx
+from fastapi import Depends, FastAPI, HTTPException, status
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import Session as DBSession, sessionmaker
+
+from app.database import Base, get_async_db, get_async_database_url
+from app.main import app as async_app
+from app.repositories.user_repository import UserRepository
+from app.schemas import UserSignInRequest, SessionResponse
+from app.services.hashing_executor import hashing_executor
+from app.services.password_service import PasswordService
+from app.services.session_service import SessionService
+
+USER_ID = "bench_user"
+PASSWORD = "bench_password"
+
+
+def build_sync_app(session_factory: sessionmaker) -> FastAPI:
+    """
+    Build an app serving /auth/signin through the sync repositories.
+    
+    Args:
+        session_factory: Sync session factory bound to the benchmark database.
+        
+    Returns:
+        FastAPI application.
+    """
+    sync_app = FastAPI()
+    
+    def get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+    
+    @sync_app.post("/auth/signin", response_model=SessionResponse)
+    async def signin(
+        request: UserSignInRequest,
+        db: Annotated[DBSession, Depends(get_db)]
+    ) -> SessionResponse:
+        user = UserRepository(db).get_user_by_user_id(request.user_id)
+        if user is None or not await hashing_executor.verify_password(request.password, user.password_hash):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+        session_service = SessionService(db)
+        token = session_service.create_session(user.id)
+        return SessionResponse(**session_service.get_session_info(token))
+    
+    return sync_app
+
+
+async def run_load(app: FastAPI, total_requests: int, concurrency: int) -> float:
+    """
+    Send signin requests concurrently and measure throughput.
+    
+    Args:
+        app: Application under test.
+        total_requests: Number of requests to send.
+        concurrency: Maximum requests in flight.
+        
+    Returns:
+        Requests per second.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def signin():
+            async with semaphore:
+                response = await client.post(
+                    "/auth/signin",
+                    json={"user_id": USER_ID, "password": PASSWORD}
+                )
+                response.raise_for_status()
+        
+        # Warm up the hashing pool and connection pools
+        await signin()
+        started = time.perf_counter()
+        await asyncio.gather(*(signin() for _ in range(total_requests)))
+        elapsed = time.perf_counter() - started
+    
+    return total_requests / elapsed
+
+
+async def main(total_requests: int, concurrency: int) -> None:
+    """
+    Run the benchmark against both stacks and print requests/sec.
+    
+    Args:
+        total_requests: Number of requests per stack.
+        concurrency: Maximum requests in flight.
+    """
+    directory = tempfile.mkdtemp()
+    database_url = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+    
+    engine = create_engine(database_url, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with session_factory() as db:
+        UserRepository(db).create_user(USER_ID, PasswordService().hash_password(PASSWORD))
+    
+    async_engine = create_async_engine(get_async_database_url(database_url))
+    async_session_factory = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+    
+    async def override_get_async_db():
+        async with async_session_factory() as db:
+            yield db
+    
+    async_app.dependency_overrides[get_async_db] = override_get_async_db
+    try:
+        sync_rps = await run_load(build_sync_app(session_factory), total_requests, concurrency)
+        async_rps = await run_load(async_app, total_requests, concurrency)
+    finally:
+        async_app.dependency_overrides.clear()
+        hashing_executor.shutdown()
+        await async_engine.dispose()
+        engine.dispose()
+    
+    print(f"requests={total_requests} concurrency={concurrency}")
+    print(f"sync stack:  {sync_rps:8.1f} req/s")
+    print(f"async stack: {async_rps:8.1f} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.requests, arguments.concurrency))
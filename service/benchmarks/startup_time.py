@@ -0,0 +1,105 @@
+"""
+Measure worker import-to-first-request time.
+
+Each run migrates a fresh SQLite database, starts a single uvicorn worker
+on it and polls /health until it answers. The wall time from process
+spawn to the first response is reported next to the worker's own
+worker_startup_seconds metric (import, lifespan warm-up, first request).
+
+Usage (from the service directory):
+    python -m benchmarks.startup_time --runs 5
+    python -m benchmarks.startup_time --runs 5 --no-warm-up
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict
+
+import httpx
+
+
+def read_startup_phases(metrics_text: str) -> Dict[str, float]:
+    """
+    Extract worker_startup_seconds samples from a metrics page.
+    
+    Args:
+        metrics_text: Prometheus text exposition.
+        
+    Returns:
+        Seconds per startup phase.
+    """
+    phases = {}
+    for line in metrics_text.splitlines():
+        if line.startswith("worker_startup_seconds{"):
+            labels, value = line.rsplit(" ", 1)
+            phases[labels.split('"')[1]] = float(value)
+    return phases
+
+
+def run_once(warm_up: bool) -> Dict[str, float]:
+    """
+    Start one worker on a migrated database and time its first response.
+    
+    Args:
+        warm_up: Whether the lifespan warm-up is enabled.
+        
+    Returns:
+        Seconds per phase, plus "spawn_to_response" measured by the client.
+    """
+    environment = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'startup.db')}",
+        "STARTUP_WARM_UP": str(warm_up),
+    }
+    subprocess.run([sys.executable, "-m", "alembic", "upgrade", "head"], env=environment, check=True, capture_output=True)
+    
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=environment
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}") as client:
+            while True:
+                try:
+                    client.get("/health").raise_for_status()
+                    break
+                except httpx.TransportError:
+                    time.sleep(0.005)
+            spawn_to_response = time.perf_counter() - started
+            phases = read_startup_phases(client.get("/metrics").text)
+    finally:
+        server.terminate()
+        server.wait()
+    return {**phases, "spawn_to_response": spawn_to_response}
+
+
+def main(runs: int, warm_up: bool) -> None:
+    """
+    Run several worker starts and print the median of each phase.
+    
+    Args:
+        runs: Number of worker starts.
+        warm_up: Whether the lifespan warm-up is enabled.
+    """
+    results = [run_once(warm_up) for _ in range(runs)]
+    for phase in ("import", "lifespan", "first_request", "spawn_to_response"):
+        values = [result[phase] for result in results if phase in result]
+        print(f"{phase:<18} median={statistics.median(values) * 1000:8.1f}ms max={max(values) * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--no-warm-up", dest="warm_up", action="store_false")
+    arguments = parser.parse_args()
+    main(arguments.runs, arguments.warm_up)
@@ -0,0 +1,148 @@
+"""
+Compare session token index size and lookup latency: raw text tokens
+versus 32-byte SHA-256 digests.
+
+Two SQLite databases are filled with the same --rows sessions, one with
+the former layout (unique index on the 43-character token) and one with
+the current layout (unique index on token_digest). Index sizes come from
+the dbstat virtual table; lookups fetch random existing sessions by
+token, including the SHA-256 of the digest layout.
+
+Usage (from the service directory):
+    python -m benchmarks.token_index --rows 10000000 --lookups 20000
+"""
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from app.session_tokens import hash_token, new_session_token
+
+LAYOUTS = {
+    "text": (
+        "CREATE TABLE sessions (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, token VARCHAR NOT NULL, "
+        "start_time DATETIME NOT NULL, max_time DATETIME NOT NULL)",
+        "CREATE UNIQUE INDEX ix_sessions_token ON sessions (token)",
+        "INSERT INTO sessions (user_id, token, start_time, max_time) VALUES (?, ?, ?, ?)",
+        "SELECT id, user_id, start_time, max_time FROM sessions WHERE token = ?",
+        "ix_sessions_token",
+    ),
+    "digest": (
+        "CREATE TABLE sessions (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, token_digest BLOB NOT NULL, "
+        "start_time DATETIME NOT NULL, max_time DATETIME NOT NULL)",
+        "CREATE UNIQUE INDEX ix_sessions_token_digest ON sessions (token_digest)",
+        "INSERT INTO sessions (user_id, token_digest, start_time, max_time) VALUES (?, ?, ?, ?)",
+        "SELECT id, user_id, start_time, max_time FROM sessions WHERE token_digest = ?",
+        "ix_sessions_token_digest",
+    ),
+}
+
+
+def build(path: str, layout: str, tokens: List[str], batch_size: int = 100000) -> None:
+    """
+    Create and fill one database.
+    
+    Args:
+        path: Database file path.
+        layout: "text" or "digest".
+        tokens: Session tokens, one per row.
+        batch_size: Rows inserted per transaction.
+    """
+    create_table, create_index, insert, _, _ = LAYOUTS[layout]
+    start_time = datetime(2026, 1, 1).isoformat(" ")
+    max_time = (datetime(2026, 1, 1) + timedelta(hours=1)).isoformat(" ")
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=OFF")
+    connection.execute("PRAGMA synchronous=OFF")
+    connection.execute(create_table)
+    connection.execute(create_index)
+    for offset in range(0, len(tokens), batch_size):
+        if layout == "text":
+            rows = [
+                (index % 100000, tokens[index], start_time, max_time)
+                for index in range(offset, min(offset + batch_size, len(tokens)))
+            ]
+        else:
+            rows = [
+                (index % 100000, hash_token(tokens[index]), start_time, max_time)
+                for index in range(offset, min(offset + batch_size, len(tokens)))
+            ]
+        with connection:
+            connection.executemany(insert, rows)
+    connection.close()
+
+
+def measure(lookup: Callable[[str], None], tokens: List[str]) -> List[float]:
+    """
+    Time lookups by token.
+    
+    Args:
+        lookup: Function fetching one session by token.
+        tokens: Tokens to look up.
+        
+    Returns:
+        Latencies in microseconds.
+    """
+    latencies = []
+    for token in tokens:
+        started = time.perf_counter()
+        lookup(token)
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+    return latencies
+
+
+def main(rows: int, lookups: int) -> None:
+    """
+    Build both layouts and report index size and lookup latency.
+    
+    Args:
+        rows: Sessions per database.
+        lookups: Random lookups timed per database.
+    """
+    tokens = [new_session_token() for _ in range(rows)]
+    probes = random.sample(tokens, min(lookups, rows))
+    directory = tempfile.mkdtemp()
+    
+    for layout in LAYOUTS:
+        path = os.path.join(directory, f"{layout}.db")
+        started = time.perf_counter()
+        build(path, layout, tokens)
+        build_seconds = time.perf_counter() - started
+        
+        _, _, _, select, index_name = LAYOUTS[layout]
+        connection = sqlite3.connect(path)
+        index_bytes = connection.execute(
+            "SELECT sum(pgsize) FROM dbstat WHERE name = ?", (index_name,)
+        ).fetchone()[0]
+        
+        if layout == "text":
+            def lookup(token: str) -> None:
+                assert connection.execute(select, (token,)).fetchone() is not None
+        else:
+            def lookup(token: str) -> None:
+                assert connection.execute(select, (hash_token(token),)).fetchone() is not None
+        
+        measure(lookup, probes[:1000])
+        latencies = measure(lookup, probes)
+        quantiles = statistics.quantiles(latencies, n=100)
+        print(
+            f"{layout:<7} rows={rows} build={build_seconds:6.1f}s "
+            f"index={index_bytes / 1024 / 1024:8.1f}MiB ({index_bytes / rows:5.1f}B/row) "
+            f"file={os.path.getsize(path) / 1024 / 1024:8.1f}MiB "
+            f"lookup p50={quantiles[49]:6.1f}us p99={quantiles[98]:6.1f}us"
+        )
+        connection.close()
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    arguments = parser.parse_args()
+    main(arguments.rows, arguments.lookups)
@@ -0,0 +1,55 @@
+"""
+Measure the signup user_id filter's false-positive rate, memory and speed.
+
+The filter is filled with --users user_ids starting from a deliberately
+small first layer, so it grows through several layers. It is then probed
+with as many user_ids that were never added; every hit is a false positive.
+
+Usage (from the service directory):
+    python -m benchmarks.user_id_filter --users 1000000 --capacity 100000
+"""
+import argparse
+import time
+
+from app.services.user_id_filter import UserIdFilter
+
+
+def main(users: int, capacity: int, error_rate: float) -> None:
+    """
+    Fill and probe a filter, then print its statistics.
+    
+    Args:
+        users: Number of user_ids added and probed.
+        capacity: Capacity of the first layer.
+        error_rate: Configured false-positive rate.
+    """
+    user_id_filter = UserIdFilter(capacity=capacity, error_rate=error_rate)
+    user_id_filter.ready = True
+    
+    started = time.perf_counter()
+    for index in range(users):
+        user_id_filter.add(f"user_{index}")
+    add_seconds = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    false_positives = sum(user_id_filter.might_contain(f"absent_{index}") for index in range(users))
+    lookup_seconds = time.perf_counter() - started
+    
+    stats = user_id_filter.stats()
+    print(f"items              {stats['items']}")
+    print(f"layers             {stats['layers']}")
+    print(f"memory             {stats['memory_bytes'] / 1024 / 1024:.2f} MiB "
+          f"({stats['memory_bytes'] * 8 / users:.1f} bits per user_id)")
+    print(f"false positives    measured={false_positives / users:.4%} "
+          f"estimated={stats['false_positive_rate']:.4%} target={error_rate:.4%}")
+    print(f"add                {add_seconds / users * 1_000_000:.2f}us per user_id")
+    print(f"lookup (miss)      {lookup_seconds / users * 1_000_000:.2f}us per user_id")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=1000000)
+    parser.add_argument("--capacity", type=int, default=100000)
+    parser.add_argument("--error-rate", type=float, default=0.01)
+    arguments = parser.parse_args()
+    main(arguments.users, arguments.capacity, arguments.error_rate)
@@ -0,0 +1,63 @@
+"""
+Alembic environment: runs migrations against the configured database.
+"""
+from logging.config import fileConfig
+
+from alembic import context
+
+from app.config import settings
+from app.database import Base, create_database_engine
+from app.repositories.async_partitioned_session_repository import PARTITION_PREFIX
+import app.models  # noqa: F401 (registers the tables on Base.metadata)
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """
+    Leave the partitioned session tables, created at run time, out of autogenerate.
+    """
+    return not (type_ == "table" and name.startswith(PARTITION_PREFIX))
+
+
+def run_migrations_offline() -> None:
+    """
+    Emit the migration SQL without connecting to the database.
+    """
+    context.configure(
+        url=settings.database_url,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        render_as_batch=settings.database_url.startswith("sqlite")
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """
+    Run migrations on a connection to the configured database.
+    """
+    engine = create_database_engine(settings.database_url)
+    with engine.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+            render_as_batch=connection.dialect.name == "sqlite"
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+    engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
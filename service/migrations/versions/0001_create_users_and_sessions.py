@@ -0,0 +1,61 @@
+"""
+Create the users and sessions tables.
+
+Databases created by the former import-time create_all already have some
+or all of these objects; only the missing ones are created, so such a
+database can simply be upgraded.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Create the tables and indexes that do not exist yet.
+    """
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    
+    if "users" not in tables:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("user_id", sa.String(), nullable=False),
+            sa.Column("password_hash", sa.String(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=True)
+        )
+        op.create_index("ix_users_id", "users", ["id"])
+        op.create_index("ix_users_user_id", "users", ["user_id"], unique=True)
+    
+    if "sessions" not in tables:
+        op.create_table(
+            "sessions",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("token", sa.String(), nullable=False),
+            sa.Column("start_time", sa.DateTime(), nullable=False),
+            sa.Column("max_time", sa.DateTime(), nullable=False)
+        )
+        op.create_index("ix_sessions_id", "sessions", ["id"])
+        op.create_index("ix_sessions_token", "sessions", ["token"], unique=True)
+    
+    session_indexes = {index["name"] for index in sa.inspect(op.get_bind()).get_indexes("sessions")}
+    if "ix_sessions_max_time" not in session_indexes:
+        op.create_index("ix_sessions_max_time", "sessions", ["max_time"])
+
+
+def downgrade() -> None:
+    """
+    Drop both tables.
+    """
+    op.drop_table("sessions")
+    op.drop_table("users")
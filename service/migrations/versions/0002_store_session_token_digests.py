@@ -0,0 +1,75 @@
+"""
+Store sessions by token digest instead of the raw token.
+
+Each existing token is replaced by its SHA-256 digest, so live sessions
+keep working. Downgrading cannot restore raw tokens and deletes every
+session.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+import hashlib
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 10000
+
+
+def upgrade() -> None:
+    """
+    Add the digest column, fill it, drop the token column.
+    """
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.add_column(sa.Column("token_digest", sa.LargeBinary(32), nullable=True))
+    
+    connection = op.get_bind()
+    sessions = sa.table(
+        "sessions",
+        sa.column("id", sa.Integer),
+        sa.column("token", sa.String),
+        sa.column("token_digest", sa.LargeBinary)
+    )
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(sessions.c.id, sessions.c.token).where(
+                sessions.c.id > last_id
+            ).order_by(sessions.c.id).limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            sessions.update().where(sessions.c.id == sa.bindparam("session_id")).values(
+                token_digest=sa.bindparam("digest")
+            ),
+            [
+                {"session_id": row.id, "digest": hashlib.sha256(row.token.encode("utf-8")).digest()}
+                for row in rows
+            ]
+        )
+        last_id = rows[-1].id
+    
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.drop_index("ix_sessions_token")
+        batch_op.drop_column("token")
+        batch_op.alter_column("token_digest", existing_type=sa.LargeBinary(32), nullable=False)
+        batch_op.create_index("ix_sessions_token_digest", ["token_digest"], unique=True)
+
+
+def downgrade() -> None:
+    """
+    Restore the token column. Raw tokens are gone, so sessions are deleted.
+    """
+    op.execute("DELETE FROM sessions")
+    with op.batch_alter_table("sessions") as batch_op:
+        batch_op.drop_index("ix_sessions_token_digest")
+        batch_op.drop_column("token_digest")
+        batch_op.add_column(sa.Column("token", sa.String(), nullable=False))
+        batch_op.create_index("ix_sessions_token", ["token"], unique=True)
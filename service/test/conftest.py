@@ -1,13 +1,89 @@
 """
 Pytest configuration and fixtures.
 """
+import cProfile
+import os
+import pstats
+
+TEST_DATABASE_URL = "sqlite:///./test.db"
+
+# Point the application's own engine, used by the lifespan warm-up, at the
+# test database before app.config reads the settings
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
 import pytest
-from sqlalchemy import create_engine
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from fastapi.testclient import TestClient
 
-from app.database import Base, get_db
+from app.database import (
+    Base, get_db, get_async_db, get_async_session_factory, create_database_engine, create_async_database_engine
+)
 from app.main import app
+from app.services.signin_throttle import signin_throttle
+from app.services.user_id_filter import user_id_filter
+
+
+def create_test_async_engine():
+    """
+    Create an async engine on the test database.
+    
+    NullPool keeps no connections between sessions, so the engine can be
+    used from any event loop, including the one TestClient runs in.
+    
+    Returns:
+        Async engine instance.
+    """
+    return create_async_database_engine(TEST_DATABASE_URL, poolclass=NullPool)
+
+
+def profiled_calls(function: Callable[[], object], repeat: int = 50) -> float:
+    """
+    Count the Python function calls a warmed-up call makes under cProfile.
+    
+    Args:
+        function: Function to call.
+        repeat: Calls averaged over.
+        
+    Returns:
+        Function calls per call.
+    """
+    function()
+    profile = cProfile.Profile()
+    profile.enable()
+    for _ in range(repeat):
+        function()
+    profile.disable()
+    return pstats.Stats(profile).total_calls / repeat
+
+
+def make_session_info(
+    token: str,
+    max_time: datetime,
+    user_id: str = "test_user",
+    start_time: Optional[datetime] = None
+) -> dict:
+    """
+    Build a session info dictionary for tests.
+    
+    Args:
+        token: Session token.
+        max_time: Session expiration timestamp.
+        user_id: User identifier.
+        start_time: Session start timestamp (defaults to an hour before max_time).
+        
+    Returns:
+        Session info dictionary.
+    """
+    return {
+        "token": token,
+        "user_id": user_id,
+        "start_time": start_time if start_time is not None else max_time - timedelta(hours=1),
+        "max_time": max_time
+    }
 
 
 @pytest.fixture(scope="function")
@@ -18,7 +94,7 @@ def test_db():
     Yields:
         Database session.
     """
-    engine = create_engine("sqlite:///./test.db")
+    engine = create_database_engine(TEST_DATABASE_URL)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     Base.metadata.create_all(bind=engine)
     
@@ -30,6 +106,37 @@ def test_db():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(scope="function")
+async def async_session_factory(test_db):
+    """
+    Create an async session factory on the test database for each test.
+    
+    Args:
+        test_db: Test database session (creates and drops the schema).
+        
+    Yields:
+        Async session factory.
+    """
+    engine = create_test_async_engine()
+    yield async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture(scope="function")
+async def async_test_db(async_session_factory):
+    """
+    Create an async session on the test database for each test.
+    
+    Args:
+        async_session_factory: Async session factory on the test database.
+        
+    Yields:
+        Async database session.
+    """
+    async with async_session_factory() as db:
+        yield db
+
+
 @pytest.fixture(scope="function")
 def client(test_db):
     """
@@ -41,14 +148,23 @@ def client(test_db):
     Yields:
         Test client instance.
     """
+    async_engine = create_test_async_engine()
+    TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+    
     def override_get_db():
         try:
             yield test_db
         finally:
             pass
     
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+    
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_session_factory] = lambda: TestingAsyncSessionLocal
+    signin_throttle.clear()
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
-
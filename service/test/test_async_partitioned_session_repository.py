@@ -0,0 +1,211 @@
+"""
+Unit tests for the asyncio partitioned session repository.
+"""
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import func, inspect, select
+from app.repositories.async_partitioned_session_repository import (
+    AsyncPartitionedSessionRepository,
+    PARTITION_PREFIX,
+    partition_index,
+    partition_table
+)
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.services.async_session_service import AsyncSessionService
+from app.services.session_cache import SessionCache
+from app.services.session_sweeper import SessionSweeper
+from app.session_tokens import hash_token
+
+# Start of an hour, so the partition boundaries below are predictable
+BASE_TIME = datetime(2030, 1, 1)
+
+
+async def partition_names(db) -> list:
+    """
+    List the partition tables present in the database.
+    """
+    table_names = await db.run_sync(lambda session: inspect(session.connection()).get_table_names())
+    return sorted(name for name in table_names if name.startswith(PARTITION_PREFIX))
+
+
+@pytest.fixture
+async def repository(async_test_db):
+    """
+    Partitioned repository with hour-long periods and two-hour sessions.
+    
+    Yields:
+        Repository whose partitions for BASE_TIME exist; every partition
+        is dropped afterwards.
+    """
+    repository = AsyncPartitionedSessionRepository(async_test_db, partition_seconds=3600, max_age_seconds=7200)
+    await repository.ensure_partitions(BASE_TIME)
+    yield repository
+    await repository.drop_expired_partitions(datetime(9999, 1, 1))
+
+
+async def test_partition_index():
+    """
+    Test that expiries map to whole periods since the epoch.
+    """
+    assert partition_index(datetime(1970, 1, 1, 0, 59), 3600) == 0
+    assert partition_index(datetime(1970, 1, 1, 1), 3600) == 1
+
+
+async def test_ensure_partitions_creates_live_and_next_tables(repository, async_test_db):
+    """
+    Test that the current period, later expiry periods and one more exist.
+    """
+    first = partition_index(BASE_TIME, 3600)
+    
+    assert await partition_names(async_test_db) == sorted(
+        f"{PARTITION_PREFIX}{index}" for index in range(first, first + 4)
+    )
+
+
+async def test_sessions_are_found_across_partitions(repository, async_test_db):
+    """
+    Test that sessions written to different tables are all found.
+    """
+    user = await AsyncUserRepository(async_test_db).create_user("test_user", "hashed_password")
+    await repository.insert_session(user.id, "short_token", BASE_TIME, BASE_TIME + timedelta(minutes=30))
+    await repository.insert_session(user.id, "long_token", BASE_TIME, BASE_TIME + timedelta(minutes=90))
+    
+    short = await repository.get_session_info_by_token("short_token", BASE_TIME)
+    long = await repository.get_session_info_by_token("long_token", BASE_TIME)
+    
+    assert short.user_id == "test_user"
+    assert short.max_time == BASE_TIME + timedelta(minutes=30)
+    assert long.max_time == BASE_TIME + timedelta(minutes=90)
+    assert await repository.get_session_info_by_token("short_token", BASE_TIME + timedelta(minutes=45)) is None
+    assert await repository.get_session_info_by_token("unknown_token", BASE_TIME) is None
+
+
+async def test_insert_session_creates_missing_partition(repository, async_test_db):
+    """
+    Test that an insert beyond the ensured periods creates its table.
+    """
+    user = await AsyncUserRepository(async_test_db).create_user("test_user", "hashed_password")
+    max_time = BASE_TIME + timedelta(hours=10)
+    table = partition_table(partition_index(max_time, 3600))
+    assert table.name not in await partition_names(async_test_db)
+    
+    await repository.insert_session(user.id, "late_token", BASE_TIME, max_time)
+    
+    assert table.name in await partition_names(async_test_db)
+    assert await async_test_db.scalar(select(func.count()).select_from(table)) == 1
+
+
+async def test_get_sessions_info_by_tokens_across_partitions(repository, async_test_db):
+    """
+    Test that one bulk lookup finds sessions in different tables.
+    """
+    user = await AsyncUserRepository(async_test_db).create_user("test_user", "hashed_password")
+    await repository.insert_session(user.id, "short_token", BASE_TIME, BASE_TIME + timedelta(minutes=30))
+    await repository.insert_session(user.id, "long_token", BASE_TIME, BASE_TIME + timedelta(minutes=90))
+    
+    sessions = await repository.get_sessions_info_by_tokens(
+        ["short_token", "long_token", "unknown_token"],
+        BASE_TIME + timedelta(minutes=45)
+    )
+    
+    assert list(sessions) == ["long_token"]
+    assert sessions["long_token"].max_time == BASE_TIME + timedelta(minutes=90)
+
+
+async def test_extend_sessions_moves_rows_to_new_partition(repository, async_test_db):
+    """
+    Test that a renewal updates rows in place or moves them to the table of their new max_time.
+    """
+    user = await AsyncUserRepository(async_test_db).create_user("test_user", "hashed_password")
+    await repository.insert_session(user.id, "moved_token", BASE_TIME, BASE_TIME + timedelta(minutes=30))
+    await repository.insert_session(user.id, "updated_token", BASE_TIME, BASE_TIME + timedelta(minutes=70))
+    old_table = partition_table(partition_index(BASE_TIME + timedelta(minutes=30), 3600))
+    
+    extended = await repository.extend_sessions(
+        {
+            hash_token("moved_token"): BASE_TIME + timedelta(minutes=80),
+            hash_token("updated_token"): BASE_TIME + timedelta(minutes=90),
+            hash_token("unknown_token"): BASE_TIME + timedelta(minutes=90)
+        },
+        BASE_TIME
+    )
+    
+    assert extended == 2
+    moved = await repository.get_session_info_by_token("moved_token", BASE_TIME + timedelta(minutes=45))
+    assert moved.max_time == BASE_TIME + timedelta(minutes=80)
+    updated = await repository.get_session_info_by_token("updated_token", BASE_TIME)
+    assert updated.max_time == BASE_TIME + timedelta(minutes=90)
+    assert await async_test_db.scalar(select(func.count()).select_from(old_table)) == 0
+
+
+async def test_get_valid_session_by_user_id(repository, async_test_db):
+    """
+    Test that the latest unexpired session of a user is returned.
+    """
+    user = await AsyncUserRepository(async_test_db).create_user("test_user", "hashed_password")
+    await repository.insert_session(user.id, "old_token", BASE_TIME, BASE_TIME + timedelta(minutes=30))
+    later = BASE_TIME + timedelta(minutes=10)
+    await repository.insert_session(user.id, "new_token", later, later + timedelta(minutes=60))
+    
+    session = await repository.get_valid_session_by_user_id(user.id, BASE_TIME + timedelta(minutes=20))
+    
+    assert session.token_digest == hash_token("new_token")
+    assert await repository.get_valid_session_by_user_id(user.id, BASE_TIME + timedelta(minutes=70)) is None
+
+
+async def test_get_user_with_valid_session_joins_live_partitions(repository, async_test_db):
+    """
+    Test that signin's single query reads the partitioned sessions.
+    """
+    user_repository = AsyncUserRepository(async_test_db)
+    user = await user_repository.create_user("test_user", "hashed_password")
+    await repository.insert_session(user.id, "test_token", BASE_TIME, BASE_TIME + timedelta(minutes=90))
+    
+    found_user, session = await user_repository.get_user_with_valid_session(
+        "test_user",
+        BASE_TIME,
+        repository.valid_sessions(BASE_TIME)
+    )
+    
+    assert found_user.id == user.id
+    assert session.token_digest == hash_token("test_token")
+
+
+async def test_drop_expired_partitions(repository, async_test_db):
+    """
+    Test that tables whose period is over are dropped whole.
+    """
+    user = await AsyncUserRepository(async_test_db).create_user("test_user", "hashed_password")
+    for index in range(3):
+        await repository.insert_session(user.id, f"expired_{index}", BASE_TIME, BASE_TIME + timedelta(minutes=30))
+    await repository.insert_session(user.id, "valid_token", BASE_TIME, BASE_TIME + timedelta(minutes=90))
+    
+    purged = await repository.drop_expired_partitions(BASE_TIME + timedelta(hours=1))
+    
+    assert purged == 3
+    assert f"{PARTITION_PREFIX}{partition_index(BASE_TIME, 3600)}" not in await partition_names(async_test_db)
+    assert await repository.get_session_info_by_token("valid_token", BASE_TIME + timedelta(hours=1)) is not None
+
+
+async def test_session_service_with_partitioned_storage(async_session_factory, async_test_db):
+    """
+    Test creating, reading and deleting sessions through the service.
+    """
+    sweeper = SessionSweeper(session_factory=async_session_factory, storage="partitioned")
+    assert await sweeper.sweep_once() == 0
+    user = await AsyncUserRepository(async_test_db).create_user("test_user", "hashed_password")
+    session_service = AsyncSessionService(
+        async_test_db,
+        cache=SessionCache(max_entries=10),
+        storage="partitioned"
+    )
+    
+    try:
+        token = await session_service.create_session(user.id)
+        assert await session_service.create_session(user.id) == token
+        session_service.cache.invalidate(token)
+        assert (await session_service.get_session_info(token))["user_id"] == "test_user"
+        assert await session_service.delete_session(token) is True
+        assert await session_service.get_session_info(token) is None
+    finally:
+        await AsyncPartitionedSessionRepository(async_test_db).drop_expired_partitions(datetime(9999, 1, 1))
@@ -0,0 +1,92 @@
+"""
+Unit tests for the asyncio session repository.
+"""
+import pytest
+from datetime import datetime, timedelta
+from app.repositories.async_session_repository import AsyncSessionRepository
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.repositories.rows import SessionInfoRow, SessionTokenRow
+from app.session_tokens import hash_token
+
+
+async def test_create_and_get_session_by_token(async_test_db):
+    """
+    Test session creation and lookup by token.
+    """
+    user = await AsyncUserRepository(async_test_db).create_user("test_user", "hashed_password")
+    
+    session_repo = AsyncSessionRepository(async_test_db)
+    start_time = datetime.utcnow()
+    max_time = start_time + timedelta(hours=1)
+    session = await session_repo.create_session(
+        user_id=user.id,
+        token="test_token",
+        start_time=start_time,
+        max_time=max_time
+    )
+    
+    assert session.id is not None
+    found = await session_repo.get_session_by_token("test_token")
+    assert found is not None
+    assert found.user.user_id == "test_user"
+
+
+async def test_get_valid_session_by_user_id(async_test_db):
+    """
+    Test that only unexpired sessions are returned.
+    """
+    user = await AsyncUserRepository(async_test_db).create_user("test_user", "hashed_password")
+    
+    session_repo = AsyncSessionRepository(async_test_db)
+    start_time = datetime.utcnow() - timedelta(hours=2)
+    await session_repo.create_session(
+        user_id=user.id,
+        token="expired_token",
+        start_time=start_time,
+        max_time=start_time + timedelta(hours=1)
+    )
+    
+    current_time = datetime.utcnow()
+    assert await session_repo.get_valid_session_by_user_id(user.id, current_time) is None
+    assert await session_repo.is_session_valid("expired_token", current_time) is False
+
+
+async def test_delete_session(async_test_db):
+    """
+    Test session deletion.
+    """
+    user = await AsyncUserRepository(async_test_db).create_user("test_user", "hashed_password")
+    
+    session_repo = AsyncSessionRepository(async_test_db)
+    start_time = datetime.utcnow()
+    session = await session_repo.create_session(
+        user_id=user.id,
+        token="test_token",
+        start_time=start_time,
+        max_time=start_time + timedelta(hours=1)
+    )
+    await session_repo.delete_session(session)
+    
+    assert await session_repo.get_session_by_token("test_token") is None
+
+
+async def test_projection_lookups_load_no_entities(async_test_db):
+    """
+    Test that lookups return slotted rows and leave the identity map empty.
+    """
+    user = await AsyncUserRepository(async_test_db).create_user("test_user", "hashed_password")
+    session_repo = AsyncSessionRepository(async_test_db)
+    now = datetime.utcnow()
+    user_pk = user.id
+    await session_repo.insert_session(user_pk, "test_token", now, now + timedelta(hours=1))
+    async_test_db.expunge_all()
+    
+    latest = await session_repo.get_valid_session_by_user_id(user_pk, now)
+    info = await session_repo.get_session_info_by_token("test_token", now)
+    
+    assert isinstance(latest, SessionTokenRow)
+    assert latest.token_digest == hash_token("test_token")
+    assert isinstance(info, SessionInfoRow)
+    assert info.user_id == "test_user"
+    assert await session_repo.is_session_valid("test_token", now) is True
+    assert len(async_test_db.identity_map) == 0
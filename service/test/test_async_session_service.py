@@ -0,0 +1,110 @@
+"""
+Unit tests for the asyncio session service.
+"""
+import pytest
+from datetime import datetime
+from app.services.async_session_service import AsyncSessionService
+from app.services.session_cache import SessionCache
+from app.repositories.async_user_repository import AsyncUserRepository
+
+
+async def test_create_session_existing_valid(async_test_db):
+    """
+    Test that an existing valid session is returned.
+    """
+    user = await AsyncUserRepository(async_test_db).create_user("test_user", "hashed_password")
+    
+    session_service = AsyncSessionService(async_test_db)
+    token1 = await session_service.create_session(user.id)
+    token2 = await session_service.create_session(user.id)
+    
+    assert len(token1) > 0
+    assert token1 == token2
+
+
+async def test_get_session_info(async_test_db):
+    """
+    Test getting session information.
+    """
+    user = await AsyncUserRepository(async_test_db).create_user("test_user", "hashed_password")
+    
+    session_service = AsyncSessionService(async_test_db)
+    token = await session_service.create_session(user.id)
+    
+    session_info = await session_service.get_session_info(token)
+    assert session_info is not None
+    assert session_info["token"] == token
+    assert session_info["user_id"] == "test_user"
+    assert await session_service.get_session_info("invalid_token") is None
+
+
+async def test_delete_session_invalidates_cache(async_test_db):
+    """
+    Test that deleting a session removes it from the cache.
+    """
+    user = await AsyncUserRepository(async_test_db).create_user("test_user", "hashed_password")
+    
+    cache = SessionCache(max_entries=10)
+    session_service = AsyncSessionService(async_test_db, cache=cache)
+    token = await session_service.create_session(user.id)
+    await session_service.get_session_info(token)
+    
+    assert await session_service.delete_session(token) is True
+    assert await session_service.get_session_info(token) is None
+
+
+async def test_get_sessions_info(async_test_db):
+    """
+    Test that a batch is served from the cache first and from the store for the rest.
+    """
+    user = await AsyncUserRepository(async_test_db).create_user("test_user", "hashed_password")
+    other = await AsyncUserRepository(async_test_db).create_user("other_user", "hashed_password")
+    
+    cache = SessionCache(max_entries=10)
+    session_service = AsyncSessionService(async_test_db, cache=cache)
+    cached_token = await session_service.create_session(user.id)
+    stored_token = await session_service.create_session(other.id)
+    cache.invalidate(stored_token)
+    
+    sessions_info = await session_service.get_sessions_info([cached_token, "invalid_token", stored_token])
+    
+    assert sorted(sessions_info) == sorted([cached_token, stored_token])
+    assert sessions_info[stored_token]["user_id"] == "other_user"
+    assert cache.get(stored_token, datetime.utcnow()) is not None
+
+
+async def test_create_session_info_reuses_existing_session(async_test_db):
+    """
+    Test that session info is created once and then reused.
+    """
+    user_repository = AsyncUserRepository(async_test_db)
+    await user_repository.create_user("test_user", "hashed_password")
+    session_service = AsyncSessionService(async_test_db, cache=SessionCache(max_entries=10))
+    
+    user, existing_session = await user_repository.get_user_with_valid_session("test_user", datetime.utcnow())
+    created = await session_service.create_session_info(user, existing_session)
+    user, existing_session = await user_repository.get_user_with_valid_session("test_user", datetime.utcnow())
+    reused = await session_service.create_session_info(user, existing_session)
+    
+    assert created["user_id"] == "test_user"
+    assert reused == created
+    assert await session_service.get_session_info(created["token"]) == created
+
+
+async def test_create_session_info_replaces_uncached_session(async_test_db):
+    """
+    Test that a session whose token is no longer cached is replaced, not reused.
+    """
+    user_repository = AsyncUserRepository(async_test_db)
+    await user_repository.create_user("test_user", "hashed_password")
+    session_service = AsyncSessionService(async_test_db, cache=SessionCache(max_entries=10))
+    user, _ = await user_repository.get_user_with_valid_session("test_user", datetime.utcnow())
+    first = await session_service.create_session_info(user, None)
+    session_service.cache.invalidate(first["token"])
+    
+    user, existing_session = await user_repository.get_user_with_valid_session("test_user", datetime.utcnow())
+    second = await session_service.create_session_info(user, existing_session)
+    
+    assert existing_session is not None
+    assert second["token"] != first["token"]
+    assert await session_service.get_session_info(first["token"]) is not None
@@ -0,0 +1,81 @@
+"""
+Unit tests for the asyncio user repository.
+"""
+import pytest
+from datetime import datetime, timedelta
+from app.repositories.async_session_repository import AsyncSessionRepository
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.session_tokens import hash_token
+
+
+async def test_create_user(async_test_db):
+    """
+    Test user creation.
+    """
+    repository = AsyncUserRepository(async_test_db)
+    user = await repository.create_user("test_user", "hashed_password")
+    
+    assert user.id is not None
+    assert user.user_id == "test_user"
+    assert user.password_hash == "hashed_password"
+
+
+async def test_get_user_by_user_id(async_test_db):
+    """
+    Test getting user by user_id.
+    """
+    repository = AsyncUserRepository(async_test_db)
+    await repository.create_user("test_user", "hashed_password")
+    
+    user = await repository.get_user_by_user_id("test_user")
+    assert user is not None
+    assert user.user_id == "test_user"
+    assert await repository.get_user_by_user_id("non_existent_user") is None
+
+
+async def test_user_exists(async_test_db):
+    """
+    Test user existence check.
+    """
+    repository = AsyncUserRepository(async_test_db)
+    await repository.create_user("test_user", "hashed_password")
+    
+    assert await repository.user_exists("test_user") is True
+    assert await repository.user_exists("non_existent_user") is False
+
+
+async def test_get_user_with_valid_session(async_test_db):
+    """
+    Test fetching a user together with their latest valid session.
+    """
+    repository = AsyncUserRepository(async_test_db)
+    user = await repository.create_user("test_user", "hashed_password")
+    current_time = datetime.utcnow()
+    
+    found_user, session = await repository.get_user_with_valid_session("test_user", current_time)
+    assert found_user.id == user.id
+    assert session is None
+    
+    await AsyncSessionRepository(async_test_db).insert_session(
+        user_id=user.id,
+        token="test_token",
+        start_time=current_time,
+        max_time=current_time + timedelta(hours=1)
+    )
+    found_user, session = await repository.get_user_with_valid_session("test_user", current_time)
+    assert session.token_digest == hash_token("test_token")
+    
+    assert await repository.get_user_with_valid_session("non_existent_user", current_time) == (None, None)
+
+
+async def test_create_user_if_absent(async_test_db):
+    """
+    Test that a taken user_id is reported instead of raising.
+    """
+    repository = AsyncUserRepository(async_test_db)
+    
+    created_id = await repository.create_user_if_absent("test_user", "hashed_password")
+    assert created_id is not None
+    assert (await repository.get_user_by_user_id("test_user")).id == created_id
+    assert await repository.create_user_if_absent("test_user", "other_hash") is None
+    assert (await repository.get_user_by_user_id("test_user")).password_hash == "hashed_password"
@@ -1,8 +1,27 @@
 """
 Integration tests for authentication routes.
 """
+import json
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from ipaddress import ip_network
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from argon2 import extract_parameters
+from datetime import datetime, timedelta
+from app.repositories.user_repository import UserRepository
+from app.repositories.session_repository import SessionRepository
+from app.models import Session
+from app.session_tokens import hash_token
 from app.services.password_service import PasswordService
+from app.config import settings
+from app.main import app
+from app.services.hashing_executor import hashing_executor
+from app.services.signin_throttle import signin_throttle
+from app.services.stateless_session_service import stateless_session_service
+from app.services.session_cache import session_cache
 
 
 def test_signup_success(client):
@@ -157,3 +176,338 @@ def test_signin_existing_session(client):
     token2 = response2.json()["token"]
     assert token1 == token2
 
+
+def test_signin_stores_only_token_digest(client, test_db):
+    """
+    Test that the sessions table holds the token's digest, not the token.
+    """
+    client.post("/auth/signup", json={"user_id": "test_user", "password": "test_password"})
+    token = client.post("/auth/signin", json={"user_id": "test_user", "password": "test_password"}).json()["token"]
+    
+    session = test_db.query(Session).one()
+    
+    assert session.token_digest == hash_token(token)
+    assert not hasattr(session, "token")
+
+
+@pytest.mark.parametrize("has_session", [False, True])
+def test_signin_rehashes_outdated_hash(client, test_db, has_session):
+    """
+    Test that signin upgrades a hash made with outdated parameters.
+    """
+    cheap_service = PasswordService(time_cost=1, memory_cost=8192, parallelism=1)
+    user = UserRepository(test_db).create_user("test_user", cheap_service.hash_password("test_password"))
+    if has_session:
+        start_time = datetime.utcnow()
+        SessionRepository(test_db).create_session(
+            user_id=user.id,
+            token="existing_token",
+            start_time=start_time,
+            max_time=start_time + timedelta(hours=1)
+        )
+    
+    response = client.post(
+        "/auth/signin",
+        json={
+            "user_id": "test_user",
+            "password": "test_password"
+        }
+    )
+    
+    assert response.status_code == 200
+    test_db.expire_all()
+    parameters = extract_parameters(UserRepository(test_db).get_user_by_user_id("test_user").password_hash)
+    assert parameters.time_cost == settings.argon2_time_cost
+    assert parameters.memory_cost == settings.argon2_memory_cost
+    assert parameters.parallelism == settings.argon2_parallelism
+
+
+
+def test_signin_throttled_before_lookup(client, monkeypatch):
+    """
+    Test that over-limit attempts get 429 without reaching the database.
+    """
+    monkeypatch.setattr(signin_throttle.user_failures, "max_events", 2)
+    for _ in range(2):
+        response = client.post(
+            "/auth/signin",
+            json={
+                "user_id": "test_user",
+                "password": "wrong_password"
+            }
+        )
+        assert response.status_code == 401
+    
+    with recorded_statements() as statements:
+        response = client.post(
+            "/auth/signin",
+            json={
+                "user_id": "test_user",
+                "password": "wrong_password"
+            }
+        )
+    
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) > 0
+    assert statements == []
+    assert 'signin_throttled_total{reason="user_failures"}' in client.get("/metrics").text
+
+
+def test_signin_throttle_keys_forwarded_client_behind_proxy(client, monkeypatch):
+    """
+    Test that failures behind a trusted balancer count against the forwarded client.
+    """
+    monkeypatch.setattr(signin_throttle, "trusted_proxies", [ip_network("10.0.0.0/8")])
+    monkeypatch.setattr(signin_throttle.ip_failures, "max_events", 2)
+    monkeypatch.setattr(signin_throttle.user_failures, "max_events", 0)
+    balancer = TestClient(app, client=("10.0.0.1", 50000))
+    
+    def attempt(forwarded_for: str) -> int:
+        return balancer.post(
+            "/auth/signin",
+            json={"user_id": "test_user", "password": "wrong_password"},
+            headers={"X-Forwarded-For": forwarded_for}
+        ).status_code
+    
+    assert [attempt("203.0.113.5") for _ in range(2)] == [401, 401]
+    assert attempt("203.0.113.5") == 429
+    assert attempt("203.0.113.6") == 401
+
+
+def test_signup_hashing_queue_full(client, monkeypatch):
+    """
+    Test that signup returns 503 with Retry-After when hashing is saturated.
+    """
+    monkeypatch.setattr(hashing_executor, "max_pending", 0)
+    
+    response = client.post(
+        "/auth/signup",
+        json={
+            "user_id": "test_user",
+            "password": "test_password"
+        }
+    )
+    
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+
+
+def test_signin_stateless_mode(client, monkeypatch):
+    """
+    Test that signin issues a signed token in stateless session mode.
+    """
+    monkeypatch.setattr(settings, "session_mode", "stateless")
+    client.post(
+        "/auth/signup",
+        json={
+            "user_id": "test_user",
+            "password": "test_password"
+        }
+    )
+    
+    response = client.post(
+        "/auth/signin",
+        json={
+            "user_id": "test_user",
+            "password": "test_password"
+        }
+    )
+    
+    assert response.status_code == 200
+    token = response.json()["token"]
+    assert stateless_session_service.get_session_info(token)["user_id"] == "test_user"
+
+
+@contextmanager
+def recorded_statements():
+    """
+    Record every SQL statement executed on any engine.
+    
+    Yields:
+        List that receives executed statements.
+    """
+    statements = []
+    
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(Engine, "before_cursor_execute", record_statement)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", record_statement)
+
+
+def test_signin_statement_count(client):
+    """
+    Test that signin issues one query to reuse a session and two to create one.
+    """
+    client.post(
+        "/auth/signup",
+        json={
+            "user_id": "test_user",
+            "password": "test_password"
+        }
+    )
+    
+    with recorded_statements() as new_session_statements:
+        client.post("/auth/signin", json={"user_id": "test_user", "password": "test_password"})
+    with recorded_statements() as existing_session_statements:
+        client.post("/auth/signin", json={"user_id": "test_user", "password": "test_password"})
+    
+    assert len(new_session_statements) == 2
+    assert len(existing_session_statements) == 1
+
+
+def test_signin_stateless_mode_skips_session_storage(client, monkeypatch):
+    """
+    Test that stateless signin loads only the user, even with partitioned storage.
+    """
+    client.post("/auth/signup", json={"user_id": "test_user", "password": "test_password"})
+    monkeypatch.setattr(settings, "session_mode", "stateless")
+    monkeypatch.setattr(settings, "session_storage", "partitioned")
+    
+    with recorded_statements() as statements:
+        response = client.post("/auth/signin", json={"user_id": "test_user", "password": "test_password"})
+    
+    assert response.status_code == 200
+    assert stateless_session_service.get_session_info(response.json()["token"])["user_id"] == "test_user"
+    assert len(statements) == 1
+    assert "sessions" not in statements[0]
+
+
+def test_signup_statement_count(client):
+    """
+    Test that a new user_id costs a single INSERT and a taken one a single SELECT.
+    """
+    with recorded_statements() as created_statements:
+        client.post("/auth/signup", json={"user_id": "test_user", "password": "test_password"})
+    with recorded_statements() as duplicate_statements:
+        response = client.post("/auth/signup", json={"user_id": "test_user", "password": "test_password"})
+    
+    assert response.status_code == 400
+    assert len(created_statements) == 1
+    assert created_statements[0].startswith("INSERT")
+    assert len(duplicate_statements) == 1
+    assert duplicate_statements[0].startswith("SELECT")
+
+
+def test_signup_taken_user_id_skips_hashing(client, monkeypatch):
+    """
+    Test that a user_id known to the filter is rejected before hashing.
+    """
+    client.post("/auth/signup", json={"user_id": "test_user", "password": "test_password"})
+    
+    async def fail_hash_password(password):
+        raise AssertionError("password was hashed")
+    
+    monkeypatch.setattr(hashing_executor, "hash_password", fail_hash_password)
+    response = client.post("/auth/signup", json={"user_id": "test_user", "password": "test_password"})
+    
+    assert response.status_code == 400
+    assert response.json()["detail"] == "User already exists"
+
+
+def test_concurrent_duplicate_signups(client):
+    """
+    Test that parallel signups for one user_id yield one 201 and 400s, never a 500.
+    """
+    def signup():
+        return client.post(
+            "/auth/signup",
+            json={
+                "user_id": "test_user",
+                "password": "test_password"
+            }
+        ).status_code
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        status_codes = list(executor.map(lambda _: signup(), range(4)))
+    
+    assert sorted(status_codes) == [201, 400, 400, 400]
+
+
+def test_import_users_endpoint(client, monkeypatch):
+    """
+    Test the NDJSON bulk import endpoint.
+    """
+    body = "\n".join([
+        json.dumps({"user_id": "first_user", "password": "test_password"}),
+        json.dumps({"user_id": "first_user", "password": "test_password"}),
+    ])
+    
+    response = client.post("/users/import", content=body)
+    assert response.status_code == 404
+    
+    monkeypatch.setattr(settings, "user_import_enabled", True)
+    response = client.post("/users/import", content=body)
+    
+    assert response.status_code == 200
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert results[0]["line"] == 2
+    assert results[-1] == {"created": 1, "failed": 1}
+
+
+def signed_in_token(client, user_id: str) -> str:
+    """
+    Sign a new user up and in.
+    
+    Returns:
+        The session token.
+    """
+    client.post("/auth/signup", json={"user_id": user_id, "password": "test_password"})
+    response = client.post("/auth/signin", json={"user_id": user_id, "password": "test_password"})
+    return response.json()["token"]
+
+
+def test_introspect_endpoint(client):
+    """
+    Test that a batch resolves in request order with a single query.
+    """
+    first_token = signed_in_token(client, "first_user")
+    second_token = signed_in_token(client, "second_user")
+    session_cache.clear()
+    
+    with recorded_statements() as statements:
+        response = client.post(
+            "/auth/introspect",
+            json={"tokens": [first_token, "invalid_token", second_token]}
+        )
+    
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["active"] for result in results] == [True, False, True]
+    assert [result["user_id"] for result in results] == ["first_user", None, "second_user"]
+    assert results[2]["token"] == second_token
+    assert results[2]["max_time"] is not None
+    assert len(statements) == 1
+
+
+def test_introspect_endpoint_streams_ndjson(client, monkeypatch):
+    """
+    Test NDJSON results, resolved chunk by chunk.
+    """
+    token = signed_in_token(client, "test_user")
+    monkeypatch.setattr(settings, "introspect_chunk_size", 2)
+    session_cache.clear()
+    
+    with recorded_statements() as statements:
+        response = client.post(
+            "/auth/introspect",
+            json={"tokens": ["invalid_token", token, "other_token", token, "last_token"]},
+            headers={"Accept": "application/x-ndjson"}
+        )
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [result["active"] for result in results] == [False, True, False, True, False]
+    assert results[1]["user_id"] == "test_user"
+    assert len(statements) == 3
+
+
+def test_introspect_rejects_empty_batch(client):
+    """
+    Test that an empty token list is a validation error.
+    """
+    assert client.post("/auth/introspect", json={"tokens": []}).status_code == 422
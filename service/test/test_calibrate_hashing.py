@@ -0,0 +1,55 @@
+"""
+Unit tests for the Argon2 calibration command.
+"""
+import pytest
+from app.cli.calibrate_hashing import calibrate, write_env_file
+
+
+def test_calibrate_meets_target():
+    """
+    Test that a generous target keeps the highest memory cost.
+    """
+    result = calibrate(
+        target_seconds=10.0,
+        parallelism=1,
+        max_memory_kib=8192,
+        min_memory_kib=8192,
+        max_time_cost=2,
+        rounds=1
+    )
+    
+    assert result["met_target"] is True
+    assert result["memory_cost"] == 8192
+    assert result["time_cost"] == 2
+
+
+def test_calibrate_unreachable_target():
+    """
+    Test that an impossible target returns the cheapest candidate.
+    """
+    result = calibrate(
+        target_seconds=0.0,
+        parallelism=1,
+        max_memory_kib=16384,
+        min_memory_kib=8192,
+        max_time_cost=2,
+        rounds=1
+    )
+    
+    assert result["met_target"] is False
+    assert result["memory_cost"] == 8192
+    assert result["time_cost"] == 1
+
+
+def test_write_env_file(tmp_path):
+    """
+    Test that existing variables are replaced and new ones appended.
+    """
+    env_path = tmp_path / ".env"
+    env_path.write_text("# Argon2\nARGON2_TIME_COST=3\nDEBUG=False\n", encoding="utf-8")
+    
+    write_env_file(str(env_path), {"ARGON2_TIME_COST": 4, "ARGON2_MEMORY_COST": 32768})
+    
+    assert env_path.read_text(encoding="utf-8") == (
+        "# Argon2\nARGON2_TIME_COST=4\nDEBUG=False\nARGON2_MEMORY_COST=32768\n"
+    )
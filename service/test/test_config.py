@@ -0,0 +1,31 @@
+"""
+Unit tests for settings validation.
+"""
+import pytest
+from pydantic import ValidationError
+from app.config import Settings
+
+
+@pytest.mark.parametrize("sweep_interval_seconds", [0, 3600, 7200])
+def test_partitioned_storage_requires_sweeps_within_a_period(sweep_interval_seconds):
+    """
+    Test that partitioned storage rejects sweep intervals that leave tables uncreated.
+    """
+    with pytest.raises(ValidationError):
+        Settings(
+            session_storage="partitioned",
+            session_partition_seconds=3600,
+            session_sweep_interval_seconds=sweep_interval_seconds
+        )
+
+
+def test_partition_sweep_interval_is_only_checked_for_partitioned_storage():
+    """
+    Test that valid partitioned settings and other storages load.
+    """
+    assert Settings(
+        session_storage="partitioned",
+        session_partition_seconds=3600,
+        session_sweep_interval_seconds=300
+    ).session_sweep_interval_seconds == 300
+    assert Settings(session_storage="table", session_sweep_interval_seconds=0).session_sweep_interval_seconds == 0
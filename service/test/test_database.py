@@ -0,0 +1,41 @@
+"""
+Unit tests for database engine configuration.
+"""
+import pytest
+from sqlalchemy import text
+from app.config import settings
+from app.database import create_database_engine, get_async_database_url, get_engine_options
+
+
+def test_get_async_database_url():
+    """
+    Test conversion of database URLs to asyncio drivers.
+    """
+    assert get_async_database_url("sqlite:///./app.db") == "sqlite+aiosqlite:///./app.db"
+    assert get_async_database_url("postgresql://user@host/db") == "postgresql+asyncpg://user@host/db"
+    assert get_async_database_url("sqlite+aiosqlite:///./app.db") == "sqlite+aiosqlite:///./app.db"
+
+
+def test_get_engine_options_for_server_backend():
+    """
+    Test that server backends get the configured pool options.
+    """
+    options = get_engine_options("postgresql://user@host/db")
+    
+    assert options["pool_size"] == settings.db_pool_size
+    assert options["max_overflow"] == settings.db_max_overflow
+    assert options["pool_pre_ping"] == settings.db_pool_pre_ping
+    assert "connect_args" in get_engine_options("sqlite:///./app.db")
+
+
+def test_sqlite_pragmas_applied_on_connect(tmp_path):
+    """
+    Test that SQLite connections get the configured pragmas.
+    """
+    engine = create_database_engine(f"sqlite:///{tmp_path / 'pragmas.db'}")
+    
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar().upper() == settings.sqlite_journal_mode
+        assert connection.execute(text("PRAGMA busy_timeout")).scalar() == settings.sqlite_busy_timeout_ms
+        assert connection.execute(text("PRAGMA cache_size")).scalar() == settings.sqlite_cache_size
+    engine.dispose()
@@ -0,0 +1,121 @@
+"""
+Unit tests for the hashing executor.
+"""
+import asyncio
+import time
+import pytest
+from app.services.hashing_executor import HashingExecutor, HashingQueueFullError
+from app.services.password_service import PasswordService
+
+
+def sleep_job(seconds: float):
+    """
+    Worker job that only sleeps, returning its result and duration.
+    """
+    time.sleep(seconds)
+    return seconds, seconds
+
+
+@pytest.fixture
+def executor():
+    """
+    Create a single-worker hashing executor for each test.
+    
+    Yields:
+        HashingExecutor instance.
+    """
+    executor = HashingExecutor(max_workers=1, max_pending=1)
+    try:
+        yield executor
+    finally:
+        executor.shutdown()
+
+
+async def test_hash_and_verify_password(executor):
+    """
+    Test hashing and verification run in the process pool.
+    """
+    hashed = await executor.hash_password("test_password")
+    
+    assert hashed != "test_password"
+    assert await executor.verify_password("test_password", hashed) is True
+    assert await executor.verify_password("wrong_password", hashed) is False
+    assert executor.pending == 0
+
+
+async def test_verify_and_rehash(executor):
+    """
+    Test that outdated hashes are replaced in the same worker job.
+    """
+    old_hash = PasswordService(time_cost=1, memory_cost=8192, parallelism=1).hash_password("test_password")
+    
+    matches, new_hash = await executor.verify_and_rehash("test_password", old_hash)
+    
+    assert matches is True
+    assert new_hash is not None
+    assert await executor.verify_and_rehash("test_password", new_hash) == (True, None)
+    assert await executor.verify_and_rehash("wrong_password", old_hash) == (False, None)
+
+
+async def test_queue_full_rejects_new_jobs(executor):
+    """
+    Test that jobs beyond the pending limit are rejected immediately.
+    """
+    first = asyncio.ensure_future(executor.hash_password("first_password"))
+    await asyncio.sleep(0)
+    
+    with pytest.raises(HashingQueueFullError):
+        await executor.hash_password("second_password")
+    
+    assert await first
+    assert executor.pending == 0
+
+
+async def test_cancelled_job_keeps_slot_until_it_finishes(executor):
+    """
+    Test that cancelling the caller does not free the slot of a running job.
+    """
+    await executor.warm_up()
+    job = asyncio.ensure_future(executor._submit("hash", sleep_job, 0.5))
+    await asyncio.sleep(0.1)
+    job.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await job
+    
+    assert executor.pending == 1
+    with pytest.raises(HashingQueueFullError):
+        await executor.hash_password("second_password")
+    
+    for _ in range(200):
+        if executor.pending == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert executor.pending == 0
+    assert await executor.hash_password("second_password")
+
+
+async def test_hash_passwords(executor):
+    """
+    Test bulk hashing keeps input order.
+    """
+    executor.max_pending = executor.max_workers
+    hashes = await executor.hash_passwords(["first_password", "second_password"])
+    
+    assert await executor.verify_password("first_password", hashes[0]) is True
+    assert await executor.verify_password("second_password", hashes[1]) is True
+    assert await executor.hash_passwords([]) == []
+
+
+async def test_hash_passwords_with_more_workers_than_pending_slots():
+    """
+    Test that a batch fits when the pool has more workers than pending slots.
+    """
+    executor = HashingExecutor(max_workers=3, max_pending=1)
+    try:
+        hashes = await executor.hash_passwords(["first_password", "second_password", "third_password"])
+        
+        assert len(hashes) == 3
+        assert await executor.verify_password("third_password", hashes[2]) is True
+        assert executor.pending == 0
+    finally:
+        executor.shutdown()
@@ -0,0 +1,41 @@
+"""
+Unit tests for the load-test runner statistics and baseline comparison.
+"""
+import pytest
+from benchmarks.load.runner import find_regressions, percentile, summarize
+
+
+def test_percentile():
+    """
+    Test nearest-rank percentiles.
+    """
+    values = [float(value) for value in range(1, 101)]
+    
+    assert percentile(values, 0.50) == 50.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([], 0.50) == 0.0
+
+
+def test_summarize():
+    """
+    Test throughput, error rate and latency summary.
+    """
+    summary = summarize([0.010, 0.020, 0.030, 0.040], errors=1, elapsed=2.0, concurrency=2)
+    
+    assert summary["requests"] == 4
+    assert summary["throughput_rps"] == 2.0
+    assert summary["error_rate"] == 0.25
+    assert summary["latency_ms"]["max"] == pytest.approx(40.0)
+
+
+def test_find_regressions():
+    """
+    Test that only changes beyond the tolerance are reported.
+    """
+    baseline = {"health": summarize([0.010] * 10, errors=0, elapsed=1.0, concurrency=1)}
+    within_tolerance = {"health": summarize([0.011] * 10, errors=0, elapsed=1.1, concurrency=1)}
+    slower = {"health": summarize([0.020] * 10, errors=1, elapsed=2.0, concurrency=1)}
+    
+    assert find_regressions(within_tolerance, baseline, tolerance=0.2) == []
+    assert len(find_regressions(slower, baseline, tolerance=0.2)) == 3
+    assert find_regressions({"other": slower["health"]}, baseline, tolerance=0.2) == []
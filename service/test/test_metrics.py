@@ -0,0 +1,113 @@
+"""
+Unit tests for metrics primitives and the /metrics endpoint.
+"""
+import threading
+import pytest
+from app.metrics import (
+    Counter, Gauge, Histogram, CallbackMetric, MetricsRegistry,
+    compiled_cache_entries, db_compiled_cache_lookups
+)
+from app.repositories.user_repository import UserRepository
+
+
+def test_histogram_render():
+    """
+    Test cumulative bucket, sum and count rendering.
+    """
+    histogram = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "/health")
+    histogram.observe(0.5, "/health")
+    histogram.observe(5.0, "/health")
+    
+    lines = histogram.render()
+    assert 'latency_seconds_bucket{route="/health",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/health",le="1.0"} 2' in lines
+    assert 'latency_seconds_bucket{route="/health",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{route="/health"} 3' in lines
+
+
+def test_counter_merges_thread_shards():
+    """
+    Test that values recorded from several threads are summed.
+    """
+    counter = Counter("events_total", "Events.", ("kind",))
+    
+    def record():
+        for _ in range(1000):
+            counter.inc("test")
+    
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert 'events_total{kind="test"} 4000' in counter.render()
+
+
+def test_gauge_and_callback_metric():
+    """
+    Test gauge decrement and callback rendering through a registry.
+    """
+    registry = MetricsRegistry()
+    gauge = registry.register(Gauge("in_flight", "In flight."))
+    registry.register(CallbackMetric("queue_depth", "Queue depth.", lambda: 7))
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+    
+    text = registry.render()
+    assert "# TYPE in_flight gauge" in text
+    assert "in_flight 1" in text
+    assert "queue_depth 7" in text
+
+
+def compiled_cache_lookups(outcome: str) -> float:
+    """
+    Read the compiled cache lookup counter for one outcome.
+    """
+    prefix = f'db_compiled_cache_lookups_total{{outcome="{outcome}"}} '
+    for line in db_compiled_cache_lookups.render():
+        if line.startswith(prefix):
+            return float(line[len(prefix):])
+    return 0
+
+
+def test_compiled_cache_lookups(test_db):
+    """
+    Test that repeated repository lookups are counted as compiled cache hits.
+    """
+    repository = UserRepository(test_db)
+    hits = compiled_cache_lookups("hit")
+    
+    for _ in range(3):
+        repository.get_user_by_user_id("test_user")
+    
+    assert compiled_cache_lookups("hit") - hits >= 2
+    assert compiled_cache_entries(test_db.get_bind()) > 0
+
+
+def test_metrics_endpoint(client):
+    """
+    Test that route latency, DB timing and hashing metrics are exposed.
+    """
+    client.get("/health")
+    client.post(
+        "/auth/signup",
+        json={
+            "user_id": "test_user",
+            "password": "test_password"
+        }
+    )
+    
+    response = client.get("/metrics")
+    
+    assert response.status_code == 200
+    assert 'http_request_duration_seconds_count{method="GET",route="/health"}' in response.text
+    assert 'http_requests_total{method="POST",route="/auth/signup",status="201"}' in response.text
+    assert 'db_statement_duration_seconds_count{operation="INSERT"}' in response.text
+    assert 'password_hashing_duration_seconds_count{operation="hash"}' in response.text
+    assert "hashing_queue_depth 0" in response.text
+    assert 'worker_startup_seconds{phase="lifespan"}' in response.text
+    assert 'db_compiled_cache_lookups_total{outcome="hit"}' in response.text
+    assert "db_compiled_cache_entries" in response.text
@@ -0,0 +1,78 @@
+"""
+Tests for the Alembic schema migrations.
+"""
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine
+from app.config import settings
+from app.database import Base
+from app.session_tokens import hash_token
+
+# Schema created by the former import-time create_all
+LEGACY_SCHEMA = [
+    "CREATE TABLE users (id INTEGER NOT NULL, user_id VARCHAR NOT NULL, password_hash VARCHAR NOT NULL, "
+    "created_at DATETIME, PRIMARY KEY (id))",
+    "CREATE INDEX ix_users_id ON users (id)",
+    "CREATE UNIQUE INDEX ix_users_user_id ON users (user_id)",
+    "CREATE TABLE sessions (id INTEGER NOT NULL, user_id INTEGER NOT NULL, token VARCHAR NOT NULL, "
+    "start_time DATETIME NOT NULL, max_time DATETIME NOT NULL, PRIMARY KEY (id), "
+    "FOREIGN KEY(user_id) REFERENCES users (id))",
+    "CREATE INDEX ix_sessions_id ON sessions (id)",
+    "CREATE UNIQUE INDEX ix_sessions_token ON sessions (token)",
+]
+
+
+@pytest.fixture
+def migrated_database_url(tmp_path, monkeypatch):
+    """
+    Upgrade a fresh database to the latest revision.
+    
+    Yields:
+        Database URL of the migrated database.
+    """
+    database_url = f"sqlite:///{tmp_path / 'migrated.db'}"
+    monkeypatch.setattr(settings, "database_url", database_url)
+    command.upgrade(Config("alembic.ini"), "head")
+    yield database_url
+
+
+def test_migrations_match_models(migrated_database_url):
+    """
+    Test that the migrated schema has no differences from the models.
+    """
+    engine = create_engine(migrated_database_url)
+    with engine.connect() as connection:
+        differences = compare_metadata(MigrationContext.configure(connection), Base.metadata)
+    engine.dispose()
+    
+    assert differences == []
+
+
+def test_upgrade_adopts_create_all_database(tmp_path, monkeypatch):
+    """
+    Test that a database created by the former create_all is upgraded in place.
+    """
+    database_url = f"sqlite:///{tmp_path / 'existing.db'}"
+    engine = create_engine(database_url)
+    with engine.begin() as connection:
+        for statement in LEGACY_SCHEMA:
+            connection.exec_driver_sql(statement)
+        connection.exec_driver_sql("INSERT INTO users (id, user_id, password_hash) VALUES (1, 'test_user', 'hash')")
+        connection.exec_driver_sql(
+            "INSERT INTO sessions (user_id, token, start_time, max_time) "
+            "VALUES (1, 'test_token', '2026-01-01 00:00:00', '2026-01-01 01:00:00')"
+        )
+    
+    monkeypatch.setattr(settings, "database_url", database_url)
+    command.upgrade(Config("alembic.ini"), "head")
+    
+    with engine.connect() as connection:
+        token_digest = connection.exec_driver_sql("SELECT token_digest FROM sessions").scalar_one()
+        differences = compare_metadata(MigrationContext.configure(connection), Base.metadata)
+    engine.dispose()
+    
+    assert token_digest == hash_token("test_token")
+    assert differences == []
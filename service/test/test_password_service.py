@@ -56,3 +56,20 @@ def test_verify_password_different_hashes():
     assert service.verify_password(password, hashed1) is True
     assert service.verify_password(password, hashed2) is True
 
+
+
+def test_verify_and_rehash():
+    """
+    Test that only hashes with different parameters are replaced.
+    """
+    old_service = PasswordService(time_cost=1, memory_cost=8192, parallelism=1)
+    service = PasswordService(time_cost=2, memory_cost=8192, parallelism=1)
+    old_hash = old_service.hash_password("test_password")
+    
+    assert service.needs_rehash(old_hash) is True
+    assert service.verify_and_rehash("wrong_password", old_hash) == (False, None)
+    
+    matches, new_hash = service.verify_and_rehash("test_password", old_hash)
+    assert matches is True
+    assert service.needs_rehash(new_hash) is False
+    assert service.verify_and_rehash("test_password", new_hash) == (True, None)
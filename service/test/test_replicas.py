@@ -0,0 +1,120 @@
+"""
+Unit tests for read-replica routing, with SQLite files standing in for replicas.
+"""
+import os
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from app.database import Base, create_async_database_engine, create_database_engine
+from app.replicas import ReplicaRouter, RoutingSession
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.repositories.user_repository import UserRepository
+from test.conftest import create_test_async_engine
+
+REPLICA_DATABASE_URLS = ["sqlite:///./test_replica_1.db", "sqlite:///./test_replica_2.db"]
+UNREACHABLE_DATABASE_URL = "sqlite:///./missing_directory/replica.db"
+
+
+@pytest.fixture
+def replica_urls():
+    """
+    Create the replica stand-ins, each holding a user named after its file.
+    
+    Yields:
+        Replica database URLs.
+    """
+    engines = [create_database_engine(url) for url in REPLICA_DATABASE_URLS]
+    for url, engine in zip(REPLICA_DATABASE_URLS, engines):
+        Base.metadata.create_all(bind=engine)
+        with sessionmaker(bind=engine)() as db:
+            UserRepository(db).create_user(url.rsplit("/", 1)[1], "hashed_password")
+    yield REPLICA_DATABASE_URLS
+    for url, engine in zip(REPLICA_DATABASE_URLS, engines):
+        engine.dispose()
+        os.remove(url.rsplit("/", 1)[1])
+
+
+@pytest.fixture
+async def routed_session_factory(test_db, replica_urls):
+    """
+    Async session factory routing reads over the replica stand-ins.
+    
+    Yields:
+        Session factory and its router.
+    """
+    primary = create_test_async_engine()
+    replicas = [create_async_database_engine(url, poolclass=NullPool) for url in replica_urls]
+    router = ReplicaRouter(replicas)
+    yield async_sessionmaker(
+        bind=primary,
+        autoflush=False,
+        expire_on_commit=False,
+        sync_session_class=RoutingSession,
+        router=router
+    ), router
+    for engine in [primary, *replicas]:
+        await engine.dispose()
+
+
+async def test_reads_are_spread_round_robin(routed_session_factory):
+    """
+    Test that consecutive sessions read from alternating replicas.
+    """
+    session_factory, router = routed_session_factory
+    found = []
+    for _ in range(4):
+        async with session_factory() as db:
+            repository = AsyncUserRepository(db)
+            found.append([
+                await repository.user_exists("test_replica_1.db"),
+                await repository.user_exists("test_replica_2.db")
+            ])
+    
+    assert found == [[True, False], [False, True], [True, False], [False, True]]
+    assert router.stats()["replica_reads"] == 4
+
+
+async def test_reads_follow_writes_to_the_primary(routed_session_factory):
+    """
+    Test that a session reads its own writes once it has written.
+    """
+    session_factory, _ = routed_session_factory
+    async with session_factory() as db:
+        repository = AsyncUserRepository(db)
+        assert await repository.user_exists("test_replica_1.db") is True
+        
+        await repository.create_user_if_absent("primary_user", "hashed_password")
+        
+        assert await repository.user_exists("primary_user") is True
+        assert await repository.user_exists("test_replica_1.db") is False
+
+
+async def test_unhealthy_replicas_are_skipped(routed_session_factory):
+    """
+    Test that a failed health check takes a replica out of rotation.
+    """
+    session_factory, router = routed_session_factory
+    unreachable = create_async_database_engine(UNREACHABLE_DATABASE_URL, poolclass=NullPool)
+    router.replicas = [unreachable, router.replicas[1]]
+    
+    assert await router.check_health() == 1
+    for _ in range(2):
+        async with session_factory() as db:
+            assert await AsyncUserRepository(db).user_exists("test_replica_2.db") is True
+    
+    router.replicas = [unreachable]
+    assert await router.check_health() == 0
+    async with session_factory() as db:
+        assert await AsyncUserRepository(db).user_exists("test_replica_2.db") is False
+    assert router.stats()["primary_fallbacks"] == 1
+    await unreachable.dispose()
+
+
+async def test_sessions_without_replicas_use_the_primary():
+    """
+    Test that a router without replicas leaves sessions on the primary.
+    """
+    session = RoutingSession(router=ReplicaRouter([]))
+    
+    assert session.pinned_to_primary is True
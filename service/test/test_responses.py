@@ -0,0 +1,39 @@
+"""
+Unit tests for the JSON response path.
+"""
+import json
+import pytest
+from datetime import datetime
+from fastapi.responses import JSONResponse, ORJSONResponse
+import app.responses
+from app.responses import get_response_class, json_response
+from app.schemas import SessionResponse
+
+
+def test_get_response_class():
+    """
+    Test serializer selection.
+    """
+    assert get_response_class("orjson") is ORJSONResponse
+    assert get_response_class("json") is JSONResponse
+
+
+@pytest.mark.parametrize("response_class", [JSONResponse, ORJSONResponse])
+def test_json_response_matches_response_model(monkeypatch, response_class):
+    """
+    Test that both serializers render what response_model validation would.
+    """
+    monkeypatch.setattr(app.responses, "ResponseClass", response_class)
+    session_info = {
+        "token": "test_token",
+        "user_id": "test_user",
+        "start_time": datetime(2026, 1, 1, 12, 0, 0, 123456),
+        "max_time": datetime(2026, 1, 1, 13, 0, 0)
+    }
+    
+    response = json_response(session_info, status_code=201)
+    
+    assert isinstance(response, response_class)
+    assert response.status_code == 201
+    assert json.loads(response.body) == json.loads(SessionResponse(**session_info).model_dump_json())
+    assert json.loads(json_response({"sessions": [session_info]}).body)["sessions"][0]["max_time"] == "2026-01-01T13:00:00"
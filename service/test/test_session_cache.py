@@ -0,0 +1,79 @@
+"""
+Unit tests for the session token cache.
+"""
+import pytest
+from datetime import datetime, timedelta
+from app.services.session_cache import SessionCache
+from app.session_tokens import hash_token
+from test.conftest import make_session_info
+
+
+def test_get_hit_and_miss():
+    """
+    Test hit and miss counters.
+    """
+    cache = SessionCache(max_entries=10)
+    now = datetime.utcnow()
+    cache.set(make_session_info("token", now + timedelta(hours=1)))
+    
+    assert cache.get("token", now)["user_id"] == "test_user"
+    assert cache.get("unknown", now) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_entry_expires_at_max_time():
+    """
+    Test that entries are dropped once their max_time has passed.
+    """
+    cache = SessionCache(max_entries=10)
+    now = datetime.utcnow()
+    cache.set(make_session_info("token", now + timedelta(seconds=1)))
+    
+    assert cache.get("token", now + timedelta(seconds=2)) is None
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["size"] == 0
+
+
+def test_least_recently_used_is_evicted():
+    """
+    Test LRU eviction when the cache is full.
+    """
+    cache = SessionCache(max_entries=2)
+    now = datetime.utcnow()
+    max_time = now + timedelta(hours=1)
+    cache.set(make_session_info("first", max_time))
+    cache.set(make_session_info("second", max_time))
+    cache.get("first", now)
+    cache.set(make_session_info("third", max_time))
+    
+    assert cache.get("second", now) is None
+    assert cache.get("first", now) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate():
+    """
+    Test explicit invalidation.
+    """
+    cache = SessionCache(max_entries=10)
+    now = datetime.utcnow()
+    cache.set(make_session_info("token", now + timedelta(hours=1)))
+    cache.invalidate("token")
+    
+    assert cache.get("token", now) is None
+
+
+def test_get_token_by_digest():
+    """
+    Test that a cached token is found by its digest until it leaves the cache.
+    """
+    cache = SessionCache(max_entries=1)
+    max_time = datetime.utcnow() + timedelta(hours=1)
+    cache.set(make_session_info("first", max_time))
+    
+    assert cache.get_token(hash_token("first")) == "first"
+    cache.set(make_session_info("second", max_time))
+    assert cache.get_token(hash_token("first")) is None
+    cache.invalidate("second")
+    assert cache.get_token(hash_token("second")) is None
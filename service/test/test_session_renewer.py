@@ -0,0 +1,89 @@
+"""
+Unit tests for sliding session renewal.
+"""
+import pytest
+from datetime import datetime, timedelta
+from app.repositories.async_session_repository import AsyncSessionRepository
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.services.async_session_service import AsyncSessionService
+from app.services.session_cache import SessionCache
+from app.services.session_renewer import SessionRenewer
+from test.conftest import make_session_info
+from test.test_auth_routes import recorded_statements
+
+
+@pytest.fixture
+def renewer(async_session_factory):
+    """
+    Enabled renewer with hour-long sessions renewed at most every five minutes.
+    """
+    return SessionRenewer(
+        session_factory=async_session_factory,
+        enabled=True,
+        max_age_seconds=3600,
+        absolute_max_age_seconds=7200,
+        renewal_interval_seconds=300,
+        storage="table"
+    )
+
+
+def test_renew_only_when_due(renewer):
+    """
+    Test that a renewal is queued once the extension reaches the interval.
+    """
+    now = datetime.utcnow()
+    
+    assert renewer.renew(make_session_info("token", now + timedelta(minutes=58), start_time=now), now) is None
+    renewed = renewer.renew(make_session_info("token", now + timedelta(minutes=50), start_time=now), now)
+    
+    assert renewed["max_time"] == now + timedelta(hours=1)
+    assert renewer.pending == 1
+
+
+def test_renew_is_capped_by_absolute_max_age(renewer):
+    """
+    Test that renewals never extend a session past its absolute lifetime.
+    """
+    now = datetime.utcnow()
+    start_time = now - timedelta(minutes=90)
+    
+    renewed = renewer.renew(make_session_info("token", now + timedelta(minutes=10), start_time=start_time), now)
+    
+    assert renewed["max_time"] == start_time + timedelta(hours=2)
+    assert renewer.renew(renewed, now + timedelta(minutes=5)) is None
+
+
+def test_disabled_renewer_never_renews(renewer):
+    """
+    Test that sessions keep their max_time when sliding expiry is off.
+    """
+    renewer.enabled = False
+    now = datetime.utcnow()
+    
+    assert renewer.renew(make_session_info("token", now + timedelta(minutes=1), start_time=now), now) is None
+    assert renewer.pending == 0
+
+
+async def test_validations_coalesce_into_one_batched_write(renewer, async_test_db):
+    """
+    Test that many validations of many sessions cost a single UPDATE.
+    """
+    user = await AsyncUserRepository(async_test_db).create_user("test_user", "hashed_password")
+    repository = AsyncSessionRepository(async_test_db)
+    start_time = datetime.utcnow() - timedelta(minutes=30)
+    for index in range(3):
+        await repository.insert_session(user.id, f"token_{index}", start_time, start_time + timedelta(hours=1))
+    session_service = AsyncSessionService(async_test_db, cache=SessionCache(max_entries=10), renewer=renewer)
+    
+    for _ in range(20):
+        for index in range(3):
+            session_info = await session_service.get_session_info(f"token_{index}")
+    with recorded_statements() as statements:
+        assert await renewer.flush_once() == 3
+    
+    assert renewer.queued == 3
+    assert [statement.split()[0] for statement in statements] == ["UPDATE"]
+    assert session_info["max_time"] > start_time + timedelta(hours=1)
+    stored = await AsyncSessionRepository(async_test_db).get_session_info_by_token("token_2", datetime.utcnow())
+    assert stored.max_time == session_info["max_time"]
+    assert await renewer.flush_once() == 0
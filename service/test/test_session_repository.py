@@ -3,9 +3,14 @@ Unit tests for session repository.
 """
 import pytest
 from datetime import datetime, timedelta
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
 from app.repositories.session_repository import SessionRepository
 from app.repositories.user_repository import UserRepository
 from app.models import Session
+from app.repositories.rows import SessionInfoRow, SessionTokenRow
+from app.session_tokens import hash_token
+from test.conftest import profiled_calls
 
 
 def test_create_session(test_db):
@@ -29,7 +34,7 @@ def test_create_session(test_db):
     
     assert session.id is not None
     assert session.user_id == user.id
-    assert session.token == "test_token"
+    assert session.token_digest == hash_token("test_token")
 
 
 def test_get_valid_session_by_user_id(test_db):
@@ -55,7 +60,7 @@ def test_get_valid_session_by_user_id(test_db):
     current_time = datetime.utcnow()
     session = session_repo.get_valid_session_by_user_id(user.id, current_time)
     assert session is not None
-    assert session.token == "test_token"
+    assert session.token_digest == hash_token("test_token")
 
 
 def test_get_valid_session_expired(test_db):
@@ -132,3 +137,105 @@ def test_is_session_valid(test_db):
     assert session_repo.is_session_valid("test_token", current_time) is True
     assert session_repo.is_session_valid("invalid_token", current_time) is False
 
+
+
+def test_delete_expired_sessions(test_db):
+    """
+    Test that expired sessions are deleted at most one batch at a time.
+    """
+    # Create a user first
+    user_repo = UserRepository(test_db)
+    user = user_repo.create_user("test_user", "hashed_password")
+    
+    # Create three expired sessions
+    session_repo = SessionRepository(test_db)
+    start_time = datetime.utcnow() - timedelta(hours=2)
+    for index in range(3):
+        session_repo.create_session(
+            user_id=user.id,
+            token=f"test_token_{index}",
+            start_time=start_time,
+            max_time=start_time + timedelta(hours=1)
+        )
+    
+    current_time = datetime.utcnow()
+    assert session_repo.delete_expired_sessions(current_time, batch_size=2) == 2
+    assert session_repo.delete_expired_sessions(current_time, batch_size=2) == 1
+    assert session_repo.delete_expired_sessions(current_time, batch_size=2) == 0
+
+
+def test_get_sessions_info_by_tokens(test_db):
+    """
+    Test that valid sessions are resolved in bulk and keyed by token.
+    """
+    user = UserRepository(test_db).create_user("test_user", "hashed_password")
+    session_repo = SessionRepository(test_db)
+    now = datetime.utcnow()
+    session_repo.create_session(user.id, "valid_token", now, now + timedelta(hours=1))
+    session_repo.create_session(user.id, "expired_token", now - timedelta(hours=2), now - timedelta(hours=1))
+    
+    sessions = session_repo.get_sessions_info_by_tokens(
+        ["valid_token", "expired_token", "unknown_token"],
+        now
+    )
+    
+    assert list(sessions) == ["valid_token"]
+    assert sessions["valid_token"].user_id == "test_user"
+    assert sessions["valid_token"].max_time == now + timedelta(hours=1)
+
+
+def test_projection_lookups_load_no_entities(test_db):
+    """
+    Test that lookups return slotted rows and leave the identity map empty.
+    """
+    user = UserRepository(test_db).create_user("test_user", "hashed_password")
+    session_repo = SessionRepository(test_db)
+    now = datetime.utcnow()
+    user_pk = user.id
+    session_repo.create_session(user_pk, "test_token", now, now + timedelta(hours=1))
+    test_db.expunge_all()
+    
+    latest = session_repo.get_valid_session_by_user_id(user_pk, now)
+    info = session_repo.get_session_info_by_token("test_token", now)
+    
+    assert isinstance(latest, SessionTokenRow)
+    assert latest.token_digest == hash_token("test_token")
+    assert isinstance(info, SessionInfoRow)
+    assert info.user_id == "test_user"
+    assert not hasattr(info, "__dict__")
+    assert len(test_db.identity_map) == 0
+    assert session_repo.get_session_info_by_token("test_token", now + timedelta(hours=1)) is None
+
+
+def test_delete_session_by_token(test_db):
+    """
+    Test deletion by token without loading the session.
+    """
+    user = UserRepository(test_db).create_user("test_user", "hashed_password")
+    session_repo = SessionRepository(test_db)
+    now = datetime.utcnow()
+    session_repo.create_session(user.id, "test_token", now, now + timedelta(hours=1))
+    
+    assert session_repo.delete_session_by_token("test_token") is True
+    assert session_repo.delete_session_by_token("test_token") is False
+    assert session_repo.is_session_valid("test_token", now) is False
+
+
+def test_get_session_by_token_uses_prebuilt_statement(test_db):
+    """
+    Test that the prebuilt lookup makes fewer Python calls than building it per call.
+    """
+    user = UserRepository(test_db).create_user("test_user", "hashed_password")
+    session_repo = SessionRepository(test_db)
+    now = datetime.utcnow()
+    session_repo.create_session(user.id, "test_token", now, now + timedelta(hours=1))
+    
+    def built_per_call():
+        stmt = select(Session).options(
+            joinedload(Session.user)
+        ).where(Session.token_digest == hash_token("test_token"))
+        return test_db.scalars(stmt).first()
+    
+    prebuilt = profiled_calls(lambda: session_repo.get_session_by_token("test_token"))
+    assert session_repo.get_session_by_token("test_token").user.user_id == "test_user"
+    assert prebuilt < 0.8 * profiled_calls(built_per_call)
@@ -4,6 +4,7 @@ Unit tests for session service.
 import pytest
 from datetime import datetime, timedelta
 from app.services.session_service import SessionService
+from app.services.session_cache import SessionCache
 from app.repositories.user_repository import UserRepository
 
 
@@ -70,3 +71,40 @@ def test_get_session_info_invalid_token(test_db):
     session_info = session_service.get_session_info("invalid_token")
     assert session_info is None
 
+
+
+def test_get_session_info_uses_cache(test_db):
+    """
+    Test that repeated lookups are served from the cache.
+    """
+    user_repo = UserRepository(test_db)
+    user = user_repo.create_user("test_user", "hashed_password")
+    
+    cache = SessionCache(max_entries=10)
+    session_service = SessionService(test_db, cache=cache)
+    token = session_service.create_session(user.id)
+    cache.invalidate(token)
+    
+    session_service.get_session_info(token)
+    session_info = session_service.get_session_info(token)
+    
+    assert session_info["token"] == token
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_delete_session_invalidates_cache(test_db):
+    """
+    Test that deleting a session removes it from the cache.
+    """
+    user_repo = UserRepository(test_db)
+    user = user_repo.create_user("test_user", "hashed_password")
+    
+    cache = SessionCache(max_entries=10)
+    session_service = SessionService(test_db, cache=cache)
+    token = session_service.create_session(user.id)
+    session_service.get_session_info(token)
+    
+    assert session_service.delete_session(token) is True
+    assert session_service.get_session_info(token) is None
+    assert session_service.delete_session(token) is False
@@ -0,0 +1,227 @@
+"""
+Unit tests for the session stores, run against every backend.
+"""
+import pytest
+from datetime import datetime, timedelta
+from fakeredis import aioredis
+from app.repositories.async_session_repository import AsyncSessionRepository
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.repositories.session_stores import MemorySessionStore, RedisSessionStore, SqlSessionStore
+from app.services.async_session_service import AsyncSessionService
+from app.services.session_cache import SessionCache
+from app.session_tokens import hash_token
+
+
+@pytest.fixture
+async def fake_redis():
+    """
+    In-process fake Redis client for one test.
+    
+    Yields:
+        redis.asyncio compatible client.
+    """
+    client = aioredis.FakeRedis()
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture(params=["table", "memory", "redis"])
+async def store(request, async_test_db, fake_redis):
+    """
+    Session store of each backend.
+    
+    Yields:
+        Empty store.
+    """
+    if request.param == "table":
+        yield SqlSessionStore(AsyncSessionRepository(async_test_db))
+    elif request.param == "memory":
+        yield MemorySessionStore(stripes=4)
+    else:
+        yield RedisSessionStore(fake_redis)
+
+
+@pytest.fixture
+async def user(async_test_db):
+    """
+    User the sessions belong to.
+    """
+    return await AsyncUserRepository(async_test_db).create_user("test_user", "hashed_password")
+
+
+async def test_add_and_get(store, user):
+    """
+    Test that a stored session is found by token until it expires.
+    """
+    start_time = datetime.utcnow()
+    max_time = start_time + timedelta(hours=1)
+    await store.add("test_token", user.id, "test_user", start_time, max_time)
+    
+    session = await store.get("test_token", start_time)
+    
+    assert session.user_id == "test_user"
+    assert session.start_time == start_time
+    assert session.max_time == max_time
+    assert await store.get("test_token", max_time) is None
+    assert await store.get("unknown_token", start_time) is None
+
+
+async def test_get_latest_for_user(store, user):
+    """
+    Test that a user's newest session is returned with its digest.
+    """
+    start_time = datetime.utcnow()
+    await store.add("old_token", user.id, "test_user", start_time, start_time + timedelta(hours=1))
+    later = start_time + timedelta(minutes=1)
+    await store.add("new_token", user.id, "test_user", later, later + timedelta(hours=1))
+    
+    session = await store.get_latest_for_user(user.id, later)
+    
+    assert session.token_digest == hash_token("new_token")
+    assert await store.get_latest_for_user(user.id + 1, later) is None
+
+
+async def test_delete(store, user):
+    """
+    Test that a deleted session is gone and a second delete reports it.
+    """
+    start_time = datetime.utcnow()
+    await store.add("test_token", user.id, "test_user", start_time, start_time + timedelta(hours=1))
+    
+    assert await store.delete("test_token") is True
+    assert await store.delete("test_token") is False
+    assert await store.get("test_token", start_time) is None
+    assert await store.get_latest_for_user(user.id, start_time) is None
+
+
+async def test_get_many(store, user):
+    """
+    Test that a batch lookup returns only the unexpired sessions, by token.
+    """
+    start_time = datetime.utcnow()
+    await store.add("first_token", user.id, "test_user", start_time, start_time + timedelta(hours=1))
+    await store.add("second_token", user.id, "test_user", start_time, start_time + timedelta(hours=2))
+    await store.add("expired_token", user.id, "test_user", start_time, start_time + timedelta(minutes=1))
+    
+    sessions = await store.get_many(
+        ["first_token", "unknown_token", "second_token", "expired_token"],
+        start_time + timedelta(minutes=1)
+    )
+    
+    assert sorted(sessions) == ["first_token", "second_token"]
+    assert sessions["second_token"].user_id == "test_user"
+    assert sessions["second_token"].max_time == start_time + timedelta(hours=2)
+
+
+async def test_extend_sessions(store, user):
+    """
+    Test that sessions are extended in one batch, never shortened, and not recreated.
+    """
+    start_time = datetime.utcnow()
+    await store.add("short_token", user.id, "test_user", start_time, start_time + timedelta(minutes=10))
+    await store.add("long_token", user.id, "test_user", start_time, start_time + timedelta(hours=2))
+    
+    extended = await store.extend_sessions(
+        {
+            hash_token("short_token"): start_time + timedelta(hours=1),
+            hash_token("long_token"): start_time + timedelta(hours=1),
+            hash_token("unknown_token"): start_time + timedelta(hours=1)
+        },
+        start_time
+    )
+    
+    assert extended == 1
+    assert (await store.get("short_token", start_time)).max_time == start_time + timedelta(hours=1)
+    assert (await store.get("long_token", start_time)).max_time == start_time + timedelta(hours=2)
+    assert await store.get("unknown_token", start_time) is None
+
+
+async def test_memory_store_purges_expired_sessions(user):
+    """
+    Test that purge_expired removes expired sessions and their user entries.
+    """
+    store = MemorySessionStore(stripes=4)
+    start_time = datetime.utcnow()
+    for index in range(3):
+        await store.add(f"expired_{index}", index, "test_user", start_time, start_time + timedelta(minutes=1))
+    await store.add("valid_token", 9, "test_user", start_time, start_time + timedelta(hours=1))
+    
+    assert await store.purge_expired(start_time + timedelta(minutes=1)) == 3
+    assert await store.get_latest_for_user(0, start_time) is None
+    assert await store.get("valid_token", start_time) is not None
+
+
+async def test_redis_store_sets_expiry(fake_redis, user):
+    """
+    Test that both keys of a Redis session expire at its max_time.
+    """
+    store = RedisSessionStore(fake_redis)
+    max_time = datetime(2030, 1, 1)
+    await store.add("test_token", user.id, "test_user", max_time - timedelta(hours=1), max_time)
+    
+    keys = [f"session:{hash_token('test_token').hex()}", f"user_session:{user.id}"]
+    expiries = {await fake_redis.pexpiretime(key) for key in keys}
+    assert expiries == {int((max_time - datetime(1970, 1, 1)).total_seconds() * 1000)}
+
+
+async def test_redis_extend_leaves_newer_user_session(fake_redis, user):
+    """
+    Test that extending an older session keeps the expiry of the user's newer session pointer.
+    """
+    store = RedisSessionStore(fake_redis)
+    start_time = datetime.utcnow()
+    await store.add("old_token", user.id, "test_user", start_time, start_time + timedelta(minutes=10))
+    await store.add("new_token", user.id, "test_user", start_time, start_time + timedelta(minutes=30))
+    pointer_expiry = await fake_redis.pexpiretime(f"user_session:{user.id}")
+    
+    assert await store.extend_sessions({hash_token("old_token"): start_time + timedelta(hours=1)}, start_time) == 1
+    assert await fake_redis.pexpiretime(f"user_session:{user.id}") == pointer_expiry
+    
+    assert await store.extend_sessions({hash_token("new_token"): start_time + timedelta(hours=2)}, start_time) == 1
+    assert await fake_redis.pexpiretime(f"user_session:{user.id}") == store._expires_at_ms(
+        start_time + timedelta(hours=2)
+    )
+
+
+async def test_redis_store_creates_client_on_first_use():
+    """
+    Test that the store builds its redis.asyncio client lazily from its URL.
+    """
+    store = RedisSessionStore(url="redis://localhost:6379/2", pool_size=3)
+    
+    assert store._client is None
+    pool = store.client.connection_pool
+    assert pool.max_connections == 3
+    assert pool.connection_kwargs["db"] == 2
+    await store.close()
+    assert store._client is None
+
+
+async def test_session_service_with_memory_store(async_test_db, user):
+    """
+    Test the signin lookup, session reuse and sign-out through the service.
+    """
+    session_service = AsyncSessionService(
+        async_test_db,
+        cache=SessionCache(max_entries=10),
+        storage="memory"
+    )
+    session_service.store = MemorySessionStore(stripes=4)
+    user_repository = AsyncUserRepository(async_test_db)
+    
+    found_user, existing_session = await session_service.get_user_with_valid_session(
+        user_repository, "test_user", datetime.utcnow()
+    )
+    created = await session_service.create_session_info(found_user, existing_session)
+    found_user, existing_session = await session_service.get_user_with_valid_session(
+        user_repository, "test_user", datetime.utcnow()
+    )
+    reused = await session_service.create_session_info(found_user, existing_session)
+    
+    assert reused == created
+    assert await session_service.get_session_info(created["token"]) == created
+    assert await session_service.delete_session(created["token"]) is True
+    assert await session_service.get_session_info(created["token"]) is None
+    assert await session_service.get_user_with_valid_session(
+        user_repository, "missing_user", datetime.utcnow()
+    ) == (None, None)
@@ -0,0 +1,51 @@
+"""
+Unit tests for the expired session sweeper.
+"""
+import pytest
+from datetime import datetime, timedelta
+from app.repositories.session_repository import SessionRepository
+from app.repositories.user_repository import UserRepository
+from app.services.session_sweeper import SessionSweeper
+
+
+def create_sessions(test_db, count: int, expired: bool) -> None:
+    """
+    Create sessions for a new user, either expired or still valid.
+    """
+    user = UserRepository(test_db).create_user(f"user_{expired}", "hashed_password")
+    session_repo = SessionRepository(test_db)
+    start_time = datetime.utcnow() - timedelta(hours=2 if expired else 0)
+    for index in range(count):
+        session_repo.create_session(
+            user_id=user.id,
+            token=f"token_{expired}_{index}",
+            start_time=start_time,
+            max_time=start_time + timedelta(hours=1)
+        )
+
+
+async def test_sweep_once_purges_expired_sessions_in_batches(test_db, async_session_factory):
+    """
+    Test that every expired session is purged across several batches.
+    """
+    create_sessions(test_db, 5, expired=True)
+    create_sessions(test_db, 2, expired=False)
+    
+    sweeper = SessionSweeper(session_factory=async_session_factory, batch_size=2)
+    purged = await sweeper.sweep_once()
+    
+    assert purged == 5
+    assert sweeper.total_purged == 5
+    assert SessionRepository(test_db).get_session_by_token("token_True_0") is None
+    assert SessionRepository(test_db).get_session_by_token("token_False_0") is not None
+
+
+async def test_start_and_stop(async_session_factory):
+    """
+    Test that the background task can be started and stopped.
+    """
+    sweeper = SessionSweeper(session_factory=async_session_factory, interval_seconds=3600)
+    sweeper.start()
+    await sweeper.stop()
+    
+    assert sweeper.total_purged == 0
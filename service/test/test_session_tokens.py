@@ -0,0 +1,15 @@
+"""
+Unit tests for session token generation and digests.
+"""
+from app.session_tokens import hash_token, new_session_token
+
+
+def test_new_session_token():
+    """
+    Test that tokens are URL-safe, fixed-size and random.
+    """
+    token = new_session_token()
+    
+    assert len(token) == 43
+    assert len(hash_token(token)) == 32
+    assert new_session_token() != token
@@ -0,0 +1,111 @@
+"""
+Unit tests for the shared-memory session token cache.
+"""
+import multiprocessing
+import pytest
+from datetime import datetime, timedelta
+from app.services.shared_session_cache import WAYS, SharedSessionCache
+from test.conftest import make_session_info
+
+
+def cache_in_child(path: str, token: str, max_time: datetime) -> None:
+    """
+    Attach to the cache from another process and cache one session.
+    """
+    cache = SharedSessionCache(path, max_entries=64, stripes=4)
+    cache.set(make_session_info(token, max_time, user_id="child_user"))
+    cache.close()
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    """
+    Base path of a cache file private to one test.
+    """
+    return str(tmp_path / "session_cache")
+
+
+def test_set_get_and_invalidate(cache_path):
+    """
+    Test a round trip through the slots, then invalidation.
+    """
+    cache = SharedSessionCache(cache_path, max_entries=64, stripes=4)
+    now = datetime.utcnow().replace(microsecond=123456)
+    session_info = make_session_info("token", now + timedelta(hours=1))
+    cache.set(session_info)
+    
+    assert cache.get("token", now) == session_info
+    assert cache.get("unknown", now) is None
+    cache.invalidate("token")
+    assert cache.get("token", now) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+    cache.close()
+
+
+def test_entry_expires_at_max_time(cache_path):
+    """
+    Test that an entry is no longer returned once its max_time has passed.
+    """
+    cache = SharedSessionCache(cache_path, max_entries=64, stripes=4)
+    now = datetime.utcnow()
+    cache.set(make_session_info("token", now + timedelta(seconds=1)))
+    
+    assert cache.get("token", now + timedelta(seconds=2)) is None
+    assert cache.stats()["expirations"] == 1
+    cache.close()
+
+
+def test_full_bucket_evicts_first_to_expire(cache_path):
+    """
+    Test that a full bucket gives up the entry that expires first.
+    """
+    cache = SharedSessionCache(cache_path, max_entries=WAYS, stripes=1)
+    now = datetime.utcnow()
+    for index in range(WAYS):
+        cache.set(make_session_info(f"token_{index}", now + timedelta(hours=1, minutes=index)))
+    cache.set(make_session_info("newest", now + timedelta(hours=2)))
+    
+    assert cache.get("token_0", now) is None
+    assert cache.get("token_1", now) is not None
+    assert cache.get("newest", now) is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size"] == WAYS
+    cache.close()
+
+
+def test_long_user_id_is_not_cached(cache_path):
+    """
+    Test that sessions whose user_id does not fit a slot are skipped.
+    """
+    cache = SharedSessionCache(cache_path, max_entries=64, stripes=4)
+    now = datetime.utcnow()
+    cache.set(make_session_info("token", now + timedelta(hours=1), user_id="u" * 65))
+    
+    assert cache.get("token", now) is None
+    cache.close()
+
+
+def test_workers_share_entries(cache_path):
+    """
+    Test that a session cached by another process is a hit here, and that
+    an invalidation here is seen by a fresh attachment.
+    """
+    max_time = datetime.utcnow() + timedelta(hours=1)
+    cache = SharedSessionCache(cache_path, max_entries=64, stripes=4)
+    cache.set(make_session_info("parent_token", max_time))
+    
+    child = multiprocessing.get_context("spawn").Process(
+        target=cache_in_child, args=(cache_path, "child_token", max_time)
+    )
+    child.start()
+    child.join(timeout=30)
+    
+    assert child.exitcode == 0
+    assert cache.get("child_token", datetime.utcnow())["user_id"] == "child_user"
+    cache.invalidate("child_token")
+    other = SharedSessionCache(cache_path, max_entries=64, stripes=4)
+    assert other.get("child_token", datetime.utcnow()) is None
+    assert other.get("parent_token", datetime.utcnow())["user_id"] == "test_user"
+    other.close()
+    cache.close()
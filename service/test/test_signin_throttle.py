@@ -0,0 +1,96 @@
+"""
+Unit tests for sign-in admission control.
+"""
+import pytest
+from app.services.signin_throttle import (
+    RateLimitExceededError,
+    SigninThrottle,
+    SlidingWindowCounter,
+    TokenBucketLimiter
+)
+
+
+def test_token_bucket_refills():
+    """
+    Test that a bucket allows its burst, then refills at its rate.
+    """
+    limiter = TokenBucketLimiter(rate_per_second=1.0, burst=2)
+    
+    assert limiter.acquire("client", now=0.0) == 0.0
+    assert limiter.acquire("client", now=0.0) == 0.0
+    assert limiter.acquire("client", now=0.0) == pytest.approx(1.0)
+    assert limiter.acquire("client", now=1.0) == 0.0
+    assert limiter.acquire("other", now=1.0) == 0.0
+    assert limiter.throttled == 1
+
+
+def test_token_bucket_evicts_least_recently_used():
+    """
+    Test that the number of buckets stays bounded.
+    """
+    limiter = TokenBucketLimiter(rate_per_second=1.0, burst=1, max_keys=2)
+    
+    for key in ("first", "second", "third"):
+        limiter.acquire(key, now=0.0)
+    
+    assert limiter.acquire("first", now=0.0) == 0.0
+    assert limiter.acquire("third", now=0.0) > 0
+
+
+def test_sliding_window_counter():
+    """
+    Test that failures expire as they leave the window.
+    """
+    counter = SlidingWindowCounter(max_events=2, window_seconds=10.0)
+    counter.record("user", now=0.0)
+    counter.record("user", now=5.0)
+    
+    assert counter.retry_after("user", now=6.0) == pytest.approx(4.0)
+    assert counter.retry_after("user", now=10.0) == 0.0
+    
+    counter.reset("user")
+    assert counter.retry_after("user", now=6.0) == 0.0
+
+
+def test_signin_throttle_locks_out_after_failures():
+    """
+    Test that repeated failures reject a user_id from any address.
+    """
+    throttle = SigninThrottle(user_rate_per_second=0, max_failures_per_user=2, failure_window_seconds=60)
+    throttle.record_failure("10.0.0.1", "victim", now=0.0)
+    throttle.record_failure("10.0.0.2", "victim", now=1.0)
+    
+    with pytest.raises(RateLimitExceededError) as exc_info:
+        throttle.check("10.0.0.3", "victim", now=2.0)
+    
+    assert exc_info.value.reason == "user_failures"
+    assert exc_info.value.retry_after == pytest.approx(58.0)
+    throttle.check("10.0.0.3", "other_user", now=2.0)
+    assert throttle.stats()["user_failures"] == 1
+
+
+def test_signin_throttle_disabled():
+    """
+    Test that a disabled throttle admits every attempt.
+    """
+    throttle = SigninThrottle(enabled=False, ip_burst=1)
+    
+    for _ in range(3):
+        throttle.check("10.0.0.1", "user", now=0.0)
+
+
+def test_client_address_behind_trusted_proxies():
+    """
+    Test that X-Forwarded-For is used only from trusted proxies, right to left.
+    """
+    throttle = SigninThrottle(trusted_proxies="10.0.0.0/8, 192.0.2.1")
+    
+    assert throttle.client_address("198.51.100.7", "203.0.113.5") == "198.51.100.7"
+    assert throttle.client_address("10.0.0.1", None) == "10.0.0.1"
+    assert throttle.client_address("10.0.0.1", "203.0.113.5") == "203.0.113.5"
+    assert throttle.client_address("10.0.0.1", "1.2.3.4, 203.0.113.5, 192.0.2.1") == "203.0.113.5"
+    assert throttle.client_address("10.0.0.1", "10.0.0.9") == "10.0.0.9"
+    assert throttle.client_address("testclient", "203.0.113.5") == "testclient"
+    assert throttle.client_address(None, "203.0.113.5") == "unknown"
+    with pytest.raises(ValueError):
+        SigninThrottle(trusted_proxies="not-a-network")
@@ -0,0 +1,102 @@
+"""
+Unit tests for the stateless session service.
+"""
+import time
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+from app.config import settings
+from app.services.stateless_session_service import StatelessSessionService
+
+
+def test_create_and_get_session_info():
+    """
+    Test that a signed token resolves to its session info.
+    """
+    service = StatelessSessionService(secret_key="test_secret")
+    token = service.create_session("test_user")
+    
+    session_info = service.get_session_info(token)
+    assert session_info is not None
+    assert session_info["token"] == token
+    assert session_info["user_id"] == "test_user"
+    assert session_info["max_time"] > session_info["start_time"]
+
+
+def test_get_session_info_rejects_tampered_token():
+    """
+    Test that tokens signed with another key or altered are rejected.
+    """
+    service = StatelessSessionService(secret_key="test_secret")
+    other_service = StatelessSessionService(secret_key="other_secret")
+    token = other_service.create_session("test_user")
+    
+    assert service.get_session_info(token) is None
+    assert service.get_session_info("invalid_token") is None
+
+
+def test_get_session_info_rejects_expired_token(monkeypatch):
+    """
+    Test that expired tokens are rejected.
+    """
+    monkeypatch.setattr(settings, "session_max_age_seconds", -10)
+    service = StatelessSessionService(secret_key="test_secret")
+    token = service.create_session("test_user")
+    
+    assert service.get_session_info(token) is None
+
+
+def test_delete_session_revokes_token():
+    """
+    Test that a revoked token no longer validates.
+    """
+    service = StatelessSessionService(secret_key="test_secret")
+    token = service.create_session("test_user")
+    
+    assert service.delete_session(token) is True
+    assert service.get_session_info(token) is None
+    assert service.revoked_count == 1
+    assert service.delete_session("invalid_token") is False
+
+
+def test_tokens_validate_on_a_non_utc_host(monkeypatch):
+    """
+    Test that issue and expiry times do not depend on the host time zone.
+    """
+    monkeypatch.setenv("TZ", "Asia/Tokyo")
+    time.tzset()
+    try:
+        service = StatelessSessionService(secret_key="test_secret")
+        session_info = service.create_session_info("test_user")
+        
+        assert abs((session_info["start_time"] - datetime.utcnow()).total_seconds()) < 5
+        assert service.get_session_info(session_info["token"]) is not None
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+
+def test_delete_session_prunes_by_expiry(monkeypatch):
+    """
+    Test that a revoked token expiring first is pruned even behind a later one.
+    """
+    service = StatelessSessionService(secret_key="test_secret")
+    monkeypatch.setattr(settings, "session_max_age_seconds", 3600)
+    long_lived = service.create_session("long_user")
+    later = service.create_session("later_user")
+    monkeypatch.setattr(settings, "session_max_age_seconds", 60)
+    short_lived = service.create_session("short_user")
+    
+    service.delete_session(long_lived)
+    service.delete_session(short_lived)
+    assert service.revoked_count == 2
+    
+    now = time.time()
+    monkeypatch.setattr(
+        "app.services.stateless_session_service.time",
+        SimpleNamespace(time=lambda: now + 120)
+    )
+    service.delete_session(later)
+    
+    assert service.revoked_count == 2
+    assert service.get_session_info(long_lived) is None
@@ -0,0 +1,55 @@
+"""
+Unit tests for the signup user_id Bloom filter.
+"""
+import pytest
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.services.user_id_filter import UserIdFilter
+
+
+def test_filter_not_ready_reports_possible_hit():
+    """
+    Test that lookups before load never claim a definite miss.
+    """
+    user_id_filter = UserIdFilter(capacity=100, error_rate=0.01)
+    
+    assert user_id_filter.might_contain("test_user") is True
+    assert user_id_filter.stats()["possible_hits"] == 0
+
+
+def test_filter_grows_without_false_negatives():
+    """
+    Test that added user_ids are always found as the filter grows.
+    """
+    user_id_filter = UserIdFilter(capacity=100, error_rate=0.01)
+    user_id_filter.ready = True
+    for index in range(1000):
+        user_id_filter.add(f"user_{index}")
+    
+    assert all(user_id_filter.might_contain(f"user_{index}") for index in range(1000))
+    
+    false_positives = sum(user_id_filter.might_contain(f"absent_{index}") for index in range(10000))
+    stats = user_id_filter.stats()
+    assert stats["items"] == 1000
+    assert stats["layers"] > 1
+    assert stats["memory_bytes"] > 0
+    assert stats["false_positive_rate"] < 0.01
+    assert false_positives < 200
+    assert stats["definite_misses"] == 10000 - false_positives
+
+
+async def test_filter_load(async_session_factory):
+    """
+    Test that load scans existing users and marks the filter ready.
+    """
+    async with async_session_factory() as db:
+        repository = AsyncUserRepository(db)
+        await repository.create_user("first_user", "hashed_password")
+        await repository.create_user("second_user", "hashed_password")
+    
+    user_id_filter = UserIdFilter(capacity=100, error_rate=0.001)
+    await user_id_filter.load(async_session_factory, batch_size=1)
+    
+    assert user_id_filter.ready is True
+    assert user_id_filter.might_contain("first_user") is True
+    assert user_id_filter.might_contain("second_user") is True
+    assert user_id_filter.stats()["items"] == 2
@@ -0,0 +1,69 @@
+"""
+Unit tests for the bulk user import service.
+"""
+import json
+import pytest
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.services.hashing_executor import hashing_executor
+from app.services.password_service import PasswordService
+from app.services.user_import_service import UserImportService, iter_lines
+
+
+async def as_async_iterable(items):
+    """
+    Yield items from a list asynchronously.
+    """
+    for item in items:
+        yield item
+
+
+async def import_lines(db, lines, batch_size=2):
+    """
+    Run an import and collect its results.
+    """
+    service = UserImportService(db, batch_size=batch_size)
+    try:
+        encoded = [line if isinstance(line, bytes) else line.encode("utf-8") for line in lines]
+        return [result async for result in service.import_users(as_async_iterable(encoded))]
+    finally:
+        hashing_executor.shutdown()
+
+
+async def test_iter_lines_splits_chunks():
+    """
+    Test that lines spanning chunk boundaries are reassembled.
+    """
+    chunks = [b'{"a"', b': 1}\n{"b": 2}\n', b'{"c": 3}']
+    lines = [line async for line in iter_lines(as_async_iterable(chunks))]
+    
+    assert lines == [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}']
+
+
+async def test_import_users_reports_failures_without_aborting(async_test_db):
+    """
+    Test a mixed import of hashed, pre-hashed and invalid lines.
+    """
+    await AsyncUserRepository(async_test_db).create_user("existing_user", "hashed_password")
+    existing_hash = PasswordService().hash_password("migrated_password")
+    lines = [
+        json.dumps({"user_id": "plain_user", "password": "test_password"}),
+        json.dumps({"user_id": "migrated_user", "password_hash": existing_hash}),
+        json.dumps({"user_id": "existing_user", "password": "test_password"}),
+        "not json",
+        json.dumps({"user_id": "bad_hash_user", "password_hash": "plain_text"}),
+        "",
+        json.dumps({"user_id": "plain_user", "password": "other_password"}),
+        b'{"user_id": "bad_\xff", "password": "test_password"}',
+    ]
+    
+    results = await import_lines(async_test_db, lines)
+    
+    assert results[-1] == {"created": 2, "failed": 5}
+    assert sorted(result["line"] for result in results[:-1]) == [3, 4, 5, 7, 8]
+    assert {"line": 8, "user_id": None, "error": "Line is not valid UTF-8"} in results
+    
+    repository = AsyncUserRepository(async_test_db)
+    migrated_user = await repository.get_user_by_user_id("migrated_user")
+    plain_user = await repository.get_user_by_user_id("plain_user")
+    assert migrated_user.password_hash == existing_hash
+    assert PasswordService().verify_password("test_password", plain_user.password_hash)
@@ -2,8 +2,10 @@
 Unit tests for user repository.
 """
 import pytest
+from sqlalchemy import select
 from app.repositories.user_repository import UserRepository
 from app.models import User
+from test.conftest import profiled_calls
 
 
 def test_create_user(test_db):
@@ -49,3 +51,16 @@ def test_user_exists(test_db):
     assert repository.user_exists("test_user") is True
     assert repository.user_exists("non_existent_user") is False
 
+
+def test_get_user_by_user_id_uses_prebuilt_statement(test_db):
+    """
+    Test that the prebuilt lookup makes fewer Python calls than building it per call.
+    """
+    repository = UserRepository(test_db)
+    repository.create_user("test_user", "hashed_password")
+    
+    def built_per_call():
+        return test_db.scalars(select(User).where(User.user_id == "test_user")).first()
+    
+    prebuilt = profiled_calls(lambda: repository.get_user_by_user_id("test_user"))
+    assert prebuilt < 0.8 * profiled_calls(built_per_call)